@@ -0,0 +1,408 @@
+"""
+Бенчмарки для однозв'язного списку із завдання 1.
+
+sort   - порівнює сортування вставками (insertion_sort) із висхідним
+         сортуванням злиттям (merge_sort) на випадкових даних;
+memory - порівнює кількість байтів на елемент для вузлів з __dict__,
+         вузлів з __slots__ та списку на паралельних масивах (ArrayLinkedList);
+merge  - порівнює k-шляхове злиття через купу (merge_k_sorted_lists) з
+         послідовним попарним злиттям (merge_sorted_lists);
+index  - порівнює пам'ять і пропускну здатність списку з хеш-індексом
+         (indexed=True) та без нього на змішаному навантаженні;
+adaptive - порівнює природне сортування злиттям (natural_merge_sort) з
+         висхідним (merge_sort) на впорядкованих, зворотних, майже
+         впорядкованих і випадкових даних;
+check  - перевіряє інваріанти LinkedList (tail, size, хеш-індекс) після
+         кожного кроку випадкових послідовностей операцій, звіряючи вміст
+         зі списком Python.
+
+Запуск:
+    python benchmark_task_1.py sort
+    python benchmark_task_1.py sort --sizes 1000 10000 --insertion-limit 10000
+    python benchmark_task_1.py memory --sizes 100000 1000000
+    python benchmark_task_1.py merge --sizes 100000 --shards 10 100 500
+    python benchmark_task_1.py index --sizes 1000 10000 --ops 20000
+    python benchmark_task_1.py adaptive --sizes 100000 1000000
+    python benchmark_task_1.py check --ops 20000
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from task_1 import ArrayLinkedList, LinkedList, Node
+
+
+class DictNode(Node):
+    """ Вузол зі звичайним __dict__, як у версії Node без __slots__. """
+
+
+def time_sort(values, method):
+    """
+    Вимірює час сортування зв'язного списку вказаним методом.
+
+    :param values: Значення для сортування
+    :param method: Назва методу сортування LinkedList
+    :return: Час сортування в секундах
+    """
+    llist = LinkedList.from_iterable(values)
+    start = time.perf_counter()
+    getattr(llist, method)()
+    elapsed = time.perf_counter() - start
+    # Перевіряємо, що результат дійсно відсортований
+    assert llist.to_list() == sorted(values), method
+    return elapsed
+
+
+def bench_sort(sizes, insertion_limit):
+    """
+    Порівнює insertion_sort і merge_sort на випадкових даних.
+
+    :param sizes: Розміри списків
+    :param insertion_limit: Максимальний розмір, для якого запускається insertion_sort
+    """
+    print("Сортування зв'язного списку (секунди)")
+    print(f"{'n':>10} {'insertion_sort':>16} {'merge_sort':>12}")
+    for size in sizes:
+        values = [random.randint(0, size) for _ in range(size)]
+        if size <= insertion_limit:
+            insertion = f"{time_sort(values, 'insertion_sort'):16.4f}"
+        else:
+            insertion = f"{'пропущено':>16}"  # O(n^2) - занадто довго
+        merge = time_sort(values, "merge_sort")
+        print(f"{size:>10} {insertion} {merge:12.4f}")
+
+
+def build_dict_chain(values):
+    """
+    Будує ланцюжок вузлів DictNode, що відтворює початкову реалізацію Node.
+
+    :param values: Послідовність значень
+    :return: Голова ланцюжка
+    """
+    head = None
+    for value in reversed(values):
+        node = DictNode(value)
+        node.next = head
+        head = node
+    return head
+
+
+def measure_bytes(builder, values):
+    """
+    Вимірює кількість пам'яті, виділеної під структуру, за допомогою tracemalloc.
+
+    Значення створюються до початку вимірювання, тому враховується лише
+    накладна вартість самої структури.
+
+    :param builder: Функція, що будує структуру зі значень
+    :param values: Значення для структури
+    :return: Кількість байтів на елемент
+    """
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    structure = builder(values)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return (after - before) / len(values)
+
+
+def bench_memory(sizes):
+    """
+    Порівнює пам'ять на елемент для різних реалізацій списку.
+
+    :param sizes: Розміри списків
+    """
+    print("Пам'ять зв'язного списку (байтів на елемент)")
+    print(f"{'n':>10} {'Node(__dict__)':>16} {'Node(__slots__)':>16} {'ArrayLinkedList':>16}")
+    for size in sizes:
+        values = list(range(size))
+        dict_nodes = measure_bytes(build_dict_chain, values)
+        slot_nodes = measure_bytes(LinkedList.from_iterable, values)
+        arrays = measure_bytes(ArrayLinkedList.from_iterable, values)
+        print(f"{size:>10} {dict_nodes:16.1f} {slot_nodes:16.1f} {arrays:16.1f}")
+
+
+def make_shards(size, shards):
+    """
+    Генерує відсортовані частини (шарди) з випадковими даними.
+
+    :param size: Загальна кількість елементів
+    :param shards: Кількість шардів
+    :return: Список відсортованих списків Python
+    """
+    values = [random.randint(0, size) for _ in range(size)]
+    return [sorted(values[i::shards]) for i in range(shards)]
+
+
+def pairwise_merge(lists):
+    """
+    Послідовно зливає списки по два: ((l1 + l2) + l3) + ... - O(n*k).
+
+    :param lists: Відсортовані зв'язні списки
+    :return: Об'єднаний зв'язний список
+    """
+    merged = lists[0]
+    for llist in lists[1:]:
+        merged = LinkedList.merge_sorted_lists(merged.head, llist.head)
+    return merged
+
+
+def bench_merge(sizes, shard_counts):
+    """
+    Порівнює попарне злиття з k-шляховим злиттям через купу.
+
+    :param sizes: Загальні кількості елементів
+    :param shard_counts: Кількості відсортованих списків для злиття
+    """
+    print("Злиття k відсортованих списків (секунди)")
+    print(f"{'n':>10} {'k':>6} {'попарно':>10} {'купа':>10} {'генератор':>10}")
+    for size in sizes:
+        for shards in shard_counts:
+            parts = make_shards(size, shards)
+            expected = sorted(value for part in parts for value in part)
+
+            lists = [LinkedList.from_iterable(part) for part in parts]
+            start = time.perf_counter()
+            merged = pairwise_merge(lists)
+            pairwise = time.perf_counter() - start
+            assert merged.to_list() == expected
+
+            lists = [LinkedList.from_iterable(part) for part in parts]
+            start = time.perf_counter()
+            merged = LinkedList.merge_k_sorted_lists(lists)
+            k_way = time.perf_counter() - start
+            assert merged.to_list() == expected
+
+            start = time.perf_counter()
+            lazy = sum(1 for _ in LinkedList.iter_merge_k_sorted(map(iter, parts)))
+            generator = time.perf_counter() - start
+            assert lazy == size
+
+            print(f"{size:>10} {shards:>6} {pairwise:10.4f} {k_way:10.4f} {generator:10.4f}")
+
+
+def mixed_workload(llist, size, ops, seed=0):
+    """
+    Виконує змішане навантаження: вставки в кінець, пошук і видалення за ключем.
+
+    :param llist: Зв'язний список з ключами 0..size-1
+    :param size: Початкова кількість ключів
+    :param ops: Кількість операцій
+    :param seed: Зерно генератора випадкових чисел
+    :return: Кількість операцій за секунду
+    """
+    rng = random.Random(seed)
+    next_key = size  # Наступний новий ключ для вставки
+    start = time.perf_counter()
+    for _ in range(ops):
+        choice = rng.random()
+        key = rng.randrange(next_key)
+        if choice < 0.25:
+            llist.insert_at_end(next_key)
+            next_key += 1
+        elif choice < 0.75:
+            llist.search_element(key)
+        else:
+            llist.delete_node(key)
+    return ops / (time.perf_counter() - start)
+
+
+def bench_index(sizes, ops):
+    """
+    Порівнює список з хеш-індексом і без нього за пам'яттю та швидкістю.
+
+    :param sizes: Розміри списків
+    :param ops: Кількість операцій змішаного навантаження
+    """
+    print("Хеш-індекс у LinkedList (25% вставок, 50% пошуку, 25% видалень)")
+    print(f"{'n':>10} {'байт/ел.':>10} {'байт/ел. (індекс)':>18} "
+          f"{'оп/с':>12} {'оп/с (індекс)':>14}")
+    for size in sizes:
+        values = list(range(size))
+        plain_bytes = measure_bytes(LinkedList.from_iterable, values)
+        indexed_bytes = measure_bytes(
+            lambda items: LinkedList.from_iterable(items, indexed=True), values)
+        plain_ops = mixed_workload(LinkedList.from_iterable(values), size, ops)
+        indexed_ops = mixed_workload(
+            LinkedList.from_iterable(values, indexed=True), size, ops)
+        print(f"{size:>10} {plain_bytes:10.1f} {indexed_bytes:18.1f} "
+              f"{plain_ops:12.0f} {indexed_ops:14.0f}")
+
+
+def make_inputs(size, seed=0):
+    """
+    Генерує вхідні дані різної впорядкованості.
+
+    Майже впорядковані дані імітують мітки часу: відсортована послідовність,
+    у якій 1% елементів ("запізнілих") переставлено у випадкові місця.
+
+    :param size: Кількість елементів
+    :param seed: Зерно генератора випадкових чисел
+    :return: Словник назва -> список значень
+    """
+    rng = random.Random(seed)
+    nearly = list(range(size))
+    for _ in range(max(1, size // 100)):
+        i, j = rng.randrange(size), rng.randrange(size)
+        nearly[i], nearly[j] = nearly[j], nearly[i]
+    return {
+        "впорядковані": list(range(size)),
+        "зворотні": list(range(size, 0, -1)),
+        "майже впорядк.": nearly,
+        "випадкові": [rng.randrange(size) for _ in range(size)],
+    }
+
+
+def bench_adaptive(sizes):
+    """
+    Порівнює merge_sort і natural_merge_sort на даних різної впорядкованості.
+
+    :param sizes: Розміри списків
+    """
+    print("Адаптивне сортування зв'язного списку (секунди)")
+    print(f"{'n':>10} {'дані':>16} {'merge_sort':>12} {'natural':>12}")
+    for size in sizes:
+        for name, values in make_inputs(size).items():
+            merge = time_sort(values, "merge_sort")
+            natural = time_sort(values, "natural_merge_sort")
+            print(f"{size:>10} {name:>16} {merge:12.4f} {natural:12.4f}")
+
+
+# Операції check_linked_list, що подовжують список
+GROWING = {"insert_at_beginning", "insert_at_end", "insert_after", "merge_sorted_lists", "extend"}
+
+
+def check_invariants(llist, model):
+    """
+    Перевіряє, що голова, хвіст, розмір і вміст списку відповідають моделі.
+
+    :param llist: Зв'язний список
+    :param model: Список Python з очікуваним вмістом
+    """
+    count = 0
+    last = None
+    node = llist.head
+    while node:
+        last = node
+        count += 1
+        node = node.next
+    assert llist.tail is last, "tail не вказує на останній вузол"
+    assert llist.size == len(llist) == count == len(model), "size не збігається"
+    assert llist.to_list() == model, "вміст не збігається"
+    if llist.indexed:
+        for value in set(model):
+            node = llist.search_element(value)
+            # Індекс має вказувати на перше входження значення
+            assert node is not None and node.data == value
+            first = llist.head
+            while first.data != value:
+                first = first.next
+            assert node is first, "індекс вказує не на перше входження"
+
+
+def check_linked_list(ops, seed=0):
+    """
+    Виконує випадкові операції над LinkedList і після кожної перевіряє інваріанти.
+
+    :param ops: Кількість операцій для кожного варіанту списку
+    :param seed: Зерно генератора випадкових чисел
+    :return: Лічильник виконаних операцій за назвами
+    """
+    rng = random.Random(seed)
+    done = {}
+    for indexed in (False, True):
+        llist, model = LinkedList(indexed), []
+        for _ in range(ops):
+            value = rng.randrange(20)  # Малий діапазон - багато повторів
+            name = rng.choice(["insert_at_beginning", "insert_at_end", "insert_after",
+                               "delete_node", "reverse", "insertion_sort", "merge_sort",
+                               "natural_merge_sort", "merge_sorted_lists", "extend"])
+            if len(model) > 100 and name in GROWING:
+                name = "delete_node"  # Обмежуємо довжину, щоб перевірки лишалися швидкими
+            if name == "insert_at_beginning":
+                llist.insert_at_beginning(value)
+                model.insert(0, value)
+            elif name == "insert_at_end":
+                llist.insert_at_end(value)
+                model.append(value)
+            elif name == "insert_after":
+                if not model:
+                    continue
+                position = rng.randrange(len(model))
+                node = llist.head
+                for _ in range(position):
+                    node = node.next
+                llist.insert_after(node, value)
+                model.insert(position + 1, value)
+            elif name == "delete_node":
+                key = rng.choice(model) if model and rng.random() < 0.8 else value
+                llist.delete_node(key)
+                if key in model:
+                    model.remove(key)
+            elif name == "reverse":
+                llist.reverse()
+                model.reverse()
+            elif name in ("insertion_sort", "merge_sort", "natural_merge_sort"):
+                getattr(llist, name)()
+                model.sort()
+            elif name == "merge_sorted_lists":
+                other = sorted(rng.randrange(20) for _ in range(rng.randrange(10)))
+                llist.merge_sort()
+                merged = LinkedList.merge_sorted_lists(
+                    llist.head, LinkedList.from_iterable(other).head)
+                # Об'єднаний список - новий і без індексу; повертаємо варіант списку
+                llist = LinkedList(indexed)
+                llist.extend(merged)
+                assert len(merged) == 0 and merged.tail is None
+                model = sorted(model + other)
+            else:
+                other = [rng.randrange(20) for _ in range(rng.randrange(5))]
+                source = LinkedList.from_iterable(other) if rng.random() < 0.5 else other
+                llist.extend(source)
+                model.extend(other)
+            done[name] = done.get(name, 0) + 1
+            check_invariants(llist, model)
+    return done
+
+
+def main():
+    """
+    Розбирає аргументи командного рядка та запускає бенчмарки.
+    """
+    parser = argparse.ArgumentParser(description="Бенчмарки для завдання 1")
+    parser.add_argument("benchmark", choices=["sort", "memory", "merge", "index",
+                                              "adaptive", "check"],
+                        help="який бенчмарк запустити")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1_000, 10_000, 100_000, 1_000_000],
+                        help="розміри списків")
+    parser.add_argument("--insertion-limit", type=int, default=10_000,
+                        help="максимальний розмір для insertion_sort")
+    parser.add_argument("--shards", type=int, nargs="+", default=[10, 100, 500],
+                        help="кількість відсортованих списків для злиття")
+    parser.add_argument("--ops", type=int, default=20_000,
+                        help="кількість операцій змішаного навантаження")
+    args = parser.parse_args()
+
+    if args.benchmark == "sort":
+        bench_sort(args.sizes, args.insertion_limit)
+    elif args.benchmark == "memory":
+        bench_memory(args.sizes)
+    elif args.benchmark == "merge":
+        bench_merge(args.sizes, args.shards)
+    elif args.benchmark == "index":
+        bench_index(args.sizes, args.ops)
+    elif args.benchmark == "adaptive":
+        bench_adaptive(args.sizes)
+    elif args.benchmark == "check":
+        done = check_linked_list(args.ops)
+        print("Інваріанти LinkedList виконуються після кожної операції:")
+        for name, count in sorted(done.items()):
+            print(f"{name:>22} {count:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Бенчмарки для фрактала "дерево Піфагора" із завдання 2.
+
+engine - порівнює рекурсивний шлях через черепашку (task_2.pythagoras_tree)
+         з векторизованим обчисленням відрізків (task_2_engine);
+batch  - вимірює масштабування пакетного рендерингу (task_2_batch) для
+         різної кількості процесів;
+lod    - вимірює час кадру з рівнем деталізації та відсіканням (task_2_lod)
+         для кількох рівнів наближення.
+
+Рекурсивний шлях вимірюється з RecordingTurtle - черепашкою без вікна, яка лише
+обчислює координати. Це нижня межа часу: справжній turtle ще й малює у Tk.
+
+Запуск:
+    python benchmark_task_2.py engine
+    python benchmark_task_2.py engine --orders 10 15 20 --turtle-limit 16
+    python benchmark_task_2.py batch --orders 14 16 --workers 1 2 4 8
+    python benchmark_task_2.py lod --orders 40 --zooms 1 10 100 1000
+"""
+
+import argparse
+import math
+import tempfile
+import statistics
+import time
+
+from task_2 import pythagoras_tree
+from task_2_batch import parameter_grid, render_batch
+from task_2_engine import pythagoras_segments, segment_count
+from task_2_lod import Viewport, visible_segments
+from task_2_render import tree_bounds
+
+
+class RecordingTurtle:
+    """ Черепашка без вікна: відстежує позицію і напрямок та рахує відрізки. """
+    def __init__(self, x=0.0, y=-200.0, heading=90.0):
+        self.x = x
+        self.y = y
+        self.heading = heading
+        self.segments = 0  # Кількість намальованих відрізків
+
+    def forward(self, distance):
+        """ Рухає черепашку вперед, малюючи відрізок. """
+        angle = math.radians(self.heading)
+        self.x += distance * math.cos(angle)
+        self.y += distance * math.sin(angle)
+        self.segments += 1
+
+    def backward(self, distance):
+        """ Повертає черепашку назад по тому самому відрізку. """
+        angle = math.radians(self.heading)
+        self.x -= distance * math.cos(angle)
+        self.y -= distance * math.sin(angle)
+
+    def left(self, angle):
+        """ Повертає черепашку ліворуч. """
+        self.heading += angle
+
+    def right(self, angle):
+        """ Повертає черепашку праворуч. """
+        self.heading -= angle
+
+
+def bench_engine(orders, turtle_limit):
+    """
+    Порівнює рекурсивний шлях черепашки з векторизованим ядром.
+
+    Args:
+    orders (list): Порядки рекурсії.
+    turtle_limit (int): Максимальний порядок для рекурсивного шляху.
+    """
+    print("Генерація дерева Піфагора (секунди)")
+    print(f"{'порядок':>8} {'відрізків':>10} {'turtle':>10} {'engine':>10}")
+    for order in orders:
+        if order <= turtle_limit:
+            t = RecordingTurtle()
+            start = time.perf_counter()
+            pythagoras_tree(t, order, 100)
+            recursive = f"{time.perf_counter() - start:10.4f}"
+            assert t.segments == segment_count(order)
+        else:
+            recursive = f"{'пропущено':>10}"
+        start = time.perf_counter()
+        segments = pythagoras_segments(order, 100)
+        engine = time.perf_counter() - start
+        assert len(segments[0]) == segment_count(order)
+        print(f"{order:>8} {segment_count(order):>10} {recursive} {engine:10.4f}")
+
+
+def bench_batch(orders, workers_list):
+    """
+    Вимірює час пакетного рендерингу сітки параметрів для різної кількості процесів.
+
+    Args:
+    orders (list): Порядки рекурсії в сітці.
+    workers_list (list): Кількості процесів.
+    """
+    grid = parameter_grid(orders, angles=[20, 30, 40, 45, 50, 60], scales=[0.65, 0.7071])
+    print(f"Пакетний рендеринг {len(grid)} PNG (секунди)")
+    print(f"{'процесів':>9} {'час':>10} {'прискорення':>12}")
+    baseline = None
+    for workers in workers_list:
+        with tempfile.TemporaryDirectory() as out_dir:
+            start = time.perf_counter()
+            render_batch(grid, out_dir, workers=workers, progress=None)
+            elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>9} {elapsed:10.3f} {baseline / elapsed:11.2f}x")
+
+
+def bench_lod(orders, zooms, width=800, height=600, repeats=5):
+    """
+    Вимірює час обчислення видимих відрізків для кількох рівнів наближення.
+
+    Центр області перегляду - кінчик гілки на глибині 12, тож при наближенні
+    у кадрі завжди залишається частина дерева.
+
+    Args:
+    orders (list): Порядки рекурсії.
+    zooms (list): Рівні наближення відносно повного вигляду.
+    width, height (int): Розмір кадру в пікселях.
+    repeats (int): Кількість повторів для медіани.
+    """
+    min_x, min_y, max_x, max_y = tree_bounds(14, 100)
+    tips_x, tips_y = pythagoras_segments(13, 100)[2:]
+    center_x, center_y = tips_x[-1], tips_y[-1]  # Кінчик гілки на глибині 12
+    print("Час кадру з LOD і відсіканням (мілісекунди, медіана)")
+    print(f"{'порядок':>8} {'наближення':>11} {'відрізків':>10} {'кадр, мс':>10}")
+    for order in orders:
+        for zoom in zooms:
+            half_width = (max_x - min_x) / 2 / zoom
+            half_height = half_width * height / width
+            viewport = Viewport(center_x - half_width, center_y - half_height,
+                                center_x + half_width, center_y + half_height)
+            pixels_per_unit = width / (2 * half_width)
+            times = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                segments = visible_segments(order, 100, viewport, pixels_per_unit)
+                times.append(time.perf_counter() - start)
+            print(f"{order:>8} {zoom:>11} {len(segments):>10} "
+                  f"{statistics.median(times) * 1000:10.2f}")
+
+
+def main():
+    """
+    Розбирає аргументи командного рядка та запускає бенчмарки.
+    """
+    parser = argparse.ArgumentParser(description="Бенчмарки для завдання 2")
+    parser.add_argument("benchmark", choices=["engine", "batch", "lod"],
+                        help="який бенчмарк запустити")
+    parser.add_argument("--orders", type=int, nargs="+", default=[10, 15, 20],
+                        help="порядки рекурсії")
+    parser.add_argument("--turtle-limit", type=int, default=18,
+                        help="максимальний порядок для рекурсивного шляху")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="кількості процесів для пакетного рендерингу")
+    parser.add_argument("--zooms", type=float, nargs="+", default=[1, 10, 100, 1000],
+                        help="рівні наближення для LOD")
+    args = parser.parse_args()
+
+    if args.benchmark == "engine":
+        bench_engine(args.orders, args.turtle_limit)
+    elif args.benchmark == "batch":
+        bench_batch(args.orders, args.workers)
+    elif args.benchmark == "lod":
+        bench_lod(args.orders, args.zooms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,641 @@
+"""
+Бенчмарки для алгоритму Дейкстри із завдання 3.
+
+csr - порівнює task_3.Graph і task_3_csr.CSRGraph за пам'яттю та
+      швидкістю dijkstra на випадкових графах;
+p2p - порівнює повний dijkstra з пошуком між двома вершинами
+      (shortest_path, bidirectional_dijkstra) на випадкових геометричних графах;
+astar - порівнює кількість опрацьованих вершин у shortest_path і a_star;
+queue - порівнює стратегії черги dijkstra ('lazy' і 'indexed') на щільних
+      і розріджених графах;
+matrix - порівнює послідовний цикл dijkstra з паралельним distance_matrix
+      (task_3_parallel) для багатьох джерел;
+cache - повторні запити шляхів з ShortestPathCache (task_3_cache) проти
+      виклику dijkstra на кожен запит;
+dynamic - звіряє інкрементні оновлення (task_3_dynamic) з повним
+      перерахунком на випадкових потоках змін ребер і порівнює їхню швидкість;
+load - час і пікова пам'ять (RSS) завантаження файлів ребер (task_3_io):
+      load_graph, load_csr з тексту і DIMACS, load_binary через mmap;
+ch - час попередньої обробки ієрархії стискання (task_3_ch), збереження і
+      завантаження, перцентилі затримки запитів порівняно з
+      bidirectional_dijkstra і перевірка відповідей за dijkstra.
+
+Запуск:
+    python benchmark_task_3.py csr
+    python benchmark_task_3.py csr --edges 10000 100000 1000000
+    python benchmark_task_3.py p2p --nodes 10000 100000
+    python benchmark_task_3.py astar --nodes 10000 100000
+    python benchmark_task_3.py queue
+    python benchmark_task_3.py matrix --sources 100 --workers 1 2 4 8
+    python benchmark_task_3.py cache --sources 20
+    python benchmark_task_3.py dynamic --nodes 10000 100000
+    python benchmark_task_3.py load --edges 1000000 10000000
+    python benchmark_task_3.py ch --nodes 10000 50000
+"""
+
+import argparse
+import math
+import os
+import random
+import resource
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from task_3 import Graph, a_star, bidirectional_dijkstra, build_path, dijkstra, shortest_path
+from task_3_cache import ShortestPathCache
+from task_3_ch import ContractionHierarchy
+from task_3_csr import CSRGraph, dijkstra_csr
+from task_3_dynamic import delete_edge, update_edge
+from task_3_io import load_binary, load_csr, load_graph, save_binary
+from task_3_parallel import distance_matrix
+
+
+def random_graph(num_nodes, num_edges, seed=0):
+    """
+    Генерує зв'язний випадковий граф: кільце через усі вершини плюс випадкові ребра.
+
+    Args:
+    num_nodes (int): Кількість вершин.
+    num_edges (int): Кількість неорієнтованих ребер (не менше num_nodes).
+    seed (int): Зерно генератора випадкових чисел.
+
+    Returns:
+    Graph: Згенерований граф з цілими мітками вершин.
+    """
+    rng = random.Random(seed)
+    graph = Graph()
+    for node in range(num_nodes):
+        graph.add_node(node)
+    for node in range(num_nodes):
+        graph.add_edge(node, (node + 1) % num_nodes, rng.randint(1, 100))
+    for _ in range(num_edges - num_nodes):
+        graph.add_edge(rng.randrange(num_nodes), rng.randrange(num_nodes),
+                       rng.randint(1, 100))
+    return graph
+
+
+def random_geometric_graph(num_nodes, seed=0):
+    """
+    Генерує випадковий геометричний граф: точки в одиничному квадраті,
+    з'єднані, якщо відстань між ними менша за радіус; вага ребра - відстань.
+
+    Радіус підібрано так, щоб середній степінь вершини був близько 10.
+
+    Args:
+    num_nodes (int): Кількість вершин.
+    seed (int): Зерно генератора випадкових чисел.
+
+    Returns:
+    tuple: (Graph, coordinates) - граф і список координат (x, y) вершин.
+    """
+    rng = random.Random(seed)
+    radius = math.sqrt(10 / (math.pi * num_nodes))
+    coordinates = [(rng.random(), rng.random()) for _ in range(num_nodes)]
+    graph = Graph()
+    cells = {}  # Сітка з кроком radius для пошуку сусідніх точок
+    for node, (x, y) in enumerate(coordinates):
+        graph.add_node(node, (x, y))
+        cells.setdefault((int(x / radius), int(y / radius)), []).append(node)
+    for node, (x, y) in enumerate(coordinates):
+        cx, cy = int(x / radius), int(y / radius)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for other in cells.get((cx + dx, cy + dy), ()):
+                    if other > node:  # Кожну пару розглядаємо один раз
+                        ox, oy = coordinates[other]
+                        distance = math.hypot(x - ox, y - oy)
+                        if distance < radius:
+                            graph.add_edge(node, other, distance)
+    return graph, coordinates
+
+
+def traced(builder):
+    """
+    Виконує builder() і вимірює виділену під результат пам'ять.
+
+    Args:
+    builder (callable): Функція без аргументів, що будує структуру.
+
+    Returns:
+    tuple: (результат, байти).
+    """
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = builder()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, after - before
+
+
+def bench_csr(edge_counts, sources=3):
+    """
+    Порівнює Graph і CSRGraph за пам'яттю і часом dijkstra.
+
+    Args:
+    edge_counts (list): Кількості неорієнтованих ребер.
+    sources (int): Кількість запусків dijkstra з різних вершин.
+    """
+    print("Graph проти CSRGraph")
+    print(f"{'ребер':>9} {'Graph, МБ':>10} {'CSR, МБ':>9} {'Graph, с':>9} "
+          f"{'CSR, с':>8} {'прискорення':>12}")
+    for num_edges in edge_counts:
+        num_nodes = max(2, num_edges // 4)
+        graph, graph_bytes = traced(lambda: random_graph(num_nodes, num_edges))
+        csr, csr_bytes = traced(lambda: CSRGraph.from_graph(graph))
+
+        rng = random.Random(1)
+        starts = [rng.randrange(num_nodes) for _ in range(sources)]
+        begin = time.perf_counter()
+        expected = [dijkstra(graph, start)[0] for start in starts]
+        graph_time = (time.perf_counter() - begin) / sources
+
+        begin = time.perf_counter()
+        results = [dijkstra_csr(csr, start)[0] for start in starts]
+        csr_time = (time.perf_counter() - begin) / sources
+
+        for start, exp, res in zip(starts, expected, results):
+            assert all(exp[label] == res[i] for i, label in enumerate(csr.labels)), start
+        print(f"{num_edges:>9} {graph_bytes / 2**20:10.1f} {csr_bytes / 2**20:9.1f} "
+              f"{graph_time:9.3f} {csr_time:8.3f} {graph_time / csr_time:11.2f}x")
+
+
+def bench_p2p(node_counts, queries=20):
+    """
+    Порівнює кількість опрацьованих вершин і час для запитів між двома вершинами.
+
+    Args:
+    node_counts (list): Кількості вершин у геометричних графах.
+    queries (int): Кількість випадкових пар (source, target).
+    """
+    print("Пошук шляху між двома вершинами (середнє на запит)")
+    print(f"{'вершин':>8} {'метод':>15} {'опрацьовано':>12} {'час, мс':>9}")
+    for num_nodes in node_counts:
+        graph, _ = random_geometric_graph(num_nodes)
+        rng = random.Random(1)
+        pairs = [(rng.randrange(num_nodes), rng.randrange(num_nodes))
+                 for _ in range(queries)]
+
+        begin = time.perf_counter()
+        expected = [dijkstra(graph, source)[0][target] for source, target in pairs]
+        full_time = (time.perf_counter() - begin) / queries
+        print(f"{num_nodes:>8} {'dijkstra':>15} {num_nodes:>12} {full_time * 1000:9.2f}")
+
+        for name, search in (("shortest_path", shortest_path),
+                             ("bidirectional", bidirectional_dijkstra)):
+            settled = 0
+            begin = time.perf_counter()
+            for (source, target), distance in zip(pairs, expected):
+                stats = {}
+                found, _ = search(graph, source, target, stats)
+                assert math.isclose(found, distance) or found == distance
+                settled += stats['settled']
+            elapsed = (time.perf_counter() - begin) / queries
+            print(f"{num_nodes:>8} {name:>15} {settled // queries:>12} {elapsed * 1000:9.2f}")
+
+
+def bench_astar(node_counts, queries=50):
+    """
+    Порівнює shortest_path (Дейкстра з ранньою зупинкою) і a_star з евклідовою евристикою.
+
+    Args:
+    node_counts (list): Кількості вершин у геометричних графах.
+    queries (int): Кількість випадкових пар (source, target).
+    """
+    print("A* проти Дейкстри (середнє на запит)")
+    print(f"{'вершин':>8} {'Дейкстра':>10} {'A*':>8} {'скорочення':>11} "
+          f"{'Дейкстра, мс':>13} {'A*, мс':>8}")
+    for num_nodes in node_counts:
+        graph, _ = random_geometric_graph(num_nodes)
+        rng = random.Random(1)
+        pairs = [(rng.randrange(num_nodes), rng.randrange(num_nodes))
+                 for _ in range(queries)]
+        totals = {}
+        for name, search in (("dijkstra", shortest_path), ("astar", a_star)):
+            settled = 0
+            results = []
+            begin = time.perf_counter()
+            for source, target in pairs:
+                stats = {}
+                results.append(search(graph, source, target, stats=stats)[0])
+                settled += stats['settled']
+            totals[name] = (settled / queries, (time.perf_counter() - begin) / queries, results)
+        # A* з допустимою евристикою має знаходити ті самі (оптимальні) відстані
+        for expected, found in zip(totals["dijkstra"][2], totals["astar"][2]):
+            assert expected == found or math.isclose(expected, found)
+        dijkstra_settled, dijkstra_time, _ = totals["dijkstra"]
+        astar_settled, astar_time, _ = totals["astar"]
+        print(f"{num_nodes:>8} {dijkstra_settled:10.0f} {astar_settled:8.0f} "
+              f"{dijkstra_settled / astar_settled:10.1f}x "
+              f"{dijkstra_time * 1000:13.2f} {astar_time * 1000:8.2f}")
+
+
+def bench_queue():
+    """
+    Порівнює лінивий heapq і IndexedHeap у dijkstra: розмір купи, кількість
+    операцій і час на щільних і розріджених графах.
+    """
+    cases = [
+        ("щільний", 1_000, 250_000),
+        ("щільний", 2_000, 1_000_000),
+        ("розріджений", 100_000, 400_000),
+    ]
+    print("Стратегії черги в dijkstra")
+    print(f"{'граф':>12} {'вершин':>8} {'ребер':>9} {'черга':>8} {'макс. розмір':>13} "
+          f"{'push':>8} {'pop':>8} {'decrease':>9} {'час, с':>8}")
+    for name, num_nodes, num_edges in cases:
+        graph = random_graph(num_nodes, num_edges)
+        expected = None
+        for queue in ("lazy", "indexed"):
+            stats = {}
+            begin = time.perf_counter()
+            distances, _ = dijkstra(graph, 0, queue=queue, stats=stats)
+            elapsed = time.perf_counter() - begin
+            expected = expected or distances
+            assert distances == expected
+            print(f"{name:>12} {num_nodes:>8} {num_edges:>9} {queue:>8} "
+                  f"{stats['peak_size']:>13} {stats['pushes']:>8} {stats['pops']:>8} "
+                  f"{stats['decrease_keys']:>9} {elapsed:8.3f}")
+
+
+def bench_matrix(num_sources, workers_list, num_nodes=25_000, num_edges=100_000):
+    """
+    Порівнює послідовний цикл dijkstra з паралельним distance_matrix.
+
+    Args:
+    num_sources (int): Кількість джерел.
+    workers_list (list): Кількості процесів.
+    num_nodes (int): Кількість вершин графа.
+    num_edges (int): Кількість ребер графа.
+    """
+    graph = random_graph(num_nodes, num_edges)
+    sources = random.Random(1).sample(range(num_nodes), num_sources)
+    print(f"Матриця відстаней: {num_sources} джерел, {num_nodes} вершин, {num_edges} ребер")
+    print(f"{'метод':>22} {'час, с':>8}")
+
+    begin = time.perf_counter()
+    expected = [dijkstra(graph, source)[0] for source in sources]
+    print(f"{'цикл dijkstra':>22} {time.perf_counter() - begin:8.2f}")
+
+    for workers in workers_list:
+        begin = time.perf_counter()
+        matrix, labels = distance_matrix(graph, sources, workers=workers, chunksize=4)
+        elapsed = time.perf_counter() - begin
+        assert all(matrix[0][i] == expected[0][label] for i, label in enumerate(labels))
+        print(f"{f'distance_matrix x{workers}':>22} {elapsed:8.2f}")
+
+
+def bench_cache(num_sources, queries=1000, num_nodes=5_000, num_edges=20_000):
+    """
+    Порівнює запити шляхів через ShortestPathCache з викликом dijkstra на кожен запит.
+
+    Args:
+    num_sources (int): Кількість різних джерел у запитах.
+    queries (int): Кількість запитів (джерело, ціль).
+    num_nodes (int): Кількість вершин графа.
+    num_edges (int): Кількість ребер графа.
+    """
+    graph = random_graph(num_nodes, num_edges)
+    rng = random.Random(2)
+    sources = rng.sample(range(num_nodes), num_sources)
+    pairs = [(rng.choice(sources), rng.randrange(num_nodes)) for _ in range(queries)]
+    print(f"Кеш шляхів: {queries} запитів, {num_sources} джерел, {num_nodes} вершин")
+    print(f"{'метод':>22} {'час, с':>8}")
+
+    # Без кешу достатньо частини запитів - час екстраполюємо на всі
+    sample = pairs[:max(1, queries // 20)]
+    begin = time.perf_counter()
+    expected = [build_path(dijkstra(graph, source)[1], target) for source, target in sample]
+    elapsed = (time.perf_counter() - begin) * queries / len(sample)
+    print(f"{'dijkstra на запит':>22} {elapsed:8.2f}")
+
+    for max_bytes in (2**30, 4 * 2**20):
+        cache = ShortestPathCache(graph, max_bytes=max_bytes)
+        begin = time.perf_counter()
+        paths = [cache.path(source, target) for source, target in pairs]
+        elapsed = time.perf_counter() - begin
+        assert all(list(path) == want for path, want in zip(paths, expected))
+        print(f"{f'кеш {max_bytes >> 20} МБ':>22} {elapsed:8.2f}  {cache.stats()}")
+
+
+def random_edge_update(graph, rng):
+    """
+    Генерує випадкову зміну ребра: додавання, зменшення чи збільшення ваги або видалення.
+
+    Returns:
+    tuple: (from_node, to_node, distance), де distance=None означає видалення ребра.
+    """
+    nodes = len(graph.nodes)
+    kind = rng.random()
+    if kind < 0.25 or not graph.distances:
+        return rng.randrange(nodes), rng.randrange(nodes), rng.randint(1, 100)
+    # Ребро вибираємо через випадкову вершину та її сусіда
+    from_node = rng.randrange(nodes)
+    while not graph.edges[from_node]:
+        from_node = rng.randrange(nodes)
+    to_node = rng.choice(graph.edges[from_node])
+    weight = graph.distances[(from_node, to_node)]
+    if kind < 0.5:
+        return from_node, to_node, rng.randint(0, weight)
+    if kind < 0.75:
+        return from_node, to_node, weight + rng.randint(1, 100)
+    return from_node, to_node, None
+
+
+def apply_update(graph, distances, previous_nodes, update):
+    """ Застосовує зміну з random_edge_update через task_3_dynamic """
+    from_node, to_node, distance = update
+    if distance is None:
+        return delete_edge(graph, distances, previous_nodes, from_node, to_node)
+    return update_edge(graph, distances, previous_nodes, from_node, to_node, distance)
+
+
+def check_tree(graph, distances, previous_nodes, source):
+    """ Перевіряє, що previous_nodes утворюють дерево шляхів з відстанями distances """
+    for node, parent in previous_nodes.items():
+        if parent is None:
+            assert node == source or distances[node] == math.inf
+        else:
+            assert distances[node] == distances[parent] + graph.distances[(parent, node)]
+
+
+def check_dynamic(trials=200, steps=50):
+    """
+    Рандомізована перевірка: після кожної зміни ребра інкрементний результат
+    має збігатися з повним перерахунком dijkstra.
+    """
+    # Повторне add_node не скидає суміжність наявної вершини і не змінює версію
+    graph = Graph()
+    for node in "ABC":
+        graph.add_node(node)
+    graph.add_edge("A", "B", 1)
+    graph.add_edge("B", "C", 1)
+    version = graph.version
+    graph.add_node("A")
+    assert graph.version == version
+    graph.add_edge("A", "B", 2)
+    assert graph.edges["A"] == ["B"] and dijkstra(graph, "A")[0]["B"] == 2
+
+    for trial in range(trials):
+        rng = random.Random(trial)
+        num_nodes = rng.randint(2, 30)
+        graph = random_graph(num_nodes, num_nodes + rng.randint(0, 2 * num_nodes), seed=trial)
+        source = rng.randrange(num_nodes)
+        distances, previous_nodes = dijkstra(graph, source)
+        for _ in range(steps):
+            graph.add_node(rng.randrange(num_nodes))  # Вершина вже є - граф не змінюється
+            apply_update(graph, distances, previous_nodes, random_edge_update(graph, rng))
+            expected, _ = dijkstra(graph, source)
+            assert distances == expected, f"розбіжність у спробі {trial}"
+            check_tree(graph, distances, previous_nodes, source)
+    print(f"Перевірка: {trials} випадкових графів x {steps} змін - результати збігаються")
+
+
+def bench_dynamic(node_counts, updates=200):
+    """
+    Порівнює потік дрібних змін ребер: інкрементне оновлення проти повного dijkstra.
+
+    Args:
+    node_counts (list): Кількості вершин графів (ребер - учетверо більше).
+    updates (int): Кількість змін у потоці.
+    """
+    check_dynamic()
+    print(f"{'вершин':>8} {'dijkstra, мс':>13} {'оновлення, мс':>14} {'змінено вершин':>15}")
+    for num_nodes in node_counts:
+        graph = random_graph(num_nodes, 4 * num_nodes)
+        rng = random.Random(num_nodes)
+        distances, previous_nodes = dijkstra(graph, 0)
+
+        changed = 0
+        begin = time.perf_counter()
+        for _ in range(updates):
+            changed += len(apply_update(graph, distances, previous_nodes,
+                                        random_edge_update(graph, rng)))
+        incremental = (time.perf_counter() - begin) / updates
+
+        # Повний перерахунок вимірюємо на кількох запусках - він не залежить від зміни
+        runs = 3
+        begin = time.perf_counter()
+        for _ in range(runs):
+            expected, _ = dijkstra(graph, 0)
+        full = (time.perf_counter() - begin) / runs
+        assert distances == expected
+        print(f"{num_nodes:8d} {full * 1e3:13.2f} {incremental * 1e3:14.3f} "
+              f"{changed / updates:15.1f}")
+
+
+def write_edge_files(directory, num_nodes, num_edges, seed=0):
+    """
+    Записує випадковий зв'язний граф (як random_graph) у текстовий файл ребер і у DIMACS.
+
+    Returns:
+    tuple: (шлях до файлу edges, шлях до файлу .gr).
+    """
+    rng = random.Random(seed)
+    edges_path = os.path.join(directory, f"graph_{num_edges}.txt")
+    dimacs_path = os.path.join(directory, f"graph_{num_edges}.gr")
+    with open(edges_path, "w") as edges_file, open(dimacs_path, "w") as dimacs_file:
+        dimacs_file.write(f"p sp {num_nodes} {2 * num_edges}\n")
+        for start in range(0, num_edges, 100_000):
+            lines, arcs = [], []
+            for k in range(start, min(start + 100_000, num_edges)):
+                if k < num_nodes:
+                    u, v = k, (k + 1) % num_nodes
+                else:
+                    u, v = rng.randrange(num_nodes), rng.randrange(num_nodes)
+                w = rng.randint(1, 100)
+                lines.append(f"{u} {v} {w}\n")
+                # DIMACS - орієнтовані дуги, тож неорієнтоване ребро записуємо двічі
+                arcs.append(f"a {u + 1} {v + 1} {w}\na {v + 1} {u + 1} {w}\n")
+            edges_file.writelines(lines)
+            dimacs_file.writelines(arcs)
+    return edges_path, dimacs_path
+
+
+def peak_rss_mb():
+    """
+    Пікова RSS поточного процесу в МБ.
+
+    На Linux читається VmHWM з /proc: ru_maxrss успадковує пік батьківського
+    процесу через fork перед exec і завищує результат для дочірніх процесів.
+    """
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure_load(loader, path):
+    """
+    Виконується в окремому процесі: завантажує граф і вимірює час і пікову RSS.
+
+    Returns:
+    tuple: (секунди, пікова RSS у МБ, кількість орієнтованих ребер, відстані від вершини 0
+    до перших 100 вершин).
+    """
+    begin = time.perf_counter()
+    if loader == "graph":
+        graph = load_graph(path, label_type=int)
+        elapsed = time.perf_counter() - begin
+        edges = sum(len(neighbors) for neighbors in graph.edges.values())
+        csr = CSRGraph.from_graph(graph)
+    else:
+        csr = load_csr(path, label_type=int) if loader == "csr" else load_binary(path)
+        elapsed = time.perf_counter() - begin
+        edges = csr.num_edges
+    rss = peak_rss_mb()
+    distances, _ = dijkstra_csr(csr, csr.labels[0])
+    by_label = dict(zip(csr.labels, distances))
+    sample = [by_label[label] for label in sorted(by_label)[:100]]
+    return elapsed, rss, edges, sample
+
+
+def bench_load(edge_counts, graph_limit=1_000_000):
+    """
+    Порівнює завантажувачі task_3_io за часом і піковою пам'яттю процесу.
+
+    Кожне завантаження виконується в новому процесі, тож пікова RSS
+    не залежить від попередніх вимірювань.
+
+    Args:
+    edge_counts (list): Кількості неорієнтованих ребер у файлах.
+    graph_limit (int): Найбільша кількість ребер для load_graph (task_3.Graph).
+    """
+    print(f"{'ребер':>9} {'завантажувач':>22} {'час, с':>8} {'пік RSS, МБ':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        for num_edges in edge_counts:
+            num_nodes = max(2, num_edges // 4)
+            edges_path, dimacs_path = write_edge_files(directory, num_nodes, num_edges)
+            binary_path = os.path.join(directory, f"graph_{num_edges}.csrg")
+            save_binary(load_csr(dimacs_path), binary_path)
+
+            runs = [("load_csr (edges)", "csr", edges_path),
+                    ("load_csr (dimacs)", "csr", dimacs_path),
+                    ("load_binary (mmap)", "binary", binary_path)]
+            if num_edges <= graph_limit:
+                runs.insert(0, ("load_graph (edges)", "graph", edges_path))
+            expected = None
+            for name, loader, path in runs:
+                # Новий процес на кожне вимірювання - чиста пікова RSS
+                with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+                    elapsed, rss, edges, sample = pool.submit(measure_load, loader, path).result()
+                if loader == "graph":
+                    # Graph.add_edge зливає повторні ребра, CSR зберігає паралельні
+                    assert edges <= 2 * num_edges, name
+                else:
+                    assert edges == 2 * num_edges, name
+                    expected = expected or sample
+                    assert sample == expected, name
+                print(f"{num_edges:>9} {name:>22} {elapsed:8.2f} {rss:12.1f}")
+            for path in (edges_path, dimacs_path, binary_path):
+                os.remove(path)
+
+
+def percentiles(samples, points=(50, 90, 99)):
+    """ Повертає перцентилі вибірки (методом найближчого рангу) """
+    ordered = sorted(samples)
+    return [ordered[min(len(ordered) - 1, len(ordered) * p // 100)] for p in points]
+
+
+def bench_ch(node_counts, queries=1000, checked=20):
+    """
+    Вимірює попередню обробку і запити ієрархії стискання на геометричних графах.
+
+    Args:
+    node_counts (list): Кількості вершин.
+    queries (int): Кількість випадкових запитів для вимірювання затримки.
+    checked (int): Кількість джерел, відповіді для яких звіряються з dijkstra.
+    """
+    for num_nodes in node_counts:
+        graph, _ = random_geometric_graph(num_nodes)
+        begin = time.perf_counter()
+        ch = ContractionHierarchy.from_graph(graph)
+        build_time = time.perf_counter() - begin
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.ch")
+            ch.save(path)
+            size = os.path.getsize(path)
+            begin = time.perf_counter()
+            ch = ContractionHierarchy.load(path)
+            load_time = time.perf_counter() - begin
+        print(f"{num_nodes} вершин: побудова {build_time:.1f} с, "
+              f"{ch.num_shortcuts} ярликів, файл {size / 2**20:.1f} МБ, "
+              f"завантаження {load_time * 1e3:.1f} мс")
+
+        # Перевірка: відстані до випадкових вершин і коректність розгорнутих шляхів
+        rng = random.Random(1)
+        for source in rng.sample(range(num_nodes), checked):
+            expected, _ = dijkstra(graph, source)
+            for target in rng.sample(range(num_nodes), min(num_nodes, 200)):
+                distance = ch.distance(source, target)
+                assert math.isclose(distance, expected[target]) or distance == expected[target]
+            target = rng.randrange(num_nodes)
+            distance, path = ch.shortest_path(source, target)
+            if path:
+                assert path[0] == source and path[-1] == target
+                length = sum(graph.distances[edge] for edge in zip(path, path[1:]))
+                assert math.isclose(length, distance)
+
+        pairs = [(rng.randrange(num_nodes), rng.randrange(num_nodes)) for _ in range(queries)]
+        print(f"{'метод':>15} {'опрацьовано':>12} {'p50, мс':>8} {'p90, мс':>8} {'p99, мс':>8}")
+        for name, search in (("ch distance", ch.distance),
+                             ("ch path", ch.shortest_path),
+                             ("bidirectional", lambda s, t, stats: bidirectional_dijkstra(graph, s, t, stats))):
+            # Двобічну Дейкстру вимірюємо на меншій вибірці - вона значно повільніша
+            sample = pairs if name.startswith("ch") else pairs[:queries // 10]
+            latencies, settled = [], 0
+            for source, target in sample:
+                stats = {}
+                begin = time.perf_counter()
+                search(source, target, stats)
+                latencies.append((time.perf_counter() - begin) * 1e3)
+                settled += stats['settled']
+            p50, p90, p99 = percentiles(latencies)
+            print(f"{name:>15} {settled // len(sample):>12} {p50:8.3f} {p90:8.3f} {p99:8.3f}")
+
+
+def main():
+    """
+    Розбирає аргументи командного рядка та запускає бенчмарки.
+    """
+    parser = argparse.ArgumentParser(description="Бенчмарки для завдання 3")
+    parser.add_argument("benchmark", choices=["csr", "p2p", "astar", "queue", "matrix", "cache", "dynamic", "load", "ch"], help="який бенчмарк запустити")
+    parser.add_argument("--edges", type=int, nargs="+",
+                        default=[10_000, 100_000, 1_000_000],
+                        help="кількості ребер у випадкових графах")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[10_000, 100_000],
+                        help="кількості вершин у геометричних графах")
+    parser.add_argument("--sources", type=int, default=100,
+                        help="кількість джерел для матриці відстаней")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="кількості процесів")
+    args = parser.parse_args()
+
+    if args.benchmark == "csr":
+        bench_csr(args.edges)
+    elif args.benchmark == "p2p":
+        bench_p2p(args.nodes)
+    elif args.benchmark == "astar":
+        bench_astar(args.nodes)
+    elif args.benchmark == "queue":
+        bench_queue()
+    elif args.benchmark == "matrix":
+        bench_matrix(args.sources, args.workers)
+    elif args.benchmark == "cache":
+        bench_cache(args.sources)
+    elif args.benchmark == "dynamic":
+        bench_dynamic(args.nodes)
+    elif args.benchmark == "load":
+        bench_load(args.edges)
+    elif args.benchmark == "ch":
+        bench_ch(args.nodes)
+
+
+if __name__ == "__main__":
+    main()
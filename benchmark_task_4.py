@@ -0,0 +1,539 @@
+"""
+Бенчмарки для візуалізації піраміди із завдання 4.
+
+layout - порівнює шлях draw_heap (HeapNode з uuid, рекурсивний add_edges,
+         граф NetworkX) з обчисленням позицій за індексами масиву
+         (heap_layout / draw_heap_array): окремо побудову розкладки
+         і повне малювання у вікно без екрана (Agg);
+animation - звіряє RecordingHeap з heapq і кадр після інкрементного
+         відтворення з повним перемальовуванням, порівнює час
+         інкрементного кадру HeapAnimator з повним перемальовуванням
+         фігури, а також експортує коротке відтворення у GIF
+         (task_4_animation);
+window - звіряє агрегати вікна з прямим обходом піддерев (числа, великі
+         цілі, кортежі) і порівнює час малювання вікна (без максимумів
+         і з ними, від кореня і від глибокого вузла) з малюванням
+         усієї купи (task_4_window);
+engines - звіряє реалізації куп з task_4_heaps з відсортованим списком
+         (push, pop, decrease_key, build, merge) і вимірює пропускну
+         здатність на навантаженнях з перевагою push, pop і змішаному;
+check - звіряє векторизовану перевірку купи з циклом на Python, порівнює
+         їхній час і вимірює накладні витрати HeapProfiler: вимкненого
+         (мають бути нульовими) і ввімкненого (task_4_check).
+
+Запуск:
+    python benchmark_task_4.py layout
+    python benchmark_task_4.py layout --sizes 1000 100000 1000000 --render-limit 10000
+    python benchmark_task_4.py animation --sizes 1000 100000 1000000
+    python benchmark_task_4.py window --sizes 1000 100000 1000000 --render-limit 100000
+    python benchmark_task_4.py engines --sizes 1000 100000 1000000
+    python benchmark_task_4.py check --sizes 1000 100000 1000000
+"""
+
+import argparse
+import gc
+import heapq
+import io
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use("Agg")  # Малюємо без вікна
+import matplotlib.pyplot as plt
+import networkx as nx
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from task_4 import add_edges, draw_heap_array, heap_layout, heap_to_tree
+from task_4_animation import HeapAnimator, RecordingHeap, export_gif, replay
+from task_4_check import HeapProfiler, find_violations, first_violation
+from task_4_heaps import ENGINES, Heap
+from task_4_window import draw_heap_window, heap_window
+
+
+def random_heap(size, seed=0):
+    """ Повертає мінімальну купу з size випадкових чисел """
+    rng = random.Random(seed)
+    heap = [rng.randrange(10 * size) for _ in range(size)]
+    heap.sort()  # Відсортований список - коректна мінімальна купа
+    return heap
+
+
+def tree_layout(heap):
+    """
+    Будує розкладку так само, як draw_heap: HeapNode, add_edges і граф NetworkX.
+
+    Returns:
+    tuple: (граф, позиції, кольори, мітки).
+    """
+    root = heap_to_tree(heap)
+    tree = nx.DiGraph()
+    pos = {root.id: (0, 0)}
+    tree = add_edges(tree, root, pos)
+    colors = [node[1]['color'] for node in tree.nodes(data=True)]
+    labels = {node[0]: node[1]['label'] for node in tree.nodes(data=True)}
+    return tree, pos, colors, labels
+
+
+def render(draw):
+    """ Виконує draw(ax) на новій фігурі та рендерить її у PNG у пам'яті """
+    fig, ax = plt.subplots(figsize=(12, 8))
+    draw(ax)
+    fig.savefig(io.BytesIO(), format="png")
+    plt.close(fig)
+
+
+def bench_layout(sizes, render_limit):
+    """
+    Порівнює побудову розкладки і повне малювання для двох шляхів.
+
+    Args:
+    sizes (list): Розміри куп.
+    render_limit (int): Найбільший розмір купи для повного малювання через NetworkX.
+    """
+    # add_edges рекурсивний, але глибина рекурсії - лише log2(n)
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+    print(f"{'розмір':>9} {'дерево, с':>10} {'масив, с':>9} {'прискорення':>12} "
+          f"{'nx.draw, с':>11} {'масив+рендер, с':>16}")
+    for size in sizes:
+        heap = random_heap(size)
+
+        begin = time.perf_counter()
+        tree, pos, _, labels = tree_layout(heap)
+        tree_time = time.perf_counter() - begin
+
+        begin = time.perf_counter()
+        x, y = heap_layout(size)
+        array_time = time.perf_counter() - begin
+
+        # Позиції збігаються: вузли додаються в граф у порядку обходу в глибину,
+        # тож звіряємо множини пар (значення, позиція)
+        expected = sorted((labels[node], pos[node]) for node in tree.nodes)
+        found = sorted(zip(heap, zip(x.tolist(), y.tolist())))
+        assert all(a[0] == b[0] and np.allclose(a[1], b[1]) for a, b in zip(expected, found))
+        del tree, pos, labels
+
+        nx_render = "-"
+        if size <= render_limit:
+            begin = time.perf_counter()
+            render(lambda ax: nx.draw(*tree_layout(heap)[:2], ax=ax, arrows=False,
+                                      node_size=20, with_labels=False))
+            nx_render = f"{time.perf_counter() - begin:11.2f}"
+        begin = time.perf_counter()
+        render(lambda ax: draw_heap_array(heap, ax=ax))
+        array_render = time.perf_counter() - begin
+
+        print(f"{size:>9} {tree_time:10.3f} {array_time:9.4f} {tree_time / array_time:11.0f}x "
+              f"{nx_render:>11} {array_render:16.2f}")
+
+
+def random_operations(heap, count, seed=0):
+    """
+    Виконує count випадкових push/pop над RecordingHeap і над звичайним списком
+    через heapq, перевіряючи, що результати збігаються.
+    """
+    rng = random.Random(seed)
+    reference = list(heap.heap)
+    for _ in range(count):
+        if rng.random() < 0.6 or not reference:
+            value = rng.randrange(10 * (len(reference) + 1))
+            heap.push(value)
+            heapq.heappush(reference, value)
+        else:
+            assert heap.pop() == heapq.heappop(reference)
+        assert heap.heap == reference
+
+
+def check_animation(seed=0):
+    """
+    Звіряє кадр після інкрементного відтворення з повним перемальовуванням:
+    клітинки, звільнені pop, мають стати порожніми, а не лишитися вузлами.
+    Допускається розбіжність на одиницю-дві яскравості через порядок
+    накладання згладжених країв сусідніх маркерів.
+    """
+    rng = random.Random(seed)
+    heap = RecordingHeap(sorted(rng.randrange(100) for _ in range(40)))
+    for _ in range(20):
+        heap.push(rng.randrange(100))
+    for _ in range(25):
+        heap.pop()
+
+    fig = Figure(figsize=(12, 8), dpi=80)
+    canvas = FigureCanvasAgg(fig)
+    animator = HeapAnimator(heap.initial, heap.events, fig.add_subplot())
+    canvas.draw()
+    while animator.step():
+        pass
+    blitted = np.asarray(canvas.buffer_rgba()).astype(int)
+    canvas.draw()
+    full = np.asarray(canvas.buffer_rgba()).astype(int)
+    assert np.abs(blitted - full).max() <= 2
+
+
+def bench_animation(sizes, operations=200, full_frames=5):
+    """
+    Порівнює вартість інкрементного кадру анімації з повним перемальовуванням.
+
+    Args:
+    sizes (list): Розміри куп.
+    operations (int): Кількість випадкових push/pop у журналі.
+    full_frames (int): Кількість повних перемальовувань для вимірювання.
+    """
+    check_animation()
+    print(f"{'розмір':>9} {'подій':>6} {'кадр, мс':>9} {'повний кадр, мс':>16}")
+    for size in sizes:
+        heap = RecordingHeap(random_heap(size))
+        random_operations(heap, operations)
+        assert replay(heap.initial, heap.events) == heap.heap
+
+        fig = Figure(figsize=(12, 8), dpi=80)
+        canvas = FigureCanvasAgg(fig)
+        animator = HeapAnimator(heap.initial, heap.events, fig.add_subplot())
+        canvas.draw()
+
+        begin = time.perf_counter()
+        while animator.step():
+            pass
+        frame = (time.perf_counter() - begin) / len(heap.events)
+
+        begin = time.perf_counter()
+        for _ in range(full_frames):
+            canvas.draw()
+        full = (time.perf_counter() - begin) / full_frames
+        print(f"{size:>9} {len(heap.events):>6} {frame * 1e3:9.3f} {full * 1e3:16.1f}")
+
+    heap = RecordingHeap(random_heap(31))
+    random_operations(heap, 20)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "heap.gif")
+        begin = time.perf_counter()
+        frames = export_gif(heap.initial, heap.events, path)
+        elapsed = time.perf_counter() - begin
+        print(f"GIF: {frames} кадрів, {os.path.getsize(path) / 1024:.0f} КБ, {elapsed:.1f} с")
+
+
+def subtree_values(heap, index):
+    """ Повертає всі значення піддерева з коренем index прямим обходом """
+    values, stack = [], [index]
+    while stack:
+        node = stack.pop()
+        if node < len(heap):
+            values.append(heap[node])
+            stack.extend((2 * node + 1, 2 * node + 2))
+    return values
+
+
+def check_window(cases=200, seed=0):
+    """ Звіряє агрегати heap_window з прямим обходом на випадкових купах """
+    rng = random.Random(seed)
+    for _ in range(cases):
+        size = rng.randint(1, 3000)
+        # Числа, цілі понад 2 ** 53 і пари (пріоритет, задача) - максимум без округлення
+        kind = rng.choice(("int", "big", "tuple"))
+        heap = [rng.randrange(100) for _ in range(size)]
+        if kind == "big":
+            heap = [2 ** 60 + value for value in heap]
+        elif kind == "tuple":
+            heap = [(value, f"task-{i}") for i, value in enumerate(heap)]
+        heapq.heapify(heap)
+        root, depth = rng.randrange(size), rng.randint(1, 5)
+        assert all(aggregate.max is None for aggregate in heap_window(heap, root, depth).aggregates)
+        window = heap_window(heap, root, depth, with_max=True)
+        for aggregate in window.aggregates:
+            values = subtree_values(heap, aggregate.index)
+            assert (aggregate.count, aggregate.min, aggregate.max) == \
+                (len(values), min(values), max(values))
+        # Видимі вузли разом з агрегатами покривають усе піддерево вікна
+        visible = int((window.nodes >= 0).sum())
+        assert visible + sum(aggregate.count for aggregate in window.aggregates) == \
+            len(subtree_values(heap, root))
+
+
+def bench_window(sizes, render_limit):
+    """
+    Порівнює час малювання вікна купи з малюванням усієї купи.
+
+    Args:
+    sizes (list): Розміри куп.
+    render_limit (int): Найбільший розмір купи для малювання повністю.
+    """
+    check_window()
+    print(f"{'розмір':>9} {'вікно, с':>9} {'з max, с':>11} {'глибоке, с':>11} "
+          f"{'уся купа, с':>12}")
+    for size in sizes:
+        heap = random_heap(size)
+        gc.collect()  # Інакше повна збірка сміття після створення купи потрапляє в перший замір
+        deep = (size - 1) // 2 ** 8  # Вузол на кілька рівнів вище листя
+        timings = []
+        for root, with_max in ((0, False), (0, True), (deep, False)):
+            begin = time.perf_counter()
+            render(lambda ax: draw_heap_window(heap, root, ax=ax, with_max=with_max))
+            timings.append(time.perf_counter() - begin)
+        full = "-"
+        if size <= render_limit:
+            begin = time.perf_counter()
+            render(lambda ax: draw_heap_array(heap, ax=ax))
+            full = f"{time.perf_counter() - begin:12.2f}"
+        print(f"{size:>9} {timings[0]:9.3f} {timings[1]:11.3f} {timings[2]:11.3f} {full:>12}")
+
+
+def check_engines(cases=100, seed=0):
+    """
+    Звіряє всі реалізації куп з еталоном - словником живих елементів.
+
+    Значення елементів унікальні, тож за виданим значенням відомо, який
+    саме елемент вилучено. Ключі монотонні (не менші за останній виданий
+    мінімум), щоб підходили й для RadixHeap.
+    """
+    rng = random.Random(seed)
+    # Неповну реалізацію не можна створити
+    incomplete = type("Incomplete", (Heap,), {"push": lambda self, key, value=None: None})
+    for cls in (Heap, incomplete):
+        try:
+            cls()
+        except TypeError:
+            pass
+        else:
+            raise AssertionError(f"{cls.__name__} без усіх операцій створено")
+    for engine in ENGINES.values():
+        for _ in range(cases):
+            values = itertools.count()
+            live = {}  # Значення -> ключ
+            handles = {}  # Значення -> дескриптор (для елементів, доданих через push)
+
+            def bulk(count):
+                keys = [rng.randrange(50) for _ in range(count)]
+                ids = [next(values) for _ in keys]
+                live.update(zip(ids, keys))
+                return engine.build(keys, ids)
+
+            heap = bulk(rng.randrange(30))
+            other = bulk(rng.randrange(10))
+            # Дескриптори елементів other після merge належать heap
+            for _ in range(rng.randrange(5)):
+                value, key = next(values), rng.randrange(50)
+                handles[value] = other.push(key, value)
+                live[value] = key
+            heap.merge(other)
+            assert len(other) == 0 and len(heap) == len(live)
+
+            last = 0
+            for _ in range(200):
+                action = rng.random()
+                if action < 0.4 or not live:
+                    value, key = next(values), last + rng.randrange(50)
+                    handles[value] = heap.push(key, value)
+                    live[value] = key
+                elif action < 0.6 and handles:
+                    value = rng.choice(list(handles))
+                    live[value] = rng.randint(last, live[value])
+                    heap.decrease_key(handles[value], live[value])
+                else:
+                    assert heap.peek()[0] == min(live.values())
+                    key, value = heap.pop()
+                    assert live.pop(value) == key == min([key, *live.values()])
+                    popped = handles.pop(value, None)
+                    last = key
+                    if popped is not None:
+                        # Дескриптор видаленого елемента не приймається і не псує купу
+                        try:
+                            heap.decrease_key(popped, last)
+                        except ValueError:
+                            pass
+                        else:
+                            raise AssertionError("decrease_key прийняв видалений елемент")
+                assert len(heap) == len(live)
+                _, parents = heap.tree()
+                assert all(parent < node for node, parent in enumerate(parents))
+
+            # Дескриптор живого (не кореневого) елемента іншої купи не приймається
+            stranger = engine()
+            stranger.push(last, "root")
+            foreign = stranger.push(last + 1, "child")
+            try:
+                heap.decrease_key(foreign, last)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("decrease_key прийняв елемент іншої купи")
+            assert len(heap) == len(live)
+            assert [stranger.pop(), stranger.pop()] == [(last, "root"), (last + 1, "child")]
+
+
+def engine_workload(kind, size, seed=0):
+    """
+    Генерує послідовність операцій: зсув ключа від останнього мінімуму для
+    push або None для pop (ключі монотонні, як у Дейкстрі).
+
+    push - 75% push; pop - купа з size елементів спорожнюється з 25% push;
+    mixed - порівну push і pop поверх купи з size елементів.
+    """
+    rng = random.Random(seed)
+    share = {"push": 0.75, "pop": 0.25, "mixed": 0.5}[kind]
+    operations = size if kind == "push" else 2 * size
+    return [rng.randrange(1000) if rng.random() < share else None
+            for _ in range(operations)]
+
+
+def run_workload(heap, workload):
+    """ Виконує операції над купою; повертає суму виданих ключів для звіряння """
+    push, pop = heap.push, heap.pop
+    last = total = 0
+    for delta in workload:
+        if delta is None:
+            if len(heap):
+                last = pop()[0]
+                total += last
+        else:
+            push(last + delta)
+    return total
+
+
+def bench_engines(sizes):
+    """
+    Вимірює пропускну здатність реалізацій куп (тисяч операцій за секунду).
+
+    Args:
+    sizes (list): Розміри купи для навантажень pop і mixed (і кількість операцій push).
+    """
+    check_engines()
+    kinds = ["push", "pop", "mixed"]
+    print(f"{'розмір':>9} {'купа':>8} {'build, с':>9} " +
+          " ".join(f"{kind + ', тис/с':>14}" for kind in kinds))
+    for size in sizes:
+        rng = random.Random(size)
+        initial = [rng.randrange(1000) for _ in range(size)]
+        workloads = {kind: engine_workload(kind, size) for kind in kinds}
+        totals = {}
+        for name, engine in ENGINES.items():
+            begin = time.perf_counter()
+            engine.build(initial)
+            build = time.perf_counter() - begin
+            rates = []
+            for kind in kinds:
+                heap = engine() if kind == "push" else engine.build(initial)
+                begin = time.perf_counter()
+                total = run_workload(heap, workloads[kind])
+                elapsed = time.perf_counter() - begin
+                # Усі реалізації мають видати однакові ключі
+                assert totals.setdefault(kind, total) == total, (name, kind)
+                rates.append(len(workloads[kind]) / elapsed / 1e3)
+            print(f"{size:>9} {name:>8} {build:9.3f} " +
+                  " ".join(f"{rate:14.0f}" for rate in rates))
+
+
+def violations_loop(heap):
+    """ Усі порушення властивості купи простим циклом на Python (еталон) """
+    return [i for i in range(1, len(heap)) if heap[i] < heap[(i - 1) // 2]]
+
+
+def check_profiler(cases=100, seed=0):
+    """ Звіряє результати й лічильники HeapProfiler з heapq на випадкових операціях """
+    rng = random.Random(seed)
+    profiler = HeapProfiler(enabled=True, validate=True)
+    for _ in range(cases):
+        data = [rng.randrange(100) for _ in range(rng.randrange(50))]
+        heap, reference = list(data), list(data)
+        profiler.heapify(heap)
+        heapq.heapify(reference)
+        for _ in range(100):
+            value = rng.randrange(100)
+            name = rng.choice(["heappush", "heappop", "heappushpop", "heapreplace"])
+            if name in ("heappop", "heapreplace") and not reference:
+                name = "heappush"
+            args = () if name == "heappop" else (value,)
+            assert getattr(profiler, name)(heap, *args) == getattr(heapq, name)(reference, *args)
+            assert heap == reference
+    assert profiler.comparisons > 0 and profiler.swaps > 0
+    assert sum(profiler.calls.values()) == cases * 101
+
+    profiler.enabled = False
+    assert profiler.heappush is heapq.heappush
+
+
+def bench_check(sizes, operations=100_000):
+    """
+    Порівнює векторизовану перевірку купи з циклом на Python і вимірює
+    накладні витрати профілювання операцій heapq.
+
+    Args:
+    sizes (list): Розміри куп.
+    operations (int): Кількість пар push/pop для вимірювання профілювання.
+    """
+    check_profiler()
+    # Кортежі з вкладеними послідовностями різної довжини - звичайні елементи heapq
+    assert first_violation([(0, ["a"]), (1, ["a", "b"])]) is None
+    assert first_violation([(1, (3,)), (0, (1, 2))]) == (0, 1)
+    print(f"{'розмір':>9} {'numpy, мс':>10} {'цикл, мс':>9} "
+          f"{'heapq, мс':>10} {'вимкнено, мс':>13} {'увімкнено, мс':>14}")
+    for size in sizes:
+        heap = random_heap(size)
+        heapq.heapify(heap)
+        # Зміна ключа на місці в середині купи
+        corrupted = list(heap)
+        middle = size // 2
+        corrupted[middle] = -1
+        expected = violations_loop(corrupted)
+        assert find_violations(corrupted).tolist() == expected == [middle]
+        assert first_violation(corrupted) == ((middle - 1) // 2, middle)
+        assert first_violation(heap) is None
+
+        begin = time.perf_counter()
+        find_violations(corrupted)
+        vectorized = time.perf_counter() - begin
+        begin = time.perf_counter()
+        violations_loop(corrupted)
+        loop = time.perf_counter() - begin
+
+        # push/pop над купою розміру size: heapq напряму і через HeapProfiler
+        rng = random.Random(size)
+        values = [rng.randrange(10 * size) for _ in range(operations)]
+        timings = []
+        for profiler, repeats in ((heapq, 3), (HeapProfiler(), 3), (HeapProfiler(enabled=True), 1)):
+            best = float("inf")
+            for _ in range(repeats):
+                work = list(heap)
+                push, pop = profiler.heappush, profiler.heappop
+                begin = time.perf_counter()
+                for value in values:
+                    push(work, value)
+                    pop(work)
+                best = min(best, time.perf_counter() - begin)
+            timings.append(best)
+        print(f"{size:>9} {vectorized * 1e3:10.2f} {loop * 1e3:9.1f} "
+              f"{timings[0] * 1e3:10.1f} {timings[1] * 1e3:13.1f} {timings[2] * 1e3:14.1f}")
+    print(profiler.report())
+
+
+def main():
+    """
+    Розбирає аргументи командного рядка та запускає бенчмарки.
+    """
+    parser = argparse.ArgumentParser(description="Бенчмарки для завдання 4")
+    parser.add_argument("benchmark", choices=["layout", "animation", "window", "engines", "check"], help="який бенчмарк запустити")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1_000, 10_000, 100_000, 1_000_000],
+                        help="розміри куп")
+    parser.add_argument("--render-limit", type=int, default=10_000,
+                        help="максимальний розмір купи для малювання через nx.draw")
+    args = parser.parse_args()
+
+    if args.benchmark == "layout":
+        bench_layout(args.sizes, args.render_limit)
+    elif args.benchmark == "animation":
+        bench_animation(args.sizes)
+    elif args.benchmark == "window":
+        bench_window(args.sizes, args.render_limit)
+    elif args.benchmark == "engines":
+        bench_engines(args.sizes)
+    elif args.benchmark == "check":
+        bench_check(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,16 +6,141 @@
 розробити алгоритм сортування для однозв'язного списку, наприклад, сортування вставками або злиттям;
 написати функцію, що об'єднує два відсортовані однозв'язні списки в один відсортований список."""
 
+import heapq
+import operator
+from array import array
+
 class Node:
     """ Клас, що представляє вузол однозв'язного списку. """
+    __slots__ = ("data", "next")  # Без __dict__ вузол займає значно менше пам'яті
+
     def __init__(self, data=None):
         self.data = data  # Дані вузла
         self.next = None  # Посилання на наступний вузол
 
 class LinkedList:
     """ Клас, що представляє однозв'язний список. """
-    def __init__(self):
+    def __init__(self, indexed=False):
+        """
+        :param indexed: Якщо True, список підтримує хеш-індекс для пошуку та
+            видалення за значенням в середньому за O(1). Значення мають бути хешованими.
+        """
         self.head = None  # Голова списку (перший елемент)
+        self.tail = None  # Хвіст списку (останній елемент)
+        self.size = 0  # Кількість вузлів у списку
+        self.indexed = indexed  # Чи підтримується хеш-індекс
+        if indexed:
+            self._rebuild_index()
+
+    def _rebuild_index(self):
+        """
+        Перебудовує хеш-індекс з нуля за один прохід по списку - O(n).
+
+        Індекс складається з трьох словників:
+        - _index: значення -> перший вузол з цим значенням;
+        - _prev: вузол -> попередній вузол (None для голови);
+        - _counts: значення -> кількість вузлів з цим значенням.
+        """
+        self._index = {}
+        self._prev = {}
+        self._counts = {}
+        self._register_chain(self.head, None)
+
+    def _register_chain(self, node, prev):
+        """
+        Додає до індексу ланцюжок вузлів, що йде в кінці списку.
+
+        :param node: Перший вузол ланцюжка
+        :param prev: Вузол списку, що стоїть перед ланцюжком
+        """
+        index, prevs, counts = self._index, self._prev, self._counts
+        while node:
+            prevs[node] = prev
+            data = node.data
+            if data in counts:
+                counts[data] += 1
+            else:
+                counts[data] = 1
+                index[data] = node  # Перше входження значення
+            prev = node
+            node = node.next
+
+    def _clear(self):
+        """ Робить список порожнім, не змінюючи самі вузли. """
+        self.head = self.tail = None
+        self.size = 0
+        if self.indexed:
+            self._rebuild_index()
+
+    def __len__(self):
+        """ Повертає кількість вузлів у списку за O(1). """
+        return self.size
+
+    def __iter__(self):
+        """ Повертає ітератор по даних вузлів від голови до хвоста. """
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    @classmethod
+    def from_iterable(cls, iterable, indexed=False):
+        """
+        Створює список з елементів ітерованого об'єкта за один лінійний прохід.
+
+        :param iterable: Ітерований об'єкт з даними для вузлів
+        :param indexed: Чи підтримувати хеш-індекс у новому списку
+        :return: Новий зв'язний список
+        """
+        llist = cls(indexed)
+        llist.extend(iterable)
+        return llist
+
+    def to_list(self):
+        """
+        Повертає дані всіх вузлів у вигляді списку Python.
+
+        :return: Список даних від голови до хвоста
+        """
+        return list(self)
+
+    def extend(self, other):
+        """
+        Додає в кінець списку елементи іншого списку або ітерованого об'єкта.
+
+        Алгоритм:
+        1. Якщо other - інший LinkedList, приєднуємо його ланцюжок до хвоста без
+           копіювання вузлів, а сам other стає порожнім.
+        2. Інакше будуємо новий ланцюжок з елементів other і приєднуємо його
+           до хвоста одним присвоєнням.
+
+        Складність - O(k), де k - кількість доданих елементів (O(1) для LinkedList).
+
+        :param other: LinkedList або ітерований об'єкт
+        """
+        if isinstance(other, LinkedList) and other is not self:
+            head, tail, count = other.head, other.tail, other.size
+            other._clear()  # Вузли переходять до цього списку
+        else:
+            dummy = Node()  # Фіктивний вузол для початку нового ланцюжка
+            tail = dummy
+            count = 0
+            for data in other:
+                tail.next = Node(data)
+                tail = tail.next
+                count += 1
+            head = dummy.next
+        if head is None:
+            return  # Нічого додавати
+        prev = self.tail
+        if self.head is None:
+            self.head = head
+        else:
+            self.tail.next = head  # Приєднуємо ланцюжок до хвоста
+        self.tail = tail
+        self.size += count
+        if self.indexed:
+            self._register_chain(head, prev)  # Індексуємо лише нові вузли - O(k)
 
     def insert_at_beginning(self, data):
         """
@@ -31,6 +156,15 @@ class LinkedList:
         new_node = Node(data)
         new_node.next = self.head  # Новий вузол вказує на поточну голову
         self.head = new_node  # Новий вузол стає новою головою
+        if self.tail is None:
+            self.tail = new_node  # У порожньому списку вузол є і хвостом
+        self.size += 1
+        if self.indexed:
+            self._prev[new_node] = None
+            if new_node.next:
+                self._prev[new_node.next] = new_node
+            self._counts[data] = self._counts.get(data, 0) + 1
+            self._index[data] = new_node  # Новий вузол - перше входження значення
 
     def insert_at_end(self, data):
         """
@@ -39,18 +173,20 @@ class LinkedList:
         Алгоритм:
         1. Створюємо новий вузол з переданими даними.
         2. Якщо список порожній, робимо новий вузол головою.
-        3. Інакше, проходимо до кінця списку і додаємо новий вузол.
+        3. Інакше, приєднуємо новий вузол до хвоста списку за O(1).
 
         :param data: Дані для нового вузла
         """
         new_node = Node(data)
+        prev = self.tail
         if self.head is None:
             self.head = new_node  # Якщо список порожній, новий вузол стає головою
-            return
-        last = self.head
-        while last.next:  # Знаходимо останній вузол
-            last = last.next
-        last.next = new_node  # Додаємо новий вузол в кінець
+        else:
+            self.tail.next = new_node  # Додаємо новий вузол в кінець
+        self.tail = new_node
+        self.size += 1
+        if self.indexed:
+            self._register_chain(new_node, prev)
 
     def insert_after(self, prev_node: Node, data):
         """
@@ -70,6 +206,38 @@ class LinkedList:
         new_node = Node(data)
         new_node.next = prev_node.next  # Новий вузол вказує на наступний після prev_node
         prev_node.next = new_node  # prev_node тепер вказує на новий вузол
+        if prev_node is self.tail:
+            self.tail = new_node  # Вставка після хвоста робить новий вузол хвостом
+        self.size += 1
+        if self.indexed:
+            self._index_inserted_after(prev_node, new_node)
+
+    def _index_inserted_after(self, prev_node, new_node):
+        """
+        Оновлює індекс після вставки new_node одразу за prev_node.
+
+        Для нового значення це O(1). Якщо значення вже є у списку, треба
+        з'ясувати, чи стоїть новий вузол перед його першим входженням, тому
+        ми йдемо назад від prev_node по посиланнях на попередні вузли.
+
+        :param prev_node: Вузол, після якого вставлено новий
+        :param new_node: Вставлений вузол
+        """
+        self._prev[new_node] = prev_node
+        if new_node.next:
+            self._prev[new_node.next] = new_node
+        data = new_node.data
+        if data not in self._counts:
+            self._counts[data] = 1
+            self._index[data] = new_node
+            return
+        self._counts[data] += 1
+        first = self._index[data]
+        cur = prev_node
+        while cur is not None and cur is not first:
+            cur = self._prev[cur]
+        if cur is None:
+            self._index[data] = new_node  # Перше входження не стоїть перед новим вузлом
 
     def delete_node(self, key: int):
         """
@@ -82,9 +250,15 @@ class LinkedList:
 
         :param key: Значення вузла для видалення
         """
+        if self.indexed:
+            self._delete_indexed(key)
+            return
         cur = self.head
         if cur and cur.data == key:
             self.head = cur.next  # Якщо видаляємо голову, другий елемент стає головою
+            if self.head is None:
+                self.tail = None  # Список став порожнім
+            self.size -= 1
             cur = None
             return
         prev = None
@@ -94,8 +268,45 @@ class LinkedList:
         if cur is None:
             return  # Елемент не знайдено
         prev.next = cur.next  # Змінюємо посилання, щоб "перестрибнути" видалений вузол
+        if cur is self.tail:
+            self.tail = prev  # Видалили хвіст - попередній вузол стає хвостом
+        self.size -= 1
         cur = None
 
+    def _delete_indexed(self, key):
+        """
+        Видаляє перше входження значення за допомогою хеш-індексу.
+
+        Вузол і його попередник знаходяться за O(1). Якщо у списку лишаються
+        інші вузли з тим самим значенням, шукаємо наступне входження, рухаючись
+        вперед від видаленого вузла.
+
+        :param key: Значення вузла для видалення
+        """
+        cur = self._index.get(key)
+        if cur is None:
+            return  # Елемент не знайдено
+        prev = self._prev.pop(cur)
+        following = cur.next
+        if prev is None:
+            self.head = following  # Видаляємо голову
+        else:
+            prev.next = following  # "Перестрибуємо" видалений вузол
+        if following:
+            self._prev[following] = prev
+        if cur is self.tail:
+            self.tail = prev
+        self.size -= 1
+
+        self._counts[key] -= 1
+        if self._counts[key] == 0:
+            del self._counts[key]
+            del self._index[key]
+        else:
+            while following.data != key:  # Наступне входження гарантовано існує
+                following = following.next
+            self._index[key] = following
+
     def search_element(self, data: int) -> Node | None:
         """
         Шукає вузол з вказаним значенням.
@@ -108,6 +319,8 @@ class LinkedList:
         :param data: Значення для пошуку
         :return: Знайдений вузол або None, якщо не знайдено
         """
+        if self.indexed:
+            return self._index.get(data)  # Пошук за хеш-індексом - O(1)
         cur = self.head
         while cur:
             if cur.data == data:
@@ -142,14 +355,27 @@ class LinkedList:
            - Рухаємо prev і current на один крок вперед
         3. В кінці, встановлюємо голову списку на останній вузол (який став першим)
         """
+        self.tail = self.head  # Колишня голова стане хвостом
+        self.head = self._reverse_chain(self.head)  # Оновлюємо голову списку
+        if self.indexed:
+            self._rebuild_index()  # Змінились попередники та перші входження
+
+    @staticmethod
+    def _reverse_chain(head):
+        """
+        Реверсує ланцюжок вузлів, що закінчується на None.
+
+        :param head: Голова ланцюжка
+        :return: Нова голова ланцюжка (колишній останній вузол)
+        """
         prev = None
-        current = self.head
+        current = head
         while current:
             next_node = current.next  # Зберігаємо посилання на наступний вузол
             current.next = prev  # Змінюємо напрямок зв'язку
             prev = current  # Рухаємо prev
             current = next_node  # Рухаємо current
-        self.head = prev  # Оновлюємо голову списку
+        return prev
 
     def insertion_sort(self):
         """
@@ -187,6 +413,179 @@ class LinkedList:
                 else:
                     # Елемент вже на правильній позиції
                     sorted_end = sorted_end.next
+        self.tail = sorted_end  # Кінець відсортованої частини - хвіст списку
+        if self.indexed:
+            self._rebuild_index()
+
+    def merge_sort(self, key=None, reverse=False):
+        """
+        Сортує зв'язний список висхідним (ітеративним) сортуванням злиттям.
+
+        Алгоритм:
+        1. Беремо кількість вузлів у списку з лічильника size.
+        2. Для ширини блоку 1, 2, 4, ... проходимо по списку:
+           - Відрізаємо два сусідні блоки заданої ширини
+           - Зливаємо їх, перев'язуючи вузли, і приєднуємо до вже обробленої частини
+        3. Повторюємо, поки ширина блоку менша за довжину списку.
+
+        Сортування стабільне, не використовує рекурсію і потребує O(1) додаткової
+        пам'яті, загальна складність - O(n log n).
+
+        :param key: Функція, що обчислює ключ порівняння (як у sorted())
+        :param reverse: Якщо True, сортує за спаданням (як у sorted())
+        """
+        if not self.head or not self.head.next:
+            return  # Список пустий або містить лише один елемент
+
+        length = self.size  # Кількість вузлів відома без обходу
+        dummy = Node()  # Фіктивний вузол перед головою списку
+        dummy.next = self.head
+        width = 1
+        while width < length:
+            prev = dummy  # Хвіст уже обробленої частини списку
+            current = dummy.next
+            while current:
+                left = current
+                right = self._split(left, width)  # Відрізаємо лівий блок
+                current = self._split(right, width)  # Відрізаємо правий блок
+                head, tail = self._merge_nodes(left, right, key, reverse)
+                prev.next = head  # Приєднуємо злитий блок
+                prev = tail
+            width *= 2
+        self.head = dummy.next  # Оновлюємо голову списку
+        self.tail = prev  # Хвіст останнього злитого блоку - хвіст списку
+        if self.indexed:
+            self._rebuild_index()
+
+    def natural_merge_sort(self, key=None, reverse=False):
+        """
+        Сортує зв'язний список природним (адаптивним) сортуванням злиттям.
+
+        Алгоритм:
+        1. Розбиваємо список на вже впорядковані серії (runs):
+           - неспадні серії залишаємо як є;
+           - строго спадні серії реверсуємо на місці через _reverse_chain.
+        2. Зливаємо сусідні серії попарно через _merge_nodes, поки не залишиться одна.
+
+        Для вже відсортованого списку це один прохід - O(n), для випадкових даних -
+        O(n log n). Спадні серії строгі, тому сортування залишається стабільним.
+
+        :param key: Функція, що обчислює ключ порівняння (як у sorted())
+        :param reverse: Якщо True, сортує за спаданням (як у sorted())
+        """
+        if not self.head or not self.head.next:
+            return  # Список пустий або містить лише один елемент
+
+        # before(a, b) - чи має a стояти строго раніше за b
+        if key is None:
+            before = operator.gt if reverse else operator.lt
+        elif reverse:
+            before = lambda a, b: key(a) > key(b)
+        else:
+            before = lambda a, b: key(a) < key(b)
+
+        runs = []  # Серії у вигляді пар (голова, хвіст)
+        node = self.head
+        while node:
+            run_head = node
+            following = node.next
+            if following is not None and before(following.data, node.data):
+                # Строго спадна серія - доходимо до її кінця і реверсуємо
+                while following is not None and before(following.data, node.data):
+                    node = following
+                    following = node.next
+                node.next = None
+                runs.append((self._reverse_chain(run_head), run_head))
+            else:
+                # Неспадна серія - доходимо до її кінця
+                while following is not None and not before(following.data, node.data):
+                    node = following
+                    following = node.next
+                node.next = None
+                runs.append((run_head, node))
+            node = following
+
+        while len(runs) > 1:
+            # Зливаємо сусідні серії, зберігаючи їхній порядок
+            merged = [self._merge_nodes(runs[i][0], runs[i + 1][0], key, reverse)
+                      for i in range(0, len(runs) - 1, 2)]
+            if len(runs) % 2:
+                merged.append(runs[-1])  # Непарна серія переходить у наступний раунд
+            runs = merged
+        self.head, self.tail = runs[0]
+        if self.indexed:
+            self._rebuild_index()
+
+    @staticmethod
+    def _split(head, count):
+        """
+        Відрізає від ланцюжка перші count вузлів.
+
+        :param head: Голова ланцюжка
+        :param count: Кількість вузлів, що залишаються в першій частині
+        :return: Голова решти ланцюжка або None
+        """
+        for _ in range(count - 1):
+            if head is None:
+                return None
+            head = head.next
+        if head is None:
+            return None
+        rest = head.next
+        head.next = None  # Розриваємо зв'язок між частинами
+        return rest
+
+    @staticmethod
+    def _merge_nodes(list1, list2, key=None, reverse=False):
+        """
+        Зливає два відсортовані ланцюжки вузлів, перев'язуючи посилання.
+
+        Алгоритм:
+        1. Створюємо фіктивний вузол як початок результуючого ланцюжка.
+        2. Порівнюємо вузли з обох ланцюжків і приєднуємо той, що має йти першим.
+           При рівних ключах першим іде вузол з list1, тому злиття стабільне.
+        3. Приєднуємо залишок і доходимо до його кінця, щоб знайти хвіст.
+
+        :param list1: Голова першого відсортованого ланцюжка
+        :param list2: Голова другого відсортованого ланцюжка
+        :param key: Функція, що обчислює ключ порівняння
+        :param reverse: Якщо True, ланцюжки відсортовані за спаданням
+        :return: Кортеж (голова, хвіст) об'єднаного ланцюжка
+        """
+        dummy = Node()  # Фіктивний вузол для початку результуючого ланцюжка
+        tail = dummy  # Хвіст результуючого ланцюжка
+
+        if key is None and not reverse:
+            # Найчастіший випадок - порівнюємо дані напряму
+            while list1 and list2:
+                if list1.data <= list2.data:
+                    tail.next = list1
+                    list1 = list1.next
+                else:
+                    tail.next = list2
+                    list2 = list2.next
+                tail = tail.next
+        else:
+            if key is None:
+                key = lambda data: data
+            while list1 and list2:
+                key1, key2 = key(list1.data), key(list2.data)
+                # Беремо вузол з list2 лише тоді, коли він строго має йти раніше
+                if (key2 > key1) if reverse else (key2 < key1):
+                    tail.next = list2
+                    list2 = list2.next
+                else:
+                    tail.next = list1
+                    list1 = list1.next
+                tail = tail.next
+
+        # Додаємо залишок елементів, якщо вони є
+        tail.next = list1 if list1 else list2
+        if dummy.next is None:
+            return None, None  # Обидва ланцюжки порожні
+        while tail.next:  # Знаходимо хвіст об'єднаного ланцюжка
+            tail = tail.next
+        return dummy.next, tail
 
     @staticmethod
     def merge_sorted_lists(list1, list2):
@@ -204,76 +603,396 @@ class LinkedList:
         :param list2: Голова другого відсортованого списку
         :return: Новий об'єднаний відсортований список
         """
-        dummy = Node(0)  # Фіктивний вузол для початку результуючого списку
-        tail = dummy  # Хвіст результуючого списку
+        merged_list = LinkedList()
+        merged_list.head, merged_list.tail = LinkedList._merge_nodes(list1, list2)
+        current = merged_list.head
+        while current:  # Рахуємо вузли об'єднаного списку
+            merged_list.size += 1
+            current = current.next
+        return merged_list
+
+    @staticmethod
+    def merge_k_sorted_lists(heads):
+        """
+        Об'єднує довільну кількість відсортованих списків в один відсортований список.
+
+        Алгоритм:
+        1. Кладемо в мінімальну купу (heapq) перший вузол кожного джерела.
+        2. Виймаємо з купи найменший вузол, приєднуємо його до результату і
+           кладемо в купу наступний вузол того самого джерела.
+        3. Повторюємо, поки купа не спорожніє.
+
+        Вузли з головами та LinkedList перев'язуються без копіювання (списки-джерела
+        стають порожніми), а для лінивих ітераторів вузли створюються по мірі
+        читання значень. При рівних значеннях першим іде елемент джерела, що
+        стоїть раніше, тому злиття стабільне. Складність - O(n log k).
+
+        :param heads: Голови відсортованих списків, LinkedList або відсортовані ітератори
+        :return: Новий об'єднаний відсортований список
+        """
+        heap = []  # Елементи купи: (дані, номер джерела, вузол)
+        iterators = []  # Ітератор вузлів для лінивих джерел або None для ланцюжків
+        for index, source in enumerate(heads):
+            if isinstance(source, LinkedList):
+                node = source.head
+                source._clear()  # Вузли переходять до результату
+                iterator = None
+            elif source is None or isinstance(source, Node):
+                node, iterator = source, None
+            else:
+                iterator = (Node(data) for data in source)
+                node = next(iterator, None)
+            iterators.append(iterator)
+            if node is not None:
+                heap.append((node.data, index, node))
+        heapq.heapify(heap)
 
-        while list1 and list2:
-            if list1.data <= list2.data:
-                tail.next = list1
-                list1 = list1.next
+        merged_list = LinkedList()
+        dummy = Node()  # Фіктивний вузол для початку результуючого списку
+        tail = dummy
+        count = 0
+        while heap:
+            _, index, node = heap[0]
+            tail.next = node  # Приєднуємо найменший вузол до результату
+            tail = node
+            count += 1
+            iterator = iterators[index]
+            following = node.next if iterator is None else next(iterator, None)
+            if following is None:
+                heapq.heappop(heap)  # Джерело вичерпано
             else:
-                tail.next = list2
-                list2 = list2.next
-            tail = tail.next
-        
+                heapq.heapreplace(heap, (following.data, index, following))
+        tail.next = None
+        merged_list.head = dummy.next
+        merged_list.tail = tail if count else None
+        merged_list.size = count
+        return merged_list
+
+    @staticmethod
+    def iter_merge_k_sorted(sources):
+        """
+        Ліниво об'єднує відсортовані джерела, повертаючи значення по одному.
+
+        Результуючий список не будується і вузли не змінюються, тому в пам'яті
+        одночасно знаходиться лише по одному елементу з кожного джерела.
+
+        :param sources: Голови відсортованих списків, LinkedList або відсортовані ітератори
+        :return: Генератор значень у відсортованому порядку
+        """
+        iterables = []
+        for source in sources:
+            if source is None or isinstance(source, Node):
+                source = LinkedList._iter_chain(source)
+            iterables.append(source)
+        return heapq.merge(*iterables)
+
+    @staticmethod
+    def _iter_chain(node):
+        """
+        Повертає ітератор по даних ланцюжка вузлів, починаючи з node.
+
+        :param node: Голова ланцюжка
+        """
+        while node:
+            yield node.data
+            node = node.next
+
+NIL = -1  # Індекс-заглушка, що позначає відсутність вузла в ArrayLinkedList
+
+class ArrayLinkedList:
+    """
+    Однозв'язний список, що зберігає вузли в паралельних типізованих масивах.
+
+    Замість окремого об'єкта Node для кожного елемента дані та посилання
+    зберігаються в масивах array: data[i] - дані i-го вузла, next[i] - індекс
+    наступного вузла (або NIL). Звільнені комірки об'єднуються у список вільних
+    комірок (free-list) через той самий масив next і використовуються повторно.
+    Вузол ідентифікується своїм індексом у масивах.
+    """
+    def __init__(self, typecode='q'):
+        """
+        :param typecode: Код типу масиву даних (за замовчуванням 'q' - 64-бітні цілі)
+        """
+        self.data = array(typecode)  # Дані вузлів
+        self.next = array('q')  # Індекси наступних вузлів
+        self.head = NIL  # Індекс голови списку
+        self.tail = NIL  # Індекс хвоста списку
+        self.size = 0  # Кількість вузлів у списку
+        self.free = NIL  # Голова списку вільних комірок
+
+    def __len__(self):
+        """ Повертає кількість вузлів у списку за O(1). """
+        return self.size
+
+    def __iter__(self):
+        """ Повертає ітератор по даних вузлів від голови до хвоста. """
+        values, next_ = self.data, self.next
+        current = self.head
+        while current != NIL:
+            yield values[current]
+            current = next_[current]
+
+    @classmethod
+    def from_iterable(cls, iterable, typecode='q'):
+        """
+        Створює список з елементів ітерованого об'єкта за один лінійний прохід.
+
+        :param iterable: Ітерований об'єкт з даними для вузлів
+        :param typecode: Код типу масиву даних
+        :return: Новий ArrayLinkedList
+        """
+        llist = cls(typecode)
+        llist.extend(iterable)
+        return llist
+
+    def to_list(self):
+        """
+        Повертає дані всіх вузлів у вигляді списку Python.
+
+        :return: Список даних від голови до хвоста
+        """
+        return list(self)
+
+    def extend(self, other):
+        """
+        Додає в кінець списку елементи іншого списку або ітерованого об'єкта за O(k).
+
+        Вузли іншого ArrayLinkedList живуть в інших масивах, тому їхні значення
+        копіюються.
+
+        :param other: ArrayLinkedList або ітерований об'єкт
+        """
+        if other is self:
+            other = self.to_list()  # Не ітеруємо список, який змінюємо
+        for data in other:
+            self.insert_at_end(data)
+
+    def _allocate(self, data):
+        """
+        Виділяє комірку для нового вузла, повторно використовуючи вільні комірки.
+
+        :param data: Дані для нового вузла
+        :return: Індекс нового вузла
+        """
+        index = self.free
+        if index != NIL:
+            self.free = self.next[index]  # Знімаємо комірку зі списку вільних
+            self.data[index] = data
+            self.next[index] = NIL
+        else:
+            index = len(self.next)  # Вільних комірок немає - розширюємо масиви
+            self.data.append(data)
+            self.next.append(NIL)
+        return index
+
+    def _release(self, index):
+        """
+        Повертає комірку вузла до списку вільних комірок.
+
+        :param index: Індекс видаленого вузла
+        """
+        self.next[index] = self.free
+        self.free = index
+
+    def insert_at_beginning(self, data):
+        """
+        Вставляє новий вузол на початок списку.
+
+        :param data: Дані для нового вузла
+        """
+        index = self._allocate(data)
+        self.next[index] = self.head  # Новий вузол вказує на поточну голову
+        self.head = index
+        if self.tail == NIL:
+            self.tail = index  # У порожньому списку вузол є і хвостом
+        self.size += 1
+
+    def insert_at_end(self, data):
+        """
+        Вставляє новий вузол в кінець списку за O(1).
+
+        :param data: Дані для нового вузла
+        """
+        index = self._allocate(data)
+        if self.head == NIL:
+            self.head = index  # Якщо список порожній, новий вузол стає головою
+        else:
+            self.next[self.tail] = index  # Додаємо новий вузол в кінець
+        self.tail = index
+        self.size += 1
+
+    def insert_after(self, prev_index, data):
+        """
+        Вставляє новий вузол після вказаного вузла.
+
+        :param prev_index: Індекс вузла, після якого потрібно вставити новий
+        :param data: Дані для нового вузла
+        """
+        if prev_index is None or prev_index == NIL:
+            print("Попереднього вузла не існує.")
+            return
+        index = self._allocate(data)
+        self.next[index] = self.next[prev_index]
+        self.next[prev_index] = index
+        if prev_index == self.tail:
+            self.tail = index  # Вставка після хвоста робить новий вузол хвостом
+        self.size += 1
+
+    def delete_node(self, key):
+        """
+        Видаляє перший вузол з вказаним значенням і звільняє його комірку.
+
+        :param key: Значення вузла для видалення
+        """
+        data, next_ = self.data, self.next
+        prev = NIL
+        cur = self.head
+        while cur != NIL and data[cur] != key:
+            prev = cur
+            cur = next_[cur]
+        if cur == NIL:
+            return  # Елемент не знайдено
+        if prev == NIL:
+            self.head = next_[cur]  # Видаляємо голову
+        else:
+            next_[prev] = next_[cur]  # "Перестрибуємо" видалений вузол
+        if cur == self.tail:
+            self.tail = prev
+        self.size -= 1
+        self._release(cur)
+
+    def search_element(self, data):
+        """
+        Шукає вузол з вказаним значенням.
+
+        :param data: Значення для пошуку
+        :return: Індекс знайденого вузла або None, якщо не знайдено
+        """
+        values, next_ = self.data, self.next
+        cur = self.head
+        while cur != NIL:
+            if values[cur] == data:
+                return cur
+            cur = next_[cur]
+        return None
+
+    def print_list(self):
+        """ Виводить всі елементи списку. """
+        values, next_ = self.data, self.next
+        cur = self.head
+        while cur != NIL:
+            print(values[cur], end=" ")
+            cur = next_[cur]
+        print()
+
+    def reverse(self):
+        """ Реверсує список, змінюючи індекси наступних вузлів. """
+        next_ = self.next
+        self.tail = self.head  # Колишня голова стане хвостом
+        prev = NIL
+        current = self.head
+        while current != NIL:
+            next_node = next_[current]  # Зберігаємо індекс наступного вузла
+            next_[current] = prev  # Змінюємо напрямок зв'язку
+            prev = current
+            current = next_node
+        self.head = prev
+
+    @staticmethod
+    def merge_sorted_lists(list1, list2):
+        """
+        Об'єднує два відсортовані списки в новий відсортований список.
+
+        Вузли різних ArrayLinkedList живуть у різних масивах, тому, на відміну
+        від LinkedList, значення копіюються в нові масиви результату.
+
+        :param list1: Перший відсортований ArrayLinkedList
+        :param list2: Другий відсортований ArrayLinkedList
+        :return: Новий об'єднаний відсортований ArrayLinkedList
+        """
+        merged_list = ArrayLinkedList(list1.data.typecode)
+        data1, next1, cur1 = list1.data, list1.next, list1.head
+        data2, next2, cur2 = list2.data, list2.next, list2.head
+        while cur1 != NIL and cur2 != NIL:
+            if data1[cur1] <= data2[cur2]:
+                merged_list.insert_at_end(data1[cur1])
+                cur1 = next1[cur1]
+            else:
+                merged_list.insert_at_end(data2[cur2])
+                cur2 = next2[cur2]
         # Додаємо залишок елементів, якщо вони є
-        if list1:
-            tail.next = list1
-        if list2:
-            tail.next = list2
-        
-        merged_list = LinkedList()
-        merged_list.head = dummy.next  # Пропускаємо фіктивний вузол
+        while cur1 != NIL:
+            merged_list.insert_at_end(data1[cur1])
+            cur1 = next1[cur1]
+        while cur2 != NIL:
+            merged_list.insert_at_end(data2[cur2])
+            cur2 = next2[cur2]
         return merged_list
 
 # Приклад використання
-
-print("Демонстрація роботи з однозв'язним списком\n")
-
-# Створення та заповнення першого списку
-print("Створення першого списку:")
-llist1 = LinkedList()
-llist1.insert_at_end(3)
-llist1.insert_at_end(1)
-llist1.insert_at_end(15)
-print("Перший список:")
-llist1.print_list()
-
-# Створення та заповнення другого списку
-print("\nСтворення другого списку:")
-llist2 = LinkedList()
-llist2.insert_at_end(9)
-llist2.insert_at_end(7)
-llist2.insert_at_end(20)
-print("Другий список:")
-llist2.print_list()
-
-# Реверсування першого списку
-print("\nРеверсування першого списку:")
-llist1.reverse()
-print("Перший список після реверсування:")
-llist1.print_list()
-
-# Реверсування другого списку
-print("\nРеверсування другого списку:")
-llist2.reverse()
-print("Другий список після реверсування:")
-llist2.print_list()
-
-# Сортування першого списку
-print("\nСортування першого списку:")
-llist1.insertion_sort()
-print("Перший список після сортування:")
-llist1.print_list()
-
-# Сортування другого списку
-print("\nСортування другого списку:")
-llist2.insertion_sort()
-print("Другий список після сортування:")
-llist2.print_list()
-
-# Об'єднання відсортованих списків
-print("\nОб'єднання відсортованих списків:")
-merged_list = LinkedList.merge_sorted_lists(llist1.head, llist2.head)
-print("Об'єднаний відсортований список:")
-merged_list.print_list()
+if __name__ == "__main__":
+    print("Демонстрація роботи з однозв'язним списком\n")
+
+    # Створення та заповнення першого списку
+    print("Створення першого списку:")
+    llist1 = LinkedList()
+    llist1.insert_at_end(3)
+    llist1.insert_at_end(1)
+    llist1.insert_at_end(15)
+    print("Перший список:")
+    llist1.print_list()
+
+    # Створення та заповнення другого списку
+    print("\nСтворення другого списку:")
+    llist2 = LinkedList()
+    llist2.insert_at_end(9)
+    llist2.insert_at_end(7)
+    llist2.insert_at_end(20)
+    print("Другий список:")
+    llist2.print_list()
+
+    # Реверсування першого списку
+    print("\nРеверсування першого списку:")
+    llist1.reverse()
+    print("Перший список після реверсування:")
+    llist1.print_list()
+
+    # Реверсування другого списку
+    print("\nРеверсування другого списку:")
+    llist2.reverse()
+    print("Другий список після реверсування:")
+    llist2.print_list()
+
+    # Сортування першого списку
+    print("\nСортування першого списку:")
+    llist1.insertion_sort()
+    print("Перший список після сортування:")
+    llist1.print_list()
+
+    # Сортування другого списку
+    print("\nСортування другого списку:")
+    llist2.insertion_sort()
+    print("Другий список після сортування:")
+    llist2.print_list()
+
+    # Об'єднання відсортованих списків
+    print("\nОб'єднання відсортованих списків:")
+    merged_list = LinkedList.merge_sorted_lists(llist1.head, llist2.head)
+    print("Об'єднаний відсортований список:")
+    merged_list.print_list()
+
+    # Сортування злиттям за спаданням
+    print("\nСортування об'єднаного списку злиттям за спаданням:")
+    merged_list.merge_sort(reverse=True)
+    print("Об'єднаний список після сортування:")
+    merged_list.print_list()
+
+    # Об'єднання кількох відсортованих списків за допомогою купи
+    print("\nОб'єднання трьох відсортованих джерел:")
+    merged_k = LinkedList.merge_k_sorted_lists([
+        LinkedList.from_iterable([1, 5, 9]),
+        LinkedList.from_iterable([2, 6]),
+        iter([0, 3, 4, 10]),
+    ])
+    print("Об'єднаний відсортований список:")
+    merged_k.print_list()
@@ -7,29 +7,49 @@
 """
 
 import turtle
-import math
 
-def pythagoras_tree(t, order, size):
-    """ Малює дерево Піфагора заданого порядку рекурсії """
+from task_2_engine import DEFAULT_ANGLE, DEFAULT_SCALE, iter_segment_batches
+
+def pythagoras_tree(t, order, size, angle=DEFAULT_ANGLE, scale=DEFAULT_SCALE):
+    """
+    Малює дерево Піфагора заданого порядку рекурсії.
+    angle - кут відхилення гілок (за замовчуванням 45 градусів),
+    scale - коефіцієнт зменшення гілок (за замовчуванням 1/sqrt(2)).
+    """
     # Базовий випадок: якщо порядок рекурсії дорівнює 0, завершуємо виконання
     if order == 0:
         return
     # Малюємо основний відрізок (стовбур дерева)
     t.forward(size)  
-    # Повертаємо ліворуч на 45 градусів для малювання лівої гілки
-    t.left(45)
-    # Рекурсивно малюємо ліву гілку. Розмір зменшується в sqrt(2) разів
-    pythagoras_tree(t, order-1, size/math.sqrt(2))
-    # Повертаємо праворуч на 90 градусів для малювання правої гілки
-    t.right(90)
+    # Повертаємо ліворуч на кут angle для малювання лівої гілки
+    t.left(angle)
+    # Рекурсивно малюємо ліву гілку. Розмір зменшується в 1/scale разів
+    pythagoras_tree(t, order-1, size*scale, angle, scale)
+    # Повертаємо праворуч на подвійний кут для малювання правої гілки
+    t.right(2 * angle)
     # Рекурсивно малюємо праву гілку
-    pythagoras_tree(t, order-1, size/math.sqrt(2))
+    pythagoras_tree(t, order-1, size*scale, angle, scale)
     # Повертаємося в початкове положення
-    t.left(45)
+    t.left(angle)
     t.backward(size)
 
-def draw_pythagoras_tree(order):
-    """ Малює дерево Піфагора заданого порядку рекурсії """
+def draw_segments(t, batches):
+    """ Малює черепашкою готові відрізки, обчислені task_2_engine """
+    for batch in batches:
+        # Переходимо до початку кожного відрізка без малювання і проводимо лінію
+        for x0, y0, x1, y1 in zip(batch.x0.tolist(), batch.y0.tolist(),
+                                  batch.x1.tolist(), batch.y1.tolist()):
+            t.penup()
+            t.goto(x0, y0)
+            t.pendown()
+            t.goto(x1, y1)
+
+def draw_pythagoras_tree(order, use_engine=False, angle=DEFAULT_ANGLE, scale=DEFAULT_SCALE):
+    """
+    Малює дерево Піфагора заданого порядку рекурсії з кутом angle і масштабом scale.
+    Якщо use_engine=True, відрізки обчислюються без рекурсії в task_2_engine,
+    а черепашка лише малює їх з вимкненою анімацією.
+    """
     # Налаштування вікна
     window = turtle.Screen()
     window.setup(800, 600)
@@ -45,11 +65,17 @@ def draw_pythagoras_tree(order):
     t.pendown()
 
     # Малюємо дерево Піфагора
-    pythagoras_tree(t, order, 100)
+    if use_engine:
+        window.tracer(0)  # Вимикаємо анімацію і оновлюємо екран один раз у кінці
+        draw_segments(t, iter_segment_batches(order, 100, angle, scale, start=(0, -200)))
+        window.update()
+    else:
+        pythagoras_tree(t, order, 100, angle, scale)
 
     # Утримуємо вікно відкритим
     window.mainloop()
 
-# Запитуємо користувача про рівень рекурсії
-level = int(input("Введіть рівень рекурсії для дерева Піфагора (рекомендовано 1-10): "))
-draw_pythagoras_tree(level)
+if __name__ == "__main__":
+    # Запитуємо користувача про рівень рекурсії
+    level = int(input("Введіть рівень рекурсії для дерева Піфагора (рекомендовано 1-10): "))
+    draw_pythagoras_tree(level)
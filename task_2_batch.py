@@ -0,0 +1,143 @@
+"""
+Пакетний рендеринг багатьох варіантів дерева Піфагора на кількох ядрах.
+
+Для кожної комбінації порядку, кута і масштабу з сітки параметрів окремий
+процес із ProcessPoolExecutor обчислює відрізки та сам записує файл, тому
+назад до головного процесу передаються лише шляхи до файлів, а не масиви.
+
+Запуск:
+    python task_2_batch.py out --orders 10 12 14 --angles 30 45 60 --scales 0.65 0.7071
+    python task_2_batch.py out --orders 16 --angles 20 25 30 35 --format svg --workers 4
+"""
+
+import argparse
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from task_2_engine import DEFAULT_ANGLE, DEFAULT_SCALE
+from task_2_render import render_to_file
+
+
+def parameter_grid(orders, angles=(DEFAULT_ANGLE,), scales=(DEFAULT_SCALE,)):
+    """
+    Будує всі комбінації параметрів дерева.
+
+    Args:
+    orders (iterable): Порядки рекурсії.
+    angles (iterable): Кути відхилення гілок у градусах.
+    scales (iterable): Коефіцієнти зменшення гілок.
+
+    Returns:
+    list: Список кортежів (order, angle, scale).
+    """
+    return list(itertools.product(orders, angles, scales))
+
+
+def output_path(out_dir, order, angle, scale, fmt="png"):
+    """
+    Формує ім'я вихідного файлу для набору параметрів.
+
+    Args:
+    out_dir (str): Каталог для файлів.
+    order (int): Порядок рекурсії.
+    angle (float): Кут відхилення гілок.
+    scale (float): Коефіцієнт зменшення гілок.
+    fmt (str): Формат файлу ("png" або "svg").
+
+    Returns:
+    str: Шлях до файлу.
+    """
+    return os.path.join(out_dir, f"tree_o{order}_a{angle:g}_s{scale:.4f}.{fmt}")
+
+
+def render_job(job):
+    """
+    Рендерить один варіант дерева у файл (виконується в процесі-виконавці).
+
+    Args:
+    job (tuple): (path, order, size, angle, scale, width, height).
+
+    Returns:
+    tuple: (path, elapsed) - шлях до файлу і час рендерингу в секундах.
+    """
+    start = time.perf_counter()
+    render_to_file(*job)
+    return job[0], time.perf_counter() - start
+
+
+def print_progress(done, total, path, elapsed):
+    """
+    Виводить рядок прогресу пакетного рендерингу.
+
+    Args:
+    done (int): Кількість завершених завдань.
+    total (int): Загальна кількість завдань.
+    path (str): Шлях до щойно записаного файлу.
+    elapsed (float): Час рендерингу цього файлу в секундах.
+    """
+    print(f"[{done}/{total}] {path} ({elapsed:.2f} с)")
+
+
+def render_batch(grid, out_dir, workers=None, fmt="png", size=100, width=800,
+                 height=600, progress=print_progress):
+    """
+    Рендерить усі варіанти з сітки параметрів паралельно.
+
+    Args:
+    grid (list): Кортежі (order, angle, scale), наприклад з parameter_grid.
+    out_dir (str): Каталог для файлів (створюється за потреби).
+    workers (int | None): Кількість процесів; None - кількість ядер.
+    fmt (str): Формат файлів ("png" або "svg").
+    size (float): Довжина стовбура.
+    width, height (int): Розміри зображень у пікселях.
+    progress (callable | None): Функція progress(done, total, path, elapsed).
+
+    Returns:
+    list: Шляхи до записаних файлів у порядку завершення.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(output_path(out_dir, order, angle, scale, fmt), order, size, angle,
+             scale, width, height) for order, angle, scale in grid]
+    paths = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(render_job, job) for job in jobs]
+        for future in as_completed(futures):
+            path, elapsed = future.result()
+            paths.append(path)
+            if progress is not None:
+                progress(len(paths), len(jobs), path, elapsed)
+    return paths
+
+
+def main():
+    """
+    Розбирає аргументи командного рядка та запускає пакетний рендеринг.
+    """
+    parser = argparse.ArgumentParser(description="Пакетний рендеринг дерев Піфагора")
+    parser.add_argument("out_dir", help="каталог для вихідних файлів")
+    parser.add_argument("--orders", type=int, nargs="+", default=[10],
+                        help="порядки рекурсії")
+    parser.add_argument("--angles", type=float, nargs="+", default=[DEFAULT_ANGLE],
+                        help="кути відхилення гілок у градусах")
+    parser.add_argument("--scales", type=float, nargs="+", default=[DEFAULT_SCALE],
+                        help="коефіцієнти зменшення гілок")
+    parser.add_argument("--format", choices=["png", "svg"], default="png",
+                        help="формат файлів")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="кількість процесів (за замовчуванням - кількість ядер)")
+    parser.add_argument("--size", type=float, default=100, help="довжина стовбура")
+    parser.add_argument("--width", type=int, default=800, help="ширина в пікселях")
+    parser.add_argument("--height", type=int, default=600, help="висота в пікселях")
+    args = parser.parse_args()
+
+    grid = parameter_grid(args.orders, args.angles, args.scales)
+    start = time.perf_counter()
+    render_batch(grid, args.out_dir, args.workers, args.format, args.size,
+                 args.width, args.height)
+    print(f"Готово. Файлів: {len(grid)}, час: {time.perf_counter() - start:.2f} с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Обчислювальне ядро для фрактала "дерево Піфагора" із завдання 2.
+
+Замість рекурсивного малювання черепашкою всі відрізки дерева обчислюються
+у вигляді масивів NumPy: рівень за рівнем, з векторизованими поворотами та
+масштабуванням і явним стеком роботи замість рекурсії. Модуль не імпортує
+turtle, тому результат може споживати будь-який рендерер.
+"""
+
+import math
+from collections import namedtuple
+
+import numpy as np
+
+DEFAULT_ANGLE = 45  # Кут відхилення гілок у градусах
+DEFAULT_SCALE = 1 / math.sqrt(2)  # Коефіцієнт зменшення довжини гілки
+DEFAULT_START = (0.0, -200.0)  # Початкова точка стовбура
+DEFAULT_HEADING = 90.0  # Напрямок стовбура в градусах (вгору)
+
+# Пакет відрізків одного рівня: depth - глибина, x0/y0 - початки, x1/y1 - кінці
+SegmentBatch = namedtuple("SegmentBatch", ["depth", "x0", "y0", "x1", "y1"])
+
+
+def segment_count(order):
+    """
+    Повертає кількість відрізків у дереві заданого порядку.
+
+    Args:
+    order (int): Порядок рекурсії.
+
+    Returns:
+    int: Кількість відрізків (2^order - 1).
+    """
+    return (1 << order) - 1 if order > 0 else 0
+
+
+def iter_segment_batches(order, size, angle=DEFAULT_ANGLE, scale=DEFAULT_SCALE,
+                         start=DEFAULT_START, heading=DEFAULT_HEADING, max_batch=None,
+                         cull=None):
+    """
+    Генерує відрізки дерева Піфагора пакетами масивів NumPy.
+
+    Алгоритм:
+    1. Кладемо на стек стовбур: масиви з однією точкою початку і напрямком.
+    2. Знімаємо пакет зі стеку, векторизовано обчислюємо кінці всіх його відрізків
+       і повертаємо їх.
+    3. Кінці стають початками дочірніх гілок з напрямками ±angle; довжина
+       гілок наступного рівня множиться на scale.
+    4. Якщо дочірній пакет більший за max_batch, кладемо ліві та праві гілки
+       на стек окремо, тож пам'ять обмежена приблизно order * max_batch.
+
+    Якщо задано cull, перед обчисленням кінців викликається
+    cull(depth, length, x, y): вона повертає булеву маску гілок, які треба
+    залишити (разом з їхніми піддеревами), або None, щоб відкинути весь пакет.
+
+    Args:
+    order (int): Порядок рекурсії (кількість рівнів гілок).
+    size (float): Довжина стовбура.
+    angle (float): Кут відхилення гілок у градусах.
+    scale (float): Коефіцієнт зменшення довжини на кожному рівні.
+    start (tuple): Координати початку стовбура.
+    heading (float): Напрямок стовбура в градусах.
+    max_batch (int | None): Максимальний розмір пакета; None - цілий рівень.
+    cull (callable | None): Функція відсікання піддерев.
+
+    Yields:
+    SegmentBatch: Пакет відрізків однієї глибини.
+    """
+    if order <= 0:
+        return
+    delta = math.radians(angle)
+    stack = [(0,
+              np.array([start[0]], dtype=np.float64),
+              np.array([start[1]], dtype=np.float64),
+              np.array([math.radians(heading)], dtype=np.float64))]
+    while stack:
+        depth, x, y, theta = stack.pop()
+        length = size * scale ** depth  # Усі гілки одного рівня мають однакову довжину
+        if cull is not None:
+            keep = cull(depth, length, x, y)
+            if keep is None:
+                continue  # Відкидаємо весь пакет разом з піддеревами
+            x, y, theta = x[keep], y[keep], theta[keep]
+            if not len(x):
+                continue
+        x1 = x + length * np.cos(theta)
+        y1 = y + length * np.sin(theta)
+        yield SegmentBatch(depth, x, y, x1, y1)
+
+        if depth + 1 >= order:
+            continue  # Базовий випадок: найглибший рівень
+        if max_batch is not None and 2 * len(x) > max_batch:
+            # Завеликий пакет - обробляємо ліві та праві гілки окремо
+            stack.append((depth + 1, x1, y1, theta - delta))
+            stack.append((depth + 1, x1, y1, theta + delta))
+        else:
+            stack.append((depth + 1,
+                          np.concatenate((x1, x1)),
+                          np.concatenate((y1, y1)),
+                          np.concatenate((theta + delta, theta - delta))))
+
+
+def pythagoras_segments(order, size, angle=DEFAULT_ANGLE, scale=DEFAULT_SCALE,
+                        start=DEFAULT_START, heading=DEFAULT_HEADING):
+    """
+    Обчислює всі відрізки дерева Піфагора як масиви координат.
+
+    Args:
+    order (int): Порядок рекурсії.
+    size (float): Довжина стовбура.
+    angle (float): Кут відхилення гілок у градусах.
+    scale (float): Коефіцієнт зменшення довжини на кожному рівні.
+    start (tuple): Координати початку стовбура.
+    heading (float): Напрямок стовбура в градусах.
+
+    Returns:
+    tuple: Масиви (x0, y0, x1, y1) довжиною 2^order - 1, впорядковані за рівнями.
+    """
+    total = segment_count(order)
+    x0, y0, x1, y1 = (np.empty(total, dtype=np.float64) for _ in range(4))
+    offset = 0
+    for batch in iter_segment_batches(order, size, angle, scale, start, heading):
+        end = offset + len(batch.x0)
+        x0[offset:end] = batch.x0
+        y0[offset:end] = batch.y0
+        x1[offset:end] = batch.x1
+        y1[offset:end] = batch.y1
+        offset = end
+    return x0, y0, x1, y1
@@ -0,0 +1,177 @@
+"""
+Рівень деталізації (LOD) і відсікання за областю перегляду для дерева Піфагора.
+
+Під час обходу дерева (task_2_engine) відкидаються:
+- гілки, чия довжина на екрані менша за поріг у пікселях, разом з піддеревами;
+- піддерева, обмежувальне коло яких не перетинає область перегляду.
+
+Тому вартість кадру залежить від видимої деталізації, а не від 2^order, і
+можна інтерактивно наближати та пересувати дерево дуже високого порядку.
+
+Запуск інтерактивного режиму (колесо/панель інструментів matplotlib для зуму):
+    python task_2_lod.py --order 40
+"""
+
+import argparse
+from collections import namedtuple
+
+import numpy as np
+
+from task_2_engine import (DEFAULT_ANGLE, DEFAULT_HEADING, DEFAULT_SCALE,
+                           DEFAULT_START, iter_segment_batches)
+
+MAX_BATCH = 1 << 16  # Максимальна кількість відрізків в одному пакеті
+MIN_PIXELS = 1.0  # Гілки, коротші за цей поріг у пікселях, не малюються
+
+# Область перегляду у світових координатах
+Viewport = namedtuple("Viewport", ["min_x", "min_y", "max_x", "max_y"])
+
+
+def subtree_radius(length, depth, order, scale):
+    """
+    Обчислює радіус кола з центром на початку гілки, що містить усе її піддерево.
+
+    Довжини гілок піддерева утворюють геометричну прогресію, тому жодна точка
+    не віддаляється від початку гілки більше ніж на суму цієї прогресії.
+
+    Args:
+    length (float): Довжина гілки.
+    depth (int): Глибина гілки.
+    order (int): Порядок рекурсії.
+    scale (float): Коефіцієнт зменшення довжини на кожному рівні.
+
+    Returns:
+    float: Радіус обмежувального кола.
+    """
+    levels = order - depth
+    if scale == 1:
+        return length * levels
+    return length * (1 - scale ** levels) / (1 - scale)
+
+
+def make_view_cull(viewport, pixels_per_unit, order, scale=DEFAULT_SCALE,
+                   min_pixels=MIN_PIXELS):
+    """
+    Створює функцію відсікання для task_2_engine.iter_segment_batches.
+
+    Args:
+    viewport (Viewport): Видима область у світових координатах.
+    pixels_per_unit (float): Кількість пікселів на одиницю світових координат.
+    order (int): Порядок рекурсії.
+    scale (float): Коефіцієнт зменшення довжини на кожному рівні.
+    min_pixels (float): Мінімальна довжина гілки на екрані в пікселях.
+
+    Returns:
+    callable: Функція cull(depth, length, x, y).
+    """
+    def cull(depth, length, x, y):
+        # LOD: усі гілки пакета однакової довжини, тож перевірка одна на пакет
+        if length * pixels_per_unit < min_pixels:
+            return None
+        radius = subtree_radius(length, depth, order, scale)
+        # Відстань від початку гілки до прямокутника області перегляду
+        dx = np.maximum(np.maximum(viewport.min_x - x, x - viewport.max_x), 0.0)
+        dy = np.maximum(np.maximum(viewport.min_y - y, y - viewport.max_y), 0.0)
+        return dx * dx + dy * dy <= radius * radius
+    return cull
+
+
+def visible_segments(order, size, viewport, pixels_per_unit, angle=DEFAULT_ANGLE,
+                     scale=DEFAULT_SCALE, start=DEFAULT_START, heading=DEFAULT_HEADING,
+                     min_pixels=MIN_PIXELS):
+    """
+    Обчислює лише ті відрізки, що видимі в області перегляду і не дрібніші за поріг.
+
+    Args:
+    order (int): Порядок рекурсії.
+    size (float): Довжина стовбура.
+    viewport (Viewport): Видима область у світових координатах.
+    pixels_per_unit (float): Кількість пікселів на одиницю світових координат.
+    angle (float): Кут відхилення гілок у градусах.
+    scale (float): Коефіцієнт зменшення довжини на кожному рівні.
+    start (tuple): Координати початку стовбура.
+    heading (float): Напрямок стовбура в градусах.
+    min_pixels (float): Мінімальна довжина гілки на екрані в пікселях.
+
+    Returns:
+    np.ndarray: Масив форми (n, 2, 2) з відрізками [[x0, y0], [x1, y1]].
+    """
+    cull = make_view_cull(viewport, pixels_per_unit, order, scale, min_pixels)
+    parts = [np.stack((np.column_stack((batch.x0, batch.y0)),
+                       np.column_stack((batch.x1, batch.y1))), axis=1)
+             for batch in iter_segment_batches(order, size, angle, scale, start, heading,
+                                               max_batch=MAX_BATCH, cull=cull)]
+    if not parts:
+        return np.empty((0, 2, 2))
+    return np.concatenate(parts)
+
+
+def interactive_view(order, size=100, angle=DEFAULT_ANGLE, scale=DEFAULT_SCALE,
+                     min_pixels=MIN_PIXELS):
+    """
+    Відкриває вікно matplotlib з деревом, яке перераховується при кожному
+    наближенні або переміщенні області перегляду.
+
+    Args:
+    order (int): Порядок рекурсії (може бути дуже великим).
+    size (float): Довжина стовбура.
+    angle (float): Кут відхилення гілок у градусах.
+    scale (float): Коефіцієнт зменшення довжини на кожному рівні.
+    min_pixels (float): Мінімальна довжина гілки на екрані в пікселях.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    from task_2_render import tree_bounds
+
+    class LodLines(LineCollection):
+        """
+        Відрізки, що перераховуються перед малюванням, якщо змінилася область
+        перегляду: панорамування міняє обидві межі, тож обробники xlim_changed
+        і ylim_changed перерахували б дерево двічі, а малювання одне на кадр.
+        """
+        view = None
+
+        def draw(self, renderer):
+            x_lo, x_hi = ax.get_xlim()
+            y_lo, y_hi = ax.get_ylim()
+            view = (x_lo, x_hi, y_lo, y_hi, ax.bbox.width)
+            if view != self.view:
+                self.view = view
+                pixels_per_unit = ax.bbox.width / (x_hi - x_lo)
+                self.set_segments(visible_segments(order, size, Viewport(x_lo, y_lo, x_hi, y_hi),
+                                                   pixels_per_unit, angle, scale,
+                                                   min_pixels=min_pixels))
+            super().draw(renderer)
+
+    fig, ax = plt.subplots(figsize=(10, 8))
+    ax.set_aspect("equal")
+    ax.set_title("Дерево Піфагора")
+    ax.add_collection(LodLines([], linewidths=0.5, colors="black"))
+    # Межі дерева оцінюємо за невеликим порядком - глибші рівні їх майже не змінюють
+    min_x, min_y, max_x, max_y = tree_bounds(min(order, 14), size, angle, scale)
+    ax.set_xlim(min_x, max_x)
+    ax.set_ylim(min_y, max_y)
+    plt.show()
+
+
+def main():
+    """
+    Розбирає аргументи командного рядка та відкриває інтерактивний перегляд.
+    """
+    parser = argparse.ArgumentParser(description="Інтерактивний перегляд дерева Піфагора")
+    parser.add_argument("--order", type=int, default=30, help="порядок рекурсії")
+    parser.add_argument("--size", type=float, default=100, help="довжина стовбура")
+    parser.add_argument("--angle", type=float, default=DEFAULT_ANGLE,
+                        help="кут відхилення гілок у градусах")
+    parser.add_argument("--scale", type=float, default=DEFAULT_SCALE,
+                        help="коефіцієнт зменшення довжини гілок")
+    parser.add_argument("--min-pixels", type=float, default=MIN_PIXELS,
+                        help="мінімальна довжина гілки на екрані в пікселях")
+    args = parser.parse_args()
+
+    interactive_view(args.order, args.size, args.angle, args.scale, args.min_pixels)
+
+
+if __name__ == "__main__":
+    main()
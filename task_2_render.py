@@ -0,0 +1,220 @@
+"""
+Рендеринг дерева Піфагора без вікна: у файли SVG і PNG.
+
+Відрізки беруться пакетами з task_2_engine і одразу записуються у файл
+(SVG) або растеризуються у масив пікселів (PNG), тому пікова пам'ять
+обмежена розміром зображення і пакета, а не кількістю відрізків. Модуль
+не імпортує turtle і tkinter.
+
+Запуск:
+    python task_2_render.py 12 tree.png
+    python task_2_render.py 16 tree.svg --size 100 --angle 30 --width 1600 --height 1200
+"""
+
+import argparse
+import math
+import os
+
+import numpy as np
+import matplotlib.image
+
+from task_2_engine import (DEFAULT_ANGLE, DEFAULT_HEADING, DEFAULT_SCALE,
+                           DEFAULT_START, iter_segment_batches)
+
+MAX_BATCH = 1 << 16  # Максимальна кількість відрізків в одному пакеті
+MAX_POINTS = 1 << 20  # Максимальна кількість точок растеризації за один крок
+MARGIN = 10  # Відступ від краю зображення в пікселях
+
+
+def tree_bounds(order, size, angle=DEFAULT_ANGLE, scale=DEFAULT_SCALE,
+                start=DEFAULT_START, heading=DEFAULT_HEADING):
+    """
+    Обчислює межі дерева за один потоковий прохід по відрізках.
+
+    Args:
+    order (int): Порядок рекурсії.
+    size (float): Довжина стовбура.
+    angle (float): Кут відхилення гілок у градусах.
+    scale (float): Коефіцієнт зменшення довжини на кожному рівні.
+    start (tuple): Координати початку стовбура.
+    heading (float): Напрямок стовбура в градусах.
+
+    Returns:
+    tuple: (min_x, min_y, max_x, max_y).
+    """
+    min_x = max_x = start[0]
+    min_y = max_y = start[1]
+    for batch in iter_segment_batches(order, size, angle, scale, start, heading,
+                                      max_batch=MAX_BATCH):
+        # Початки відрізків - це кінці відрізків попереднього рівня
+        min_x = min(min_x, batch.x1.min())
+        max_x = max(max_x, batch.x1.max())
+        min_y = min(min_y, batch.y1.min())
+        max_y = max(max_y, batch.y1.max())
+    return min_x, min_y, max_x, max_y
+
+
+def fit_transform(bounds, width, height, margin=MARGIN):
+    """
+    Обчислює перетворення світових координат у піксельні зі збереженням пропорцій.
+
+    Піксельні координати: px = offset_x + x * k, py = offset_y - y * k
+    (вісь y зображення напрямлена вниз).
+
+    Args:
+    bounds (tuple): Межі дерева (min_x, min_y, max_x, max_y).
+    width, height (int): Розміри зображення в пікселях.
+    margin (int): Відступ від краю в пікселях.
+
+    Returns:
+    tuple: (k, offset_x, offset_y).
+    """
+    min_x, min_y, max_x, max_y = bounds
+    span_x = max(max_x - min_x, 1e-9)
+    span_y = max(max_y - min_y, 1e-9)
+    k = min((width - 2 * margin) / span_x, (height - 2 * margin) / span_y)
+    # Центруємо дерево в зображенні
+    offset_x = (width - span_x * k) / 2 - min_x * k
+    offset_y = height - (height - span_y * k) / 2 + min_y * k
+    return k, offset_x, offset_y
+
+
+def render_svg(path, order, size=100, angle=DEFAULT_ANGLE, scale=DEFAULT_SCALE,
+               width=800, height=600, color="#000000"):
+    """
+    Записує дерево у файл SVG, потоково додаючи дані шляху пакетами.
+
+    Args:
+    path (str): Шлях до вихідного файлу.
+    order (int): Порядок рекурсії.
+    size (float): Довжина стовбура.
+    angle (float): Кут відхилення гілок у градусах.
+    scale (float): Коефіцієнт зменшення довжини на кожному рівні.
+    width, height (int): Розміри зображення в пікселях.
+    color (str): Колір ліній.
+    """
+    k, offset_x, offset_y = fit_transform(
+        tree_bounds(order, size, angle, scale), width, height)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+                f'height="{height}" viewBox="0 0 {width} {height}">\n')
+        f.write('<rect width="100%" height="100%" fill="white"/>\n')
+        f.write(f'<path fill="none" stroke="{color}" stroke-width="1" d="\n')
+        for batch in iter_segment_batches(order, size, angle, scale,
+                                          max_batch=MAX_BATCH):
+            # Кожен відрізок - окрема команда "M x0 y0 L x1 y1"
+            points = np.column_stack((offset_x + batch.x0 * k, offset_y - batch.y0 * k,
+                                      offset_x + batch.x1 * k, offset_y - batch.y1 * k))
+            np.savetxt(f, points, fmt="M%.2f %.2fL%.2f %.2f")
+        f.write('"/>\n</svg>\n')
+
+
+def rasterize(order, size=100, angle=DEFAULT_ANGLE, scale=DEFAULT_SCALE,
+              width=800, height=600):
+    """
+    Растеризує дерево у масив пікселів відтінків сірого.
+
+    Алгоритм:
+    1. Для кожного пакета відрізків (усі однієї довжини) визначаємо кількість
+       точок на відрізок, достатню для суцільної лінії в пікселях.
+    2. Векторизовано обчислюємо точки всіх відрізків пакета і зафарбовуємо
+       відповідні пікселі. Пакет ділиться на частини, щоб кількість точок
+       за один крок не перевищувала MAX_POINTS.
+
+    Args:
+    order (int): Порядок рекурсії.
+    size (float): Довжина стовбура.
+    angle (float): Кут відхилення гілок у градусах.
+    scale (float): Коефіцієнт зменшення довжини на кожному рівні.
+    width, height (int): Розміри зображення в пікселях.
+
+    Returns:
+    np.ndarray: Масив (height, width) типу uint8, 0 - лінія, 255 - фон.
+    """
+    k, offset_x, offset_y = fit_transform(
+        tree_bounds(order, size, angle, scale), width, height)
+    image = np.full((height, width), 255, dtype=np.uint8)
+    for batch in iter_segment_batches(order, size, angle, scale, max_batch=MAX_BATCH):
+        length_px = size * scale ** batch.depth * k
+        samples = max(2, math.ceil(length_px) + 1)
+        t = np.linspace(0.0, 1.0, samples)
+        step = max(1, MAX_POINTS // samples)
+        for i in range(0, len(batch.x0), step):
+            x0 = offset_x + batch.x0[i:i + step] * k
+            y0 = offset_y - batch.y0[i:i + step] * k
+            x1 = offset_x + batch.x1[i:i + step] * k
+            y1 = offset_y - batch.y1[i:i + step] * k
+            px = np.rint(x0[:, None] + (x1 - x0)[:, None] * t).astype(np.intp).ravel()
+            py = np.rint(y0[:, None] + (y1 - y0)[:, None] * t).astype(np.intp).ravel()
+            inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+            image[py[inside], px[inside]] = 0
+    return image
+
+
+def render_png(path, order, size=100, angle=DEFAULT_ANGLE, scale=DEFAULT_SCALE,
+               width=800, height=600):
+    """
+    Записує дерево у файл PNG.
+
+    Args:
+    path (str): Шлях до вихідного файлу.
+    order (int): Порядок рекурсії.
+    size (float): Довжина стовбура.
+    angle (float): Кут відхилення гілок у градусах.
+    scale (float): Коефіцієнт зменшення довжини на кожному рівні.
+    width, height (int): Розміри зображення в пікселях.
+    """
+    image = rasterize(order, size, angle, scale, width, height)
+    matplotlib.image.imsave(path, image, cmap="gray", vmin=0, vmax=255)
+
+
+def render_to_file(path, order, size=100, angle=DEFAULT_ANGLE, scale=DEFAULT_SCALE,
+                   width=800, height=600):
+    """
+    Записує дерево у файл, формат якого визначається за розширенням (.svg або .png).
+
+    Args:
+    path (str): Шлях до вихідного файлу.
+    order (int): Порядок рекурсії.
+    size (float): Довжина стовбура.
+    angle (float): Кут відхилення гілок у градусах.
+    scale (float): Коефіцієнт зменшення довжини на кожному рівні.
+    width, height (int): Розміри зображення в пікселях.
+
+    Raises:
+    ValueError: Якщо розширення файлу не підтримується.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".svg":
+        render_svg(path, order, size, angle, scale, width, height)
+    elif extension == ".png":
+        render_png(path, order, size, angle, scale, width, height)
+    else:
+        raise ValueError(f"Непідтримуваний формат файлу: {path}")
+
+
+def main():
+    """
+    Розбирає аргументи командного рядка та записує дерево у файл.
+    """
+    parser = argparse.ArgumentParser(description="Рендеринг дерева Піфагора у SVG/PNG")
+    parser.add_argument("order", type=int, help="порядок рекурсії")
+    parser.add_argument("output", help="вихідний файл (.svg або .png)")
+    parser.add_argument("--size", type=float, default=100, help="довжина стовбура")
+    parser.add_argument("--angle", type=float, default=DEFAULT_ANGLE,
+                        help="кут відхилення гілок у градусах")
+    parser.add_argument("--scale", type=float, default=DEFAULT_SCALE,
+                        help="коефіцієнт зменшення довжини гілок")
+    parser.add_argument("--width", type=int, default=800, help="ширина в пікселях")
+    parser.add_argument("--height", type=int, default=600, help="висота в пікселях")
+    args = parser.parse_args()
+
+    try:
+        render_to_file(args.output, args.order, args.size, args.angle, args.scale,
+                       args.width, args.height)
+    except ValueError as error:
+        parser.error(str(error))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@
 """
 
 import heapq  # Імпортуємо модуль для роботи з бінарною купою
+import math
 
 class Graph:
     """ Клас для зберігання графа та обчислення найкоротших шляхів методом Дейкстри """
@@ -15,23 +16,144 @@ class Graph:
         self.nodes = set()  # Множина для зберігання вершин графа
         self.edges = {}     # Словник для зберігання ребер графа
         self.distances = {} # Словник для зберігання відстаней між вершинами
+        self.coordinates = {} # Необов'язкові координати вершин для евристик A*
+        self.version = 0      # Лічильник змін графа (для інвалідації кешів)
 
-    def add_node(self, value):
-        """ Додає вершину до графа """
-        self.nodes.add(value)  # Додаємо вершину до множини вершин
-        self.edges[value] = [] # Ініціалізуємо список суміжності для нової вершини
+    def add_node(self, value, coordinates=None):
+        """
+        Додає вершину до графа (за потреби - з координатами, наприклад (x, y)).
+        Для наявної вершини ребра зберігаються, змінюються лише координати.
+        """
+        if value not in self.edges:
+            self.nodes.add(value)  # Додаємо вершину до множини вершин
+            self.edges[value] = [] # Ініціалізуємо список суміжності для нової вершини
+        elif coordinates is None:
+            return  # Граф не змінився, кеші лишаються дійсними
+        if coordinates is not None:
+            self.coordinates[value] = tuple(coordinates)
+        self.version += 1
 
     def add_edge(self, from_node, to_node, distance):
-        """ Додає ребро між двома вершинами """
-        # Додаємо ребро між двома вершинами (в обох напрямках для неорієнтованого графа)
-        self.edges[from_node].append(to_node)
-        self.edges[to_node].append(from_node)
+        """ Додає ребро між двома вершинами (для наявного ребра - змінює його вагу) """
+        if (from_node, to_node) not in self.distances:
+            # Додаємо ребро між двома вершинами (в обох напрямках для неорієнтованого графа)
+            self.edges[from_node].append(to_node)
+            self.edges[to_node].append(from_node)
         # Зберігаємо відстань між вершинами (в обох напрямках)
         self.distances[(from_node, to_node)] = distance
         self.distances[(to_node, from_node)] = distance
+        self.version += 1
+
+    def remove_edge(self, from_node, to_node):
+        """ Видаляє ребро між двома вершинами (KeyError, якщо ребра немає) """
+        if (from_node, to_node) not in self.distances:
+            raise KeyError((from_node, to_node))
+        # Видаляємо ребро зі списків суміжності обох вершин
+        self.edges[from_node].remove(to_node)
+        self.edges[to_node].remove(from_node)
+        # Видаляємо відстань в обох напрямках (для петлі це один і той самий ключ)
+        del self.distances[(from_node, to_node)]
+        self.distances.pop((to_node, from_node), None)
+        self.version += 1
+
+class IndexedHeap:
+    """
+    Бінарна мінімальна купа з картою позицій елементів і справжньою операцією
+    decrease-key: кожен елемент присутній у купі не більше одного разу,
+    тому її розмір не перевищує кількості вершин графа.
+    """
+    def __init__(self):
+        self.priorities = []  # Пріоритети у порядку бінарної купи
+        self.items = []       # Елементи у тому самому порядку
+        self.positions = {}   # Елемент -> індекс у купі
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.positions
+
+    def push(self, item, priority):
+        """ Додає елемент або зменшує його пріоритет, якщо він уже в купі """
+        if item in self.positions:
+            self.decrease_key(item, priority)
+            return
+        self.priorities.append(priority)
+        self.items.append(item)
+        self.positions[item] = len(self.items) - 1
+        self._sift_up(len(self.items) - 1)
+
+    def decrease_key(self, item, priority):
+        """ Зменшує пріоритет елемента і піднімає його вгору купою """
+        position = self.positions[item]
+        if priority > self.priorities[position]:
+            raise ValueError("Новий пріоритет більший за поточний")
+        self.priorities[position] = priority
+        self._sift_up(position)
+
+    def pop(self):
+        """ Вилучає елемент з найменшим пріоритетом і повертає (пріоритет, елемент) """
+        priorities, items = self.priorities, self.items
+        priority, item = priorities[0], items[0]
+        last_priority, last_item = priorities.pop(), items.pop()
+        del self.positions[item]
+        if items:
+            # Ставимо останній елемент у корінь і опускаємо його вниз
+            priorities[0], items[0] = last_priority, last_item
+            self.positions[last_item] = 0
+            self._sift_down(0)
+        return priority, item
+
+    def _sift_up(self, position):
+        """ Піднімає елемент, поки батьківський пріоритет більший """
+        priorities, items, positions = self.priorities, self.items, self.positions
+        priority, item = priorities[position], items[position]
+        while position > 0:
+            parent = (position - 1) // 2
+            if priorities[parent] <= priority:
+                break
+            # Зсуваємо батька вниз на місце поточного елемента
+            priorities[position], items[position] = priorities[parent], items[parent]
+            positions[items[position]] = position
+            position = parent
+        priorities[position], items[position] = priority, item
+        positions[item] = position
+
+    def _sift_down(self, position):
+        """ Опускає елемент, поки менший з нащадків має менший пріоритет """
+        priorities, items, positions = self.priorities, self.items, self.positions
+        size = len(items)
+        priority, item = priorities[position], items[position]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and priorities[child + 1] < priorities[child]:
+                child += 1  # Правий нащадок менший
+            if priorities[child] >= priority:
+                break
+            # Піднімаємо нащадка на місце поточного елемента
+            priorities[position], items[position] = priorities[child], items[child]
+            positions[items[position]] = position
+            position = child
+        priorities[position], items[position] = priority, item
+        positions[item] = position
+
+# Стратегії черги з пріоритетами для dijkstra
+QUEUE_STRATEGIES = ('lazy', 'indexed')
+
+def dijkstra(graph, initial, queue='lazy', stats=None):
+    """
+    Обчислює найкоротші відстані від початкової вершини до всіх інших вершин графа.
+    queue='lazy' - heapq з дублікатами і пропуском застарілих записів (купа до O(E)),
+    queue='indexed' - IndexedHeap з decrease-key (купа до O(V)).
+    У словник stats, якщо його передано, записуються лічильники операцій з купою.
+    """
+    if queue not in QUEUE_STRATEGIES:
+        raise ValueError(f"Невідома стратегія черги: {queue}")
+    if queue == 'indexed':
+        return _dijkstra_indexed(graph, initial, stats)
 
-def dijkstra(graph, initial):
-    """ Обчислює найкоротші відстані від початкової вершини до всіх інших вершин графа """
     # Ініціалізуємо відстані до всіх вершин як нескінченність
     distances = {node: float('infinity') for node in graph.nodes}
     distances[initial] = 0  # Відстань до початкової вершини - 0
@@ -39,10 +161,12 @@ def dijkstra(graph, initial):
     pq = [(0, initial)]
     # Словник для зберігання попередніх вершин у найкоротшому шляху
     previous_nodes = {node: None for node in graph.nodes}
+    pushes, pops, peak = 1, 0, 1  # Лічильники операцій і максимальний розмір купи
 
     while pq:
         # Вибираємо вершину з найменшою відстанню
         current_distance, current_node = heapq.heappop(pq)
+        pops += 1
 
         # Якщо знайдено коротший шлях до цієї вершини, пропускаємо її
         if current_distance > distances[current_node]:
@@ -59,35 +183,266 @@ def dijkstra(graph, initial):
                 previous_nodes[neighbor] = current_node
                 # Додаємо сусіда до бінарної купи для подальшого розгляду
                 heapq.heappush(pq, (distance, neighbor))
+                pushes += 1
+                if len(pq) > peak:
+                    peak = len(pq)
 
+    if stats is not None:
+        stats.update(pushes=pushes, pops=pops, decrease_keys=0, peak_size=peak)
     return distances, previous_nodes
 
+def _dijkstra_indexed(graph, initial, stats):
+    """ Варіант dijkstra з IndexedHeap: замість дублікатів виконується decrease-key """
+    distances = {node: float('infinity') for node in graph.nodes}
+    distances[initial] = 0
+    previous_nodes = {node: None for node in graph.nodes}
+    pq = IndexedHeap()
+    pq.push(initial, 0)
+    pushes, pops, decrease_keys, peak = 1, 0, 0, 1
+
+    while pq:
+        # Кожна вершина вилучається рівно один раз - застарілих записів немає
+        current_distance, current_node = pq.pop()
+        pops += 1
+
+        for neighbor in graph.edges[current_node]:
+            distance = current_distance + graph.distances[(current_node, neighbor)]
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                previous_nodes[neighbor] = current_node
+                if neighbor in pq:
+                    pq.decrease_key(neighbor, distance)
+                    decrease_keys += 1
+                else:
+                    pq.push(neighbor, distance)
+                    pushes += 1
+                    if len(pq) > peak:
+                        peak = len(pq)
+
+    if stats is not None:
+        stats.update(pushes=pushes, pops=pops, decrease_keys=decrease_keys, peak_size=peak)
+    return distances, previous_nodes
+
+def multi_source_dijkstra(graph, sources):
+    """
+    Обчислює відстані від найближчого з кількох джерел за один прохід Дейкстри
+    (еквівалентно запуску з віртуальної супервершини, з'єднаної з усіма джерелами
+    ребрами нульової ваги). Повертає (distances, previous_nodes, nearest_sources),
+    де nearest_sources[вершина] - найближче до неї джерело (None, якщо недосяжна).
+    """
+    distances = {node: float('infinity') for node in graph.nodes}
+    previous_nodes = {node: None for node in graph.nodes}
+    nearest_sources = {node: None for node in graph.nodes}
+    pq = []
+    for source in sources:
+        # Усі джерела стартують з нульовою відстанню одночасно
+        distances[source] = 0
+        nearest_sources[source] = source
+        pq.append((0, source))
+    heapq.heapify(pq)
+
+    while pq:
+        current_distance, current_node = heapq.heappop(pq)
+        if current_distance > distances[current_node]:
+            continue
+        for neighbor in graph.edges[current_node]:
+            distance = current_distance + graph.distances[(current_node, neighbor)]
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                previous_nodes[neighbor] = current_node
+                # Найближче джерело успадковується від вершини, через яку прийшов шлях
+                nearest_sources[neighbor] = nearest_sources[current_node]
+                heapq.heappush(pq, (distance, neighbor))
+
+    return distances, previous_nodes, nearest_sources
+
+def build_path(previous_nodes, node):
+    """ Відновлює шлях до вершини node за словником попередніх вершин """
+    path = []
+    while node is not None:
+        path.append(node)
+        node = previous_nodes[node]
+    return path[::-1]  # Розгортаємо шлях у правильному порядку
+
+def _best_first_search(graph, source, target, heuristic, stats):
+    """
+    Спільний цикл на бінарній купі для shortest_path і a_star.
+    Купа впорядкована за g + h, де g - знайдена відстань від source,
+    h = heuristic(вершина) - оцінка відстані до target (0 для Дейкстри).
+    """
+    # Відстані зберігаємо лише для досягнутих вершин, а не для всього графа
+    distances = {source: 0}
+    previous_nodes = {source: None}
+    expanded = 0  # Кількість опрацьованих вершин
+    found = False
+    pq = [(heuristic(source), 0, source)]
+
+    while pq:
+        _, current_distance, current_node = heapq.heappop(pq)
+        if current_distance > distances[current_node]:
+            continue  # Застарілий запис у купі
+        expanded += 1
+        if current_node == target:
+            found = True
+            break  # Відстань до цілі остаточна - далі шукати не потрібно
+
+        for neighbor in graph.edges[current_node]:
+            distance = current_distance + graph.distances[(current_node, neighbor)]
+            if distance < distances.get(neighbor, float('infinity')):
+                distances[neighbor] = distance
+                previous_nodes[neighbor] = current_node
+                heapq.heappush(pq, (distance + heuristic(neighbor), distance, neighbor))
+
+    if stats is not None:
+        stats['settled'] = expanded
+    if not found:
+        return float('infinity'), []
+    return distances[target], build_path(previous_nodes, target)
+
+def shortest_path(graph, source, target, stats=None):
+    """
+    Знаходить найкоротший шлях між двома вершинами, зупиняючись,
+    щойно цільову вершину вилучено з купи (її відстань остаточна).
+    Повертає (відстань, шлях); якщо шляху немає - (inf, []).
+    У словник stats, якщо його передано, записується кількість опрацьованих вершин.
+    """
+    return _best_first_search(graph, source, target, lambda node: 0, stats)
+
+def euclidean_distance(a, b):
+    """ Евклідова відстань між двома точками """
+    return math.dist(a, b)
+
+def manhattan_distance(a, b):
+    """ Манхеттенська відстань між двома точками """
+    return sum(abs(x - y) for x, y in zip(a, b))
+
+# Вбудовані евристики A*, що працюють з координатами вершин graph.coordinates
+HEURISTICS = {
+    'euclidean': euclidean_distance,
+    'manhattan': manhattan_distance,
+}
+
+def a_star(graph, source, target, heuristic='euclidean', stats=None):
+    """
+    Знаходить найкоротший шлях алгоритмом A*: той самий цикл, що й shortest_path,
+    але купа впорядкована за g + h, тож пошук спрямований до цілі.
+    heuristic - назва з HEURISTICS (використовує graph.coordinates) або функція
+    heuristic(node, target). Евристика має бути допустимою (не переоцінювати відстань):
+    'euclidean' - для ваг, не менших за евклідову довжину ребра,
+    'manhattan' - для сіток, де вага дорівнює манхеттенській довжині ребра.
+    Повертає (відстань, шлях); якщо шляху немає - (inf, []).
+    """
+    if callable(heuristic):
+        estimate = lambda node: heuristic(node, target)
+    else:
+        metric = HEURISTICS[heuristic]
+        coordinates = graph.coordinates
+        goal = coordinates[target]
+        estimate = lambda node: metric(coordinates[node], goal)
+    return _best_first_search(graph, source, target, estimate, stats)
+
+def bidirectional_dijkstra(graph, source, target, stats=None):
+    """
+    Знаходить найкоротший шлях між двома вершинами двостороннім пошуком:
+    одночасно від source і від target (граф неорієнтований).
+    Повертає (відстань, шлях); якщо шляху немає - (inf, []).
+    """
+    if source == target:
+        if stats is not None:
+            stats['settled'] = 1
+        return 0, [source]
+
+    # Стан прямого (0) і зворотного (1) пошуку
+    distances = ({source: 0}, {target: 0})
+    previous_nodes = ({source: None}, {target: None})
+    settled = (set(), set())
+    queues = ([(0, source)], [(0, target)])
+    best = float('infinity')  # Довжина найкращого знайденого шляху
+    meeting = None  # Ребро (вершина прямого пошуку, вершина зворотного пошуку)
+
+    while queues[0] and queues[1]:
+        # Умова зупинки: жоден коротший шлях уже не може пройти через неопрацьовані вершини
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+        # Розширюємо той бік, у якого менша поточна відстань
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        other = 1 - side
+        current_distance, current_node = heapq.heappop(queues[side])
+        if current_node in settled[side]:
+            continue  # Застарілий запис у купі
+        settled[side].add(current_node)
+
+        for neighbor in graph.edges[current_node]:
+            distance = current_distance + graph.distances[(current_node, neighbor)]
+            if distance < distances[side].get(neighbor, float('infinity')):
+                distances[side][neighbor] = distance
+                previous_nodes[side][neighbor] = current_node
+                heapq.heappush(queues[side], (distance, neighbor))
+            # Якщо сусіда вже досягнув інший пошук, маємо кандидата на повний шлях
+            if neighbor in distances[other]:
+                candidate = distance + distances[other][neighbor]
+                if candidate < best:
+                    best = candidate
+                    meeting = (current_node, neighbor) if side == 0 else (neighbor, current_node)
+
+    if stats is not None:
+        stats['settled'] = len(settled[0]) + len(settled[1])
+    if meeting is None:
+        return float('infinity'), []
+    forward_node, backward_node = meeting
+    path = build_path(previous_nodes[0], forward_node)
+    # Від точки зустрічі йдемо до target по дереву зворотного пошуку
+    node = backward_node
+    while node is not None:
+        path.append(node)
+        node = previous_nodes[1][node]
+    return best, path
+
+def memoized_path(previous_nodes, node, memo):
+    """
+    Відновлює шлях до вершини, перевикористовуючи вже пройдені префікси шляхів.
+    memo - словник вершина -> комірка (вершина, комірка попередника): зв'язний
+    список від вершини до джерела, тож спільні префікси зберігаються лише раз,
+    а пам'ять memo - O(1) на вершину. Кортеж-шлях будується тільки для повернення.
+    """
+    chain = []
+    # Піднімаємося деревом найкоротших шляхів до першої вершини з готовою коміркою
+    while node is not None and node not in memo:
+        chain.append(node)
+        node = previous_nodes[node]
+    cell = memo[node] if node is not None else None
+    for current in reversed(chain):
+        cell = (current, cell)
+        memo[current] = cell
+    path = []
+    while cell is not None:
+        path.append(cell[0])
+        cell = cell[1]
+    return tuple(reversed(path))
+
 def print_result(distances, previous_nodes, start_node):
     """ Виводить результати обчислення найкоротших відстаней та шляхів """
+    memo = {}  # Спільні префікси шляхів
     for node in distances:
         if node != start_node:
-            path = []
-            current = node
             # Відновлюємо шлях від кінцевої вершини до початкової
-            while current is not None:
-                path.append(current)
-                current = previous_nodes[current]
-            path = path[::-1]  # Розгортаємо шлях у правильному порядку
+            path = memoized_path(previous_nodes, node, memo)
             print(f"Шлях від {start_node} до {node}: {' -> '.join(path)}, Відстань: {distances[node]}")
 
 # Приклад використання
-graph = Graph()
-for node in ['A', 'B', 'C', 'D', 'E']:
-    graph.add_node(node)
-
-# Додаємо ребра з відстанями
-graph.add_edge('A', 'B', 4)
-graph.add_edge('A', 'C', 2)
-graph.add_edge('B', 'D', 3)
-graph.add_edge('C', 'D', 1)
-graph.add_edge('C', 'E', 5)
-graph.add_edge('D', 'E', 2)
-
-start_node = 'A'
-distances, previous_nodes = dijkstra(graph, start_node)
-print_result(distances, previous_nodes, start_node)
+if __name__ == "__main__":
+    graph = Graph()
+    for node in ['A', 'B', 'C', 'D', 'E']:
+        graph.add_node(node)
+
+    # Додаємо ребра з відстанями
+    graph.add_edge('A', 'B', 4)
+    graph.add_edge('A', 'C', 2)
+    graph.add_edge('B', 'D', 3)
+    graph.add_edge('C', 'D', 1)
+    graph.add_edge('C', 'E', 5)
+    graph.add_edge('D', 'E', 2)
+
+    start_node = 'A'
+    distances, previous_nodes = dijkstra(graph, start_node)
+    print_result(distances, previous_nodes, start_node)
@@ -0,0 +1,131 @@
+"""
+Кеш результатів алгоритму Дейкстри із завдання 3.
+
+Для кожного джерела зберігається дерево найкоротших шляхів (словники
+distances і previous_nodes) та запам'ятовані префікси шляхів. Кеш обмежений
+за принципом LRU бюджетом пам'яті і скидається, щойно змінюється лічильник
+версії графа (Graph.version збільшують add_node і add_edge).
+
+Приклад:
+    cache = ShortestPathCache(graph, max_bytes=256 * 2**20)
+    distances, previous_nodes = cache.dijkstra('A')
+    path = cache.path('A', 'E')
+    print(cache.stats())
+"""
+
+import sys
+from collections import OrderedDict
+
+from task_3 import dijkstra, memoized_path
+
+DEFAULT_MAX_BYTES = 64 * 2**20  # Бюджет пам'яті кешу за замовчуванням (64 МБ)
+OBJECT_BYTES = 24  # Приблизний розмір числа-відстані як об'єкта Python
+CELL_BYTES = sys.getsizeof((None, None))  # Комірка префікса шляху (вершина, попередня комірка)
+
+
+class _Entry:
+    """ Запис кешу: дерево найкоротших шляхів від одного джерела """
+    __slots__ = ("distances", "previous_nodes", "paths", "nbytes")
+
+    def __init__(self, distances, previous_nodes):
+        self.distances = distances
+        self.previous_nodes = previous_nodes
+        self.paths = {}  # Запам'ятовані префікси шляхів: вершина -> комірка memoized_path
+        # Оцінка розміру: два словники плюс об'єкти відстаней
+        self.nbytes = (sys.getsizeof(distances) + sys.getsizeof(previous_nodes)
+                       + OBJECT_BYTES * len(distances))
+
+
+class ShortestPathCache:
+    """ LRU-кеш дерев найкоротших шляхів з інвалідацією за версією графа """
+    def __init__(self, graph, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+        graph (Graph): Граф, для якого кешуються результати.
+        max_bytes (int): Бюджет пам'яті кешу в байтах (оцінка).
+        """
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # Джерело -> _Entry, від найдавнішого до найсвіжішого
+        self._version = graph.version
+        self.nbytes = 0  # Поточний оцінений розмір кешу
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _entry(self, source):
+        """ Повертає запис для джерела, обчислюючи його за промаху """
+        if self.graph.version != self._version:
+            # Граф змінився - усі збережені дерева могли застаріти
+            self.clear()
+            self._version = self.graph.version
+            self.invalidations += 1
+
+        entry = self._entries.get(source)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(source)  # Позначаємо як нещодавно використаний
+            return entry
+
+        self.misses += 1
+        entry = _Entry(*dijkstra(self.graph, source))
+        self._entries[source] = entry
+        self.nbytes += entry.nbytes
+        self._evict()
+        return entry
+
+    def _evict(self):
+        """ Видаляє найдавніше використані записи, поки кеш перевищує бюджет """
+        # Останній (щойно використаний) запис залишаємо навіть якщо він завеликий
+        while self.nbytes > self.max_bytes and len(self._entries) > 1:
+            _, entry = self._entries.popitem(last=False)
+            self.nbytes -= entry.nbytes
+            self.evictions += 1
+
+    def dijkstra(self, source):
+        """
+        Повертає (distances, previous_nodes) від джерела, як task_3.dijkstra.
+
+        Повернені словники належать кешу - їх не можна змінювати.
+        """
+        entry = self._entry(source)
+        return entry.distances, entry.previous_nodes
+
+    def path(self, source, target):
+        """
+        Повертає найкоротший шлях від source до target як кортеж вершин.
+
+        Шляхи будуються через memoized_path, тож префікси, спільні для
+        багатьох цілей, обчислюються і зберігаються лише один раз - по одній
+        комірці на вершину.
+        """
+        entry = self._entry(source)
+        if entry.distances[target] == float('infinity'):
+            return ()
+        known = len(entry.paths)
+        path = memoized_path(entry.previous_nodes, target, entry.paths)
+        added = len(entry.paths) - known
+        if added:
+            # Нові комірки - по одній на кожну щойно пройдену вершину шляху
+            grown = CELL_BYTES * added
+            entry.nbytes += grown
+            self.nbytes += grown
+            self._evict()
+        return path
+
+    def clear(self):
+        """ Видаляє всі записи кешу (лічильники статистики зберігаються) """
+        self._entries.clear()
+        self.nbytes = 0
+
+    def stats(self):
+        """ Повертає лічильники кешу у вигляді словника """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+        }
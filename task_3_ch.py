@@ -0,0 +1,291 @@
+"""
+Ієрархії стискання (contraction hierarchies) для графа із завдання 3.
+
+Для статичного графа, на якому виконується багато запитів між двома
+вершинами, граф один раз попередньо обробляється:
+- вершини по черзі "стискаються" в порядку важливості (різниця ребер: скільки
+  коротких шляхів-ярликів додасть видалення вершини мінус скільки ребер
+  зникне, плюс кількість уже стиснутих сусідів);
+- при стисканні вершини v для кожної пари її сусідів u, w додається ярлик
+  u - w вагою d(u, v) + d(v, w), якщо обмежений пошук свідків (Дейкстра з u
+  в обхід v) не знаходить шляху, не довшого за нього.
+
+Після цього найкоротший шлях між будь-якими двома вершинами можна знайти
+двобічним пошуком лише по ребрах, що ведуть до вершин з вищим рангом:
+обидва пошуки опрацьовують лише сотні вершин навіть на великих графах.
+
+Результат попередньої обробки - масиви висхідного графа у форматі CSR -
+зберігається у файл (save) і відкривається без повторної побудови (load).
+
+Приклад:
+    ch = ContractionHierarchy.from_graph(graph)
+    ch.save("roads.ch")
+    ch = ContractionHierarchy.load("roads.ch")
+    distance, path = ch.shortest_path('A', 'E')
+"""
+
+import heapq
+import pickle
+from array import array
+
+INFINITY = float('infinity')
+WITNESS_LIMIT = 100  # Найбільша кількість опрацьованих вершин у пошуку свідків
+
+
+def _witness_search(adjacency, source, excluded, max_distance, limit):
+    """
+    Обмежений пошук Дейкстри з source в обхід вершини excluded.
+
+    Зупиняється, коли відстань перевищує max_distance або опрацьовано limit
+    вершин. Повернені відстані - довжини справжніх шляхів в обхід excluded
+    (для неопрацьованих вершин - не обов'язково найкоротших), тож ними можна
+    підтверджувати, що ярлик не потрібен.
+    """
+    distances = {source: 0}
+    pq = [(0, source)]
+    settled = 0
+    while pq and settled < limit:
+        current_distance, current = heapq.heappop(pq)
+        if current_distance > distances[current]:
+            continue  # Застарілий запис у купі
+        if current_distance > max_distance:
+            break
+        settled += 1
+        for neighbor, (weight, _) in adjacency[current].items():
+            if neighbor == excluded:
+                continue
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, INFINITY):
+                distances[neighbor] = distance
+                heapq.heappush(pq, (distance, neighbor))
+    return distances
+
+
+def _shortcuts(adjacency, node, limit):
+    """ Повертає ярлики (u, w, вага), потрібні при стисканні вершини node """
+    neighbors = list(adjacency[node].items())
+    shortcuts = []
+    for i, (u, (weight_u, _)) in enumerate(neighbors):
+        rest = neighbors[i + 1:]  # Кожну пару сусідів розглядаємо один раз
+        if not rest:
+            break
+        max_distance = weight_u + max(weight for _, (weight, _) in rest)
+        witnesses = _witness_search(adjacency, u, node, max_distance, limit)
+        for w, (weight_w, _) in rest:
+            length = weight_u + weight_w
+            if witnesses.get(w, INFINITY) > length:
+                shortcuts.append((u, w, length))
+    return shortcuts
+
+
+class ContractionHierarchy:
+    """ Висхідний граф ієрархії стискання з двобічним пошуком між двома вершинами """
+    def __init__(self, labels, rank, offsets, targets, weights, middles):
+        """
+        Args:
+        labels (list): Мітки вершин; індекс у списку - номер вершини.
+        rank (array): Порядок стискання (ранг) кожної вершини.
+        offsets (array): Початки діапазонів висхідних ребер вершин (n + 1).
+        targets (array): Номери кінцевих вершин висхідних ребер.
+        weights (array): Ваги висхідних ребер.
+        middles (array): Для ярлика - номер стиснутої вершини, через яку він
+        проходить, для ребра графа - -1.
+        """
+        self.labels = labels
+        self.ids = {label: i for i, label in enumerate(labels)}  # Мітка -> номер
+        self.rank = rank
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.middles = middles
+
+    @classmethod
+    def from_graph(cls, graph, witness_limit=WITNESS_LIMIT):
+        """
+        Будує ієрархію стискання з task_3.Graph.
+
+        Args:
+        graph (Graph): Неорієнтований граф з невід'ємними вагами.
+        witness_limit (int): Обмеження пошуку свідків; менше значення
+        пришвидшує побудову ціною зайвих ярликів (відповіді лишаються точними).
+
+        Returns:
+        ContractionHierarchy: Результат попередньої обробки.
+        """
+        labels = list(graph.edges)
+        ids = {label: i for i, label in enumerate(labels)}
+        n = len(labels)
+        # Залишковий граф: сусід -> (вага, середня вершина ярлика або -1)
+        adjacency = [{} for _ in range(n)]
+        for (a, b), weight in graph.distances.items():
+            i, j = ids[a], ids[b]
+            if i != j and weight < adjacency[i].get(j, (INFINITY, -1))[0]:
+                adjacency[i][j] = (weight, -1)
+
+        deleted = [0] * n  # Кількість уже стиснутих сусідів
+        upward = [None] * n  # Висхідні ребра, зафіксовані при стисканні вершини
+        rank = array('q', [0] * n)
+
+        def priority(node):
+            shortcuts = _shortcuts(adjacency, node, witness_limit)
+            return len(shortcuts) - len(adjacency[node]) + deleted[node], shortcuts
+
+        pq = [(priority(node)[0], node) for node in range(n)]
+        heapq.heapify(pq)
+        order = 0
+        while pq:
+            _, node = heapq.heappop(pq)
+            # Ліниве оновлення: пріоритет міг зрости після стискання сусідів
+            current, shortcuts = priority(node)
+            if pq and current > pq[0][0]:
+                heapq.heappush(pq, (current, node))
+                continue
+
+            rank[node] = order
+            order += 1
+            # Усі сусіди, що залишилися, стискатимуться пізніше - їхні ранги вищі
+            upward[node] = adjacency[node]
+            for neighbor in adjacency[node]:
+                del adjacency[neighbor][node]
+                deleted[neighbor] += 1
+            adjacency[node] = {}
+            for u, w, length in shortcuts:
+                if length < adjacency[u].get(w, (INFINITY, -1))[0]:
+                    adjacency[u][w] = (length, node)
+                    adjacency[w][u] = (length, node)
+
+        offsets = array('q', [0])
+        targets, weights, middles = array('q'), array('d'), array('q')
+        for node in range(n):
+            for neighbor, (weight, middle) in upward[node].items():
+                targets.append(neighbor)
+                weights.append(weight)
+                middles.append(middle)
+            offsets.append(len(targets))
+        return cls(labels, rank, offsets, targets, weights, middles)
+
+    @property
+    def num_nodes(self):
+        """ Кількість вершин """
+        return len(self.labels)
+
+    @property
+    def num_shortcuts(self):
+        """ Кількість доданих ярликів """
+        return sum(1 for middle in self.middles if middle >= 0)
+
+    def save(self, path):
+        """ Зберігає результат попередньої обробки у файл """
+        with open(path, "wb") as file:
+            pickle.dump((self.labels, self.rank, self.offsets, self.targets,
+                         self.weights, self.middles), file, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """ Відкриває ієрархію, збережену методом save """
+        with open(path, "rb") as file:
+            return cls(*pickle.load(file))
+
+    def _search(self, source, target, stats):
+        """
+        Двобічний пошук по висхідних ребрах між номерами вершин.
+
+        Returns:
+        tuple: (відстань, вершина зустрічі або -1, попередники прямого
+        і зворотного пошуків).
+        """
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        distances = ({source: 0.0}, {target: 0.0})
+        previous = ({source: -1}, {target: -1})
+        queues = ([(0.0, source)], [(0.0, target)])
+        best, meeting = (0.0, source) if source == target else (INFINITY, -1)
+        settled = 0
+        side = 0
+        heappush, heappop = heapq.heappush, heapq.heappop  # Локальні імена швидші
+
+        while True:
+            # Чергуємо напрямки; напрямок завершено, коли його мінімум не менший за best
+            if not (queues[side] and queues[side][0][0] < best):
+                side = 1 - side
+                if not (queues[side] and queues[side][0][0] < best):
+                    break
+            direction, side = side, 1 - side
+            own, other, pq = distances[direction], distances[side], queues[direction]
+            parents = previous[direction]
+            current_distance, current = heappop(pq)
+            if current_distance > own[current]:
+                continue  # Застарілий запис у купі
+            settled += 1
+            if current in other and current_distance + other[current] < best:
+                best = current_distance + other[current]
+                meeting = current
+
+            start, end = offsets[current], offsets[current + 1]
+            edges = list(zip(targets[start:end], weights[start:end]))
+            # Stall-on-demand: якщо до вершини коротше дійти згори, її мітка
+            # не оптимальна і продовжувати пошук з неї немає сенсу
+            for neighbor, weight in edges:
+                if neighbor in own and own[neighbor] + weight < current_distance:
+                    break
+            else:
+                for neighbor, weight in edges:
+                    distance = current_distance + weight
+                    if distance < own.get(neighbor, INFINITY):
+                        own[neighbor] = distance
+                        parents[neighbor] = current
+                        heappush(pq, (distance, neighbor))
+
+        if stats is not None:
+            stats['settled'] = settled
+        return best, meeting, previous
+
+    def _middle(self, a, b):
+        """ Повертає середню вершину ребра a - b висхідного графа (-1 для ребра графа) """
+        low, high = (a, b) if self.rank[a] < self.rank[b] else (b, a)
+        for k in range(self.offsets[low], self.offsets[low + 1]):
+            if self.targets[k] == high:
+                return self.middles[k]
+        raise KeyError((a, b))
+
+    def _unpack(self, a, b):
+        """ Розгортає ребро a - b (можливо, ярлик) у шлях з номерів вершин без вершини a """
+        path = []
+        stack = [(a, b)]
+        while stack:
+            start, end = stack.pop()
+            middle = self._middle(start, end)
+            if middle < 0:
+                path.append(end)
+            else:
+                # Спершу розгортаємо першу половину ярлика
+                stack.append((middle, end))
+                stack.append((start, middle))
+        return path
+
+    def distance(self, source, target, stats=None):
+        """
+        Повертає довжину найкоротшого шляху між вершинами (inf, якщо шляху немає).
+        У словник stats, якщо його передано, записується кількість опрацьованих вершин.
+        """
+        return self._search(self.ids[source], self.ids[target], stats)[0]
+
+    def shortest_path(self, source, target, stats=None):
+        """
+        Знаходить найкоротший шлях між двома вершинами, як task_3.shortest_path.
+        Повертає (відстань, шлях); якщо шляху немає - (inf, []).
+        """
+        best, meeting, previous = self._search(self.ids[source], self.ids[target], stats)
+        if meeting < 0:
+            return INFINITY, []
+        # Ланцюжок вершин висхідного графа: source -> зустріч -> target
+        chain = [meeting]
+        while previous[0][chain[-1]] >= 0:
+            chain.append(previous[0][chain[-1]])
+        chain.reverse()
+        while previous[1][chain[-1]] >= 0:
+            chain.append(previous[1][chain[-1]])
+
+        path = [chain[0]]
+        for a, b in zip(chain, chain[1:]):
+            path.extend(self._unpack(a, b))
+        return best, [self.labels[node] for node in path]
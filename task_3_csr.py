@@ -0,0 +1,212 @@
+"""
+Компактне представлення графа із завдання 3 у форматі CSR (Compressed Sparse Row).
+
+Замість списків суміжності та словника відстаней з ключами-кортежами граф
+зберігається у трьох типізованих масивах:
+- offsets[i]..offsets[i+1] - діапазон ребер, що виходять з вершини i;
+- targets[k] - номер вершини, в яку веде ребро k;
+- weights[k] - вага ребра k.
+
+Мітки вершин відображаються на цілі номери 0..n-1. Такий граф незмінний
+(frozen): щоб додати ребро, треба змінити task_3.Graph і побудувати CSR заново.
+"""
+
+import heapq
+from array import array
+
+
+class CSRGraph:
+    """ Незмінний граф у форматі CSR з цілими номерами вершин """
+    def __init__(self, labels, offsets, targets, weights, ids=None):
+        """
+        Args:
+        labels (list): Мітки вершин; індекс у списку - номер вершини.
+        offsets (array): Масив довжиною n + 1 з початками діапазонів ребер.
+        targets (array): Номери кінцевих вершин ребер.
+        weights (array): Ваги ребер.
+        ids (dict): Готовий словник мітка -> номер; якщо не задано, будується
+        при першому зверненні до ids.
+        """
+        self.labels = labels
+        self._ids = ids
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @property
+    def ids(self):
+        """ Словник мітка -> номер вершини (будується ліниво) """
+        if self._ids is None:
+            self._ids = {label: i for i, label in enumerate(self.labels)}
+        return self._ids
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Будує CSR-представлення з task_3.Graph.
+
+        Args:
+        graph (Graph): Граф зі списками суміжності та словником відстаней.
+
+        Returns:
+        CSRGraph: Незмінна копія графа.
+        """
+        labels = list(graph.edges)  # Порядок додавання вершин
+        ids = {label: i for i, label in enumerate(labels)}
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('d')
+        for label in labels:
+            for neighbor in graph.edges[label]:
+                targets.append(ids[neighbor])
+                weights.append(graph.distances[(label, neighbor)])
+            offsets.append(len(targets))
+        return cls(labels, offsets, targets, weights, ids)
+
+    @classmethod
+    def from_arrays(cls, labels, sources, targets, weights, symmetric=False, ids=None):
+        """
+        Будує CSR-представлення зі списку ребер у трьох паралельних масивах.
+
+        Ребра розкладаються за вершинами сортуванням підрахунком за O(n + m),
+        порядок ребер кожної вершини зберігає порядок у вхідних масивах.
+
+        Args:
+        labels (list): Мітки вершин; індекс у списку - номер вершини.
+        sources (array): Номери початкових вершин ребер.
+        targets (array): Номери кінцевих вершин ребер.
+        weights (array): Ваги ребер.
+        symmetric (bool): Якщо True, кожне ребро додається в обох напрямках
+        (неорієнтований граф, як у task_3.Graph.add_edge).
+        ids (dict): Необов'язковий готовий словник мітка -> номер.
+
+        Returns:
+        CSRGraph: Незмінний граф.
+        """
+        n = len(labels)
+        # Кількість ребер, що виходять з кожної вершини (зі зсувом на 1 для префіксних сум)
+        counts = [0] * (n + 1)
+        for source in sources:
+            counts[source + 1] += 1
+        if symmetric:
+            for target in targets:
+                counts[target + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        offsets = array('q', counts)
+
+        # Наступна вільна позиція в діапазоні кожної вершини
+        position = counts[:n]
+        total = counts[n]
+        out_targets = array('q', bytes(8 * total))
+        out_weights = array('d', bytes(8 * total))
+        for source, target, weight in zip(sources, targets, weights):
+            k = position[source]
+            out_targets[k] = target
+            out_weights[k] = weight
+            position[source] = k + 1
+            if symmetric:
+                k = position[target]
+                out_targets[k] = source
+                out_weights[k] = weight
+                position[target] = k + 1
+        return cls(labels, offsets, out_targets, out_weights, ids)
+
+    @property
+    def num_nodes(self):
+        """ Кількість вершин """
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        """ Кількість орієнтованих ребер (неорієнтоване ребро враховується двічі) """
+        return len(self.targets)
+
+    def nbytes(self):
+        """ Розмір масивів CSR у байтах (без міток і словника номерів) """
+        return sum(a.itemsize * len(a) for a in (self.offsets, self.targets, self.weights))
+
+    def to_numpy(self):
+        """
+        Повертає масиви CSR як масиви NumPy без копіювання даних.
+
+        Returns:
+        tuple: (offsets, targets, weights).
+        """
+        import numpy as np
+        return (np.frombuffer(self.offsets, dtype=np.int64),
+                np.frombuffer(self.targets, dtype=np.int64),
+                np.frombuffer(self.weights, dtype=np.float64))
+
+    def result_to_dicts(self, distances, previous):
+        """
+        Перетворює результат dijkstra_csr у словники з мітками, як у task_3.dijkstra.
+
+        Args:
+        distances (array): Відстані за номерами вершин.
+        previous (array): Номери попередніх вершин (-1 - немає).
+
+        Returns:
+        tuple: (distances, previous_nodes) - словники мітка -> значення.
+        """
+        labels = self.labels
+        return ({label: distances[i] for i, label in enumerate(labels)},
+                {label: labels[p] if p >= 0 else None for label, p in zip(labels, previous)})
+
+
+def dijkstra_csr(csr, initial):
+    """
+    Обчислює найкоротші відстані від початкової вершини на CSR-графі.
+
+    Це той самий алгоритм з бінарною купою, що й task_3.dijkstra, але без
+    створення кортежів і пошуку в словнику для кожного ребра: ребра вершини
+    читаються зрізами масивів targets і weights.
+
+    Args:
+    csr (CSRGraph): Граф у форматі CSR.
+    initial: Мітка початкової вершини.
+
+    Returns:
+    tuple: (distances, previous) - масиви array('d') і array('q') за номерами
+    вершин; недосяжні вершини мають відстань inf і попередника -1.
+    """
+    distances, previous = dijkstra_csr_ids(csr, csr.ids[initial])
+    return array('d', distances), array('q', previous)
+
+
+def dijkstra_csr_ids(csr, source):
+    """
+    Ядро dijkstra_csr, що працює з номером вершини замість мітки.
+
+    Потребує лише масивів offsets, targets і weights (підходять і memoryview
+    над спільною пам'яттю), тому його можна викликати без словника міток.
+
+    Args:
+    csr (CSRGraph): Граф у форматі CSR.
+    source (int): Номер початкової вершини.
+
+    Returns:
+    tuple: (distances, previous) - списки Python за номерами вершин.
+    """
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    n = len(offsets) - 1
+    distances = [float('infinity')] * n
+    previous = [-1] * n
+    distances[source] = 0.0
+    pq = [(0.0, source)]
+    heappush, heappop = heapq.heappush, heapq.heappop  # Локальні імена швидші
+
+    while pq:
+        current_distance, current = heappop(pq)
+        # Якщо знайдено коротший шлях до цієї вершини, пропускаємо її
+        if current_distance > distances[current]:
+            continue
+        start, end = offsets[current], offsets[current + 1]
+        for neighbor, weight in zip(targets[start:end], weights[start:end]):
+            distance = current_distance + weight
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                previous[neighbor] = current
+                heappush(pq, (distance, neighbor))
+
+    return distances, previous
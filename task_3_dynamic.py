@@ -0,0 +1,175 @@
+"""
+Інкрементне оновлення результатів алгоритму Дейкстри із завдання 3.
+
+Коли в графі змінюється одне ребро, дерево найкоротших шляхів змінюється лише
+в невеликій області, тож замість повторного dijkstra достатньо полагодити
+наявний результат (distances, previous_nodes):
+
+- додавання ребра або зменшення ваги: від кінця ребра, до якого знайдено
+  коротший шлях, запускається Дейкстра, що поширюється лише поки відстані
+  строго зменшуються;
+- збільшення ваги або видалення ребра дерева: відстані піддерева нижче ребра
+  скидаються, кожна його вершина отримує найкращого кандидата серед сусідів
+  поза піддеревом, після чого Дейкстра працює лише в межах піддерева.
+  Ребро поза деревом найкоротших шляхів жодних відстаней не змінює.
+
+Функції змінюють і граф, і переданий результат на місці та повертають
+множину вершин, відстань до яких змінилася.
+
+Приклад:
+    distances, previous_nodes = dijkstra(graph, 'A')
+    update_edge(graph, distances, previous_nodes, 'B', 'E', 1)
+    delete_edge(graph, distances, previous_nodes, 'C', 'D')
+"""
+
+import heapq
+
+INFINITY = float('infinity')
+
+
+def _ensure_nodes(distances, previous_nodes, nodes):
+    """ Додає до результату вершини, яких у ньому ще немає (вони недосяжні) """
+    for node in nodes:
+        if node not in distances:
+            distances[node] = INFINITY
+            previous_nodes[node] = None
+
+
+def _propagate(graph, distances, previous_nodes, pq, changed):
+    """
+    Дейкстра з уже заповненою купою: поширює лише строгі покращення відстаней.
+    Вершини, відстань до яких змінилася, додаються до множини changed.
+    """
+    while pq:
+        current_distance, current_node = heapq.heappop(pq)
+        # Застарілий запис - до вершини вже знайдено коротший шлях
+        if current_distance > distances[current_node]:
+            continue
+        for neighbor in graph.edges[current_node]:
+            distance = current_distance + graph.distances[(current_node, neighbor)]
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                previous_nodes[neighbor] = current_node
+                changed.add(neighbor)
+                heapq.heappush(pq, (distance, neighbor))
+
+
+def _relax_edge(graph, distances, previous_nodes, from_node, to_node):
+    """ Поширює покращення, що з'явилися після додавання ребра або зменшення його ваги """
+    changed = set()
+    pq = []
+    weight = graph.distances[(from_node, to_node)]
+    # Неорієнтоване ребро може покращити шлях в будь-якому з двох напрямків
+    for tail, head in ((from_node, to_node), (to_node, from_node)):
+        distance = distances[tail] + weight
+        if distance < distances[head]:
+            distances[head] = distance
+            previous_nodes[head] = tail
+            changed.add(head)
+            heapq.heappush(pq, (distance, head))
+    _propagate(graph, distances, previous_nodes, pq, changed)
+    return changed
+
+
+def _subtree(graph, previous_nodes, root):
+    """
+    Збирає піддерево найкоротших шляхів з коренем root.
+    Діти вершини завжди є її сусідами в графі, тож достатньо обходу списків
+    суміжності лише вершин піддерева - без побудови карти дітей для всього дерева.
+    """
+    subtree = {root}
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for neighbor in graph.edges[node]:
+            if previous_nodes[neighbor] == node and neighbor not in subtree:
+                subtree.add(neighbor)
+                stack.append(neighbor)
+    return subtree
+
+
+def _repair_subtree(graph, distances, previous_nodes, root):
+    """ Перераховує відстані піддерева root після збільшення ваги або видалення ребра над ним """
+    subtree = _subtree(graph, previous_nodes, root)
+    old = {node: distances[node] for node in subtree}
+    # Відстані поза піддеревом коректні: їхні шляхи не проходять через змінене ребро
+    for node in subtree:
+        distances[node] = INFINITY
+        previous_nodes[node] = None
+
+    pq = []
+    for node in subtree:
+        # Найкращий вхід у піддерево ззовні
+        best, parent = INFINITY, None
+        for neighbor in graph.edges[node]:
+            if neighbor not in subtree:
+                distance = distances[neighbor] + graph.distances[(neighbor, node)]
+                if distance < best:
+                    best, parent = distance, neighbor
+        if parent is not None:
+            distances[node] = best
+            previous_nodes[node] = parent
+            pq.append((best, node))
+    heapq.heapify(pq)
+
+    _propagate(graph, distances, previous_nodes, pq, set())
+    return {node for node in subtree if distances[node] != old[node]}
+
+
+def _tree_child(previous_nodes, from_node, to_node):
+    """ Повертає вершину-дитину, якщо ребро належить дереву найкоротших шляхів, інакше None """
+    if from_node != to_node:
+        if previous_nodes[to_node] == from_node:
+            return to_node
+        if previous_nodes[from_node] == to_node:
+            return from_node
+    return None
+
+
+def update_edge(graph, distances, previous_nodes, from_node, to_node, distance):
+    """
+    Додає ребро або змінює його вагу в графі та лагодить результат dijkstra.
+
+    Args:
+    graph (Graph): Граф, з якого отримано результат.
+    distances (dict): Відстані від джерела (змінюються на місці).
+    previous_nodes (dict): Попередні вершини шляхів (змінюються на місці).
+    from_node, to_node: Кінці ребра.
+    distance (float): Нова невід'ємна вага ребра.
+
+    Returns:
+    set: Вершини, відстань до яких змінилася.
+    """
+    if distance < 0:
+        raise ValueError(f"Вага ребра не може бути від'ємною: {distance}")
+    _ensure_nodes(distances, previous_nodes, (from_node, to_node))
+    old = graph.distances.get((from_node, to_node))
+    # Дитину треба визначити до зміни графа, поки дерево ще відповідає старій вазі
+    child = _tree_child(previous_nodes, from_node, to_node)
+    graph.add_edge(from_node, to_node, distance)
+
+    if old is None or distance < old:
+        return _relax_edge(graph, distances, previous_nodes, from_node, to_node)
+    if distance > old and child is not None:
+        return _repair_subtree(graph, distances, previous_nodes, child)
+    return set()
+
+
+def delete_edge(graph, distances, previous_nodes, from_node, to_node):
+    """
+    Видаляє ребро з графа та лагодить результат dijkstra.
+
+    Args:
+    graph (Graph): Граф, з якого отримано результат.
+    distances (dict): Відстані від джерела (змінюються на місці).
+    previous_nodes (dict): Попередні вершини шляхів (змінюються на місці).
+    from_node, to_node: Кінці ребра.
+
+    Returns:
+    set: Вершини, відстань до яких змінилася.
+    """
+    child = _tree_child(previous_nodes, from_node, to_node)
+    graph.remove_edge(from_node, to_node)
+    if child is None:
+        return set()
+    return _repair_subtree(graph, distances, previous_nodes, child)
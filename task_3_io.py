@@ -0,0 +1,331 @@
+"""
+Завантаження великих графів для завдання 3 з файлів.
+
+Підтримувані текстові формати:
+- csv - рядки "from,to,weight" (заголовок, якщо є, пропускається: перший
+  рядок вважається заголовком, якщо його вага нечислова, усі поля - відомі
+  назви стовпців або поля нечислові, а в наступному рядку - числові);
+- edges - рядки "from to [weight]" через пробіли, коментарі починаються з # або %;
+- dimacs - формат .gr з 9th DIMACS Challenge: "p sp n m" і дуги "a u v w".
+
+Файл читається блоками рядків, мітки вершин інтернуються (кожна мітка
+зберігається один раз у словнику мітка -> номер), а ребра складаються в три
+типізовані масиви без кортежів на кожне ребро. З масивів за один прохід
+сортування підрахунком будується task_3_csr.CSRGraph.
+
+Для повторних запусків граф можна зберегти у двійковому форматі
+(save_binary) і відкривати через mmap (load_binary): масиви CSR тоді
+читаються прямо зі сторінок файлу, без розбору і копіювання.
+
+Приклад:
+    csr = load_csr("roads.gr")
+    save_binary(csr, "roads.csrg")
+    csr = load_binary("roads.csrg")  # Майже миттєво
+"""
+
+import csv
+import itertools
+import mmap
+import os
+import struct
+from array import array
+
+from task_3 import Graph
+from task_3_csr import CSRGraph
+
+FORMATS = ("csv", "edges", "dimacs")
+EXTENSIONS = {".csv": "csv", ".gr": "dimacs"}  # Решта розширень - edges
+CHUNK_SIZE = 1 << 20  # Розмір блоку читання в байтах
+
+MAGIC = b"CSRG"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sIIIqqq")  # magic, версія, тип міток, резерв, n, m, байти міток
+LABELS_INT, LABELS_STR = 0, 1
+# Назви стовпців, за якими розпізнається заголовок csv
+HEADER_NAMES = {"from", "to", "source", "target", "src", "dst", "u", "v", "start", "end",
+                "node1", "node2", "weight", "w", "distance", "cost", "length"}
+
+
+def detect_format(path):
+    """ Визначає формат файлу за розширенням """
+    return EXTENSIONS.get(os.path.splitext(path)[1].lower(), "edges")
+
+
+def _read_chunks(file, chunk_size):
+    """ Читає файл блоками списків рядків приблизно по chunk_size байт """
+    return iter(lambda: file.readlines(chunk_size), [])
+
+
+def _malformed(number, line):
+    """ Помилка розбору рядка number файлу """
+    return ValueError(f"Рядок {number}: некоректне ребро {line.strip()!r}")
+
+
+def _weight(field, number, line):
+    """ Перетворює поле ваги на число, повідомляючи номер рядка при помилці """
+    try:
+        return float(field)
+    except ValueError:
+        raise _malformed(number, line) from None
+
+
+def _parse_edges(chunk, columns, start):
+    """ Розбирає блок рядків формату edges; start - номер першого рядка блоку у файлі """
+    us, vs, ws = columns
+    for number, line in enumerate(chunk, start):
+        parts = line.split()
+        # Порожні рядки та коментарі пропускаємо
+        if not parts or parts[0][0] in "#%":
+            continue
+        if len(parts) < 2:
+            raise _malformed(number, line)
+        us.append(parts[0])
+        vs.append(parts[1])
+        ws.append(_weight(parts[2], number, line) if len(parts) > 2 else 1.0)
+
+
+def _is_number(field):
+    try:
+        float(field)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_header(rows):
+    """ Чи є перший з рядків rows (перші непорожні рядки csv) заголовком """
+    first = [field.strip() for field in rows[0]]
+    if len(first) > 2 and not _is_number(first[2]):
+        return True
+    if all(field.lower() in HEADER_NAMES for field in first):
+        return True
+    # Нечислові мітки над числовими: "from,to" над "1,2"
+    return (len(rows) > 1 and not any(map(_is_number, first[:2]))
+            and all(map(_is_number, rows[1][:2])))
+
+
+def _csv_rows(chunk, start):
+    """ Непорожні рядки csv блоку разом з номерами рядків у файлі """
+    reader = csv.reader(chunk)
+    for row in reader:
+        if row:
+            yield start + reader.line_num - 1, row
+
+
+def _parse_csv(chunk, columns, start):
+    """ Розбирає блок рядків формату csv; start - номер першого рядка блоку у файлі """
+    us, vs, ws = columns
+    rows = _csv_rows(chunk, start)
+    if start == 1:
+        # Заголовок можливий лише в першому непорожньому рядку файлу
+        head = list(itertools.islice(rows, 2))
+        if head and _is_header([row for _, row in head]):
+            head.pop(0)
+        rows = itertools.chain(head, rows)
+    for number, row in rows:
+        if len(row) < 2:
+            raise _malformed(number, ",".join(row))
+        us.append(row[0].strip())
+        vs.append(row[1].strip())
+        ws.append(_weight(row[2], number, ",".join(row)) if len(row) > 2 else 1.0)
+
+
+def _parse_dimacs(chunk, columns, meta, start):
+    """ Розбирає блок рядків формату DIMACS; кількість вершин з рядка p записується в meta """
+    us, vs, ws = columns
+    for number, line in enumerate(chunk, start):
+        if line.startswith("a"):
+            parts = line.split()
+            if len(parts) != 4:
+                raise _malformed(number, line)
+            try:
+                us.append(int(parts[1]))
+                vs.append(int(parts[2]))
+            except ValueError:
+                raise _malformed(number, line) from None
+            ws.append(_weight(parts[3], number, line))
+        elif line.startswith("p"):
+            meta["nodes"] = int(line.split()[2])
+
+
+def iter_edge_chunks(path, fmt=None, chunk_size=CHUNK_SIZE, meta=None):
+    """
+    Потоково читає ребра з файлу блоками.
+
+    Args:
+    path (str): Шлях до файлу.
+    fmt (str): Формат ('csv', 'edges' або 'dimacs'); None - за розширенням.
+    chunk_size (int): Приблизний розмір блоку читання в байтах.
+    meta (dict): Необов'язковий словник для даних заголовка файлу
+    (для dimacs - "nodes", кількість вершин).
+
+    Yields:
+    tuple: (us, vs, ws) - списки міток початкових і кінцевих вершин та ваг
+    ребер одного блоку (для dimacs мітки - цілі числа 1..n).
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Невідомий формат графа: {fmt}")
+    if meta is None:
+        meta = {}
+    with open(path, newline="") as file:
+        start = 1  # Номер першого рядка блоку у файлі
+        for chunk in _read_chunks(file, chunk_size):
+            columns = ([], [], [])
+            if fmt == "csv":
+                _parse_csv(chunk, columns, start)
+            elif fmt == "edges":
+                _parse_edges(chunk, columns, start)
+            else:
+                _parse_dimacs(chunk, columns, meta, start)
+            start += len(chunk)
+            yield columns
+
+
+def load_csr(path, fmt=None, label_type=str, directed=None, chunk_size=CHUNK_SIZE):
+    """
+    Завантажує граф з текстового файлу одразу у формат CSR.
+
+    Args:
+    path (str): Шлях до файлу.
+    fmt (str): Формат ('csv', 'edges' або 'dimacs'); None - за розширенням.
+    label_type (callable): Перетворення текстової мітки вершини (наприклад, int).
+    Для dimacs мітки завжди цілі.
+    directed (bool): Чи є ребра орієнтованими. За замовчуванням dimacs -
+    орієнтований (дуги зворотного напрямку записані у файлі окремо), інші
+    формати - неорієнтовані, як task_3.Graph.
+    chunk_size (int): Приблизний розмір блоку читання в байтах.
+
+    Returns:
+    CSRGraph: Завантажений граф.
+    """
+    fmt = fmt or detect_format(path)
+    if directed is None:
+        directed = fmt == "dimacs"
+    labels = []  # Номер -> мітка
+    ids = {}     # Мітка -> номер (інтернування міток)
+    largest = 0  # Найбільший номер вершини DIMACS
+    meta = {}
+    sources, targets, weights = array('q'), array('q'), array('d')
+
+    for us, vs, ws in iter_edge_chunks(path, fmt, chunk_size, meta):
+        if fmt == "dimacs":
+            # Вершини DIMACS пронумеровані з 1, тож словник міток не потрібен
+            sources.extend(u - 1 for u in us)
+            targets.extend(v - 1 for v in vs)
+            if us:
+                largest = max(largest, max(us), max(vs))
+        else:
+            for column, out in ((us, sources), (vs, targets)):
+                for raw in column:
+                    label = label_type(raw)
+                    i = ids.get(label)
+                    if i is None:
+                        i = ids[label] = len(labels)
+                        labels.append(label)
+                    out.append(i)
+        weights.extend(ws)
+
+    if fmt == "dimacs":
+        # Мітки 1..n як range - без окремого об'єкта на кожну вершину
+        # (ізольовані вершини враховуються за кількістю з рядка p)
+        labels = range(1, max(largest, meta.get("nodes", 0)) + 1)
+        ids = None  # Словник номерів збудується лише за потреби
+    return CSRGraph.from_arrays(labels, sources, targets, weights,
+                                symmetric=not directed, ids=ids)
+
+
+def load_graph(path, fmt=None, label_type=str, chunk_size=CHUNK_SIZE):
+    """
+    Завантажує неорієнтований граф з текстового файлу в task_3.Graph.
+
+    task_3.Graph зберігає ваги у словнику з ключами-кортежами, тож кортежі на
+    кожне ребро тут неминучі; для великих файлів краще використовувати load_csr.
+    Повторне ребро, як і в Graph.add_edge, замінює вагу попереднього (load_csr
+    натомість зберігає паралельні ребра).
+
+    Args:
+    path (str): Шлях до файлу.
+    fmt (str): Формат ('csv', 'edges' або 'dimacs'); None - за розширенням.
+    label_type (callable): Перетворення текстової мітки вершини.
+    chunk_size (int): Приблизний розмір блоку читання в байтах.
+
+    Returns:
+    Graph: Завантажений граф.
+    """
+    fmt = fmt or detect_format(path)
+    if fmt == "dimacs":
+        label_type = int  # Мітки DIMACS вже цілі
+    graph = Graph()
+    for us, vs, ws in iter_edge_chunks(path, fmt, chunk_size):
+        for u, v, w in zip(us, vs, ws):
+            u, v = label_type(u), label_type(v)
+            if u not in graph.edges:
+                graph.add_node(u)
+            if v not in graph.edges:
+                graph.add_node(v)
+            graph.add_edge(u, v, w)
+    return graph
+
+
+def save_binary(csr, path):
+    """
+    Зберігає CSR-граф у двійковому форматі для load_binary.
+
+    Файл складається з заголовка HEADER, масивів offsets (int64), targets
+    (int64), weights (float64) і міток: масиву int64 або рядків UTF-8,
+    розділених символом нового рядка. Усі масиви вирівняні на 8 байт.
+
+    Args:
+    csr (CSRGraph): Граф для збереження.
+    path (str): Шлях до файлу.
+    """
+    labels = csr.labels
+    if all(type(label) is int for label in labels):
+        kind, blob = LABELS_INT, array('q', labels).tobytes()
+    elif all(isinstance(label, str) and "\n" not in label for label in labels):
+        kind, blob = LABELS_STR, "\n".join(labels).encode()
+    else:
+        raise ValueError("Мітки вершин мають бути цілими числами або рядками без символу нового рядка")
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, kind, 0,
+                               csr.num_nodes, csr.num_edges, len(blob)))
+        for data in (csr.offsets, csr.targets, csr.weights):
+            file.write(memoryview(data).cast('B'))
+        file.write(blob)
+
+
+def load_binary(path):
+    """
+    Відкриває граф, збережений save_binary, через mmap.
+
+    Масиви offsets, targets і weights - це memoryview над сторінками файлу:
+    вони нічого не копіюють і підвантажуються операційною системою лише при
+    зверненні. Цілі мітки теж залишаються у файлі, рядкові - декодуються.
+
+    Args:
+    path (str): Шлях до файлу.
+
+    Returns:
+    CSRGraph: Граф лише для читання.
+    """
+    with open(path, "rb") as file:
+        # Відображення залишається дійсним після закриття файлу
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, kind, _, n, m, labels_size = HEADER.unpack_from(mapped)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"{path}: не файл графа CSR версії {FORMAT_VERSION}")
+
+    view = memoryview(mapped)
+    position = HEADER.size
+    arrays = []
+    for length, typecode in ((n + 1, 'q'), (m, 'q'), (m, 'd')):
+        arrays.append(view[position:position + 8 * length].cast(typecode))
+        position += 8 * length
+    blob = view[position:position + labels_size]
+    if kind == LABELS_INT:
+        labels = blob.cast('q')
+    else:
+        labels = bytes(blob).decode().split("\n") if n else []
+    return CSRGraph(labels, *arrays)
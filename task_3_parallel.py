@@ -0,0 +1,189 @@
+"""
+Паралельне обчислення найкоротших відстаней від багатьох джерел.
+
+Граф переводиться у формат CSR (task_3_csr) і один раз копіюється у спільну
+пам'ять (multiprocessing.shared_memory). Процеси-виконавці підключаються до неї
+лише для читання, тому граф не серіалізується для кожного завдання. Кожен
+виконавець запускає Дейкстру для своїх джерел і записує рядок відстаней
+безпосередньо у спільну матрицю результатів або повертає його для потокової
+обробки.
+
+Приклад:
+    matrix, labels = distance_matrix(graph, depots, workers=8)
+    for depot, row in iter_distance_rows(graph, depots):
+        ...
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from task_3_csr import CSRGraph, dijkstra_csr_ids
+
+_worker = {}  # Стан процесу-виконавця: підключені блоки пам'яті, граф, матриця
+
+
+def _share(values):
+    """
+    Копіює типізований масив у новий блок спільної пам'яті.
+
+    Args:
+    values (array): Масив для копіювання.
+
+    Returns:
+    tuple: (SharedMemory, опис (ім'я, typecode, довжина)).
+    """
+    nbytes = max(1, values.itemsize * len(values))
+    block = shared_memory.SharedMemory(create=True, size=nbytes)
+    block.buf[:values.itemsize * len(values)] = values.tobytes()
+    return block, (block.name, values.typecode, len(values))
+
+
+def _attach(description):
+    """
+    Підключається до блоку спільної пам'яті у процесі-виконавці.
+
+    Блоком володіє головний процес: лише він викликає unlink().
+
+    Args:
+    description (tuple): (ім'я, typecode, довжина).
+
+    Returns:
+    tuple: (SharedMemory, memoryview з потрібним типом елементів).
+    """
+    name, typecode, length = description
+    block = shared_memory.SharedMemory(name=name)
+    return block, block.buf.cast(typecode)[:length]
+
+
+def _init_worker(offsets, targets, weights, matrix=None):
+    """
+    Ініціалізує процес-виконавець: підключає граф і (за потреби) матрицю результатів.
+
+    Args:
+    offsets, targets, weights (tuple): Описи блоків спільної пам'яті масивів CSR.
+    matrix (tuple | None): (ім'я блоку, кількість рядків, кількість стовпців).
+    """
+    blocks = []
+    views = []
+    for description in (offsets, targets, weights):
+        block, view = _attach(description)
+        blocks.append(block)
+        views.append(view)
+    _worker["blocks"] = blocks
+    _worker["graph"] = CSRGraph([], *views)
+    if matrix is not None:
+        name, rows, columns = matrix
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+        _worker["matrix"] = np.ndarray((rows, columns), dtype=np.float64, buffer=block.buf)
+
+
+def _fill_row(task):
+    """
+    Обчислює відстані від одного джерела і записує їх у рядок спільної матриці.
+
+    Args:
+    task (tuple): (номер рядка, номер вершини-джерела).
+
+    Returns:
+    int: Номер заповненого рядка.
+    """
+    row, source = task
+    distances, _ = dijkstra_csr_ids(_worker["graph"], source)
+    _worker["matrix"][row] = distances
+    return row
+
+
+def _compute_row(source):
+    """
+    Обчислює відстані від одного джерела і повертає їх як компактний масив.
+
+    Args:
+    source (int): Номер вершини-джерела.
+
+    Returns:
+    array: Відстані за номерами вершин.
+    """
+    distances, _ = dijkstra_csr_ids(_worker["graph"], source)
+    return array('d', distances)
+
+
+class _SharedGraph:
+    """ Контекстний менеджер, що розміщує CSR-граф у спільній пам'яті і звільняє її """
+    def __init__(self, graph):
+        self.csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+        self.blocks = []
+        self.descriptions = []
+
+    def __enter__(self):
+        for values in (self.csr.offsets, self.csr.targets, self.csr.weights):
+            block, description = _share(values)
+            self.blocks.append(block)
+            self.descriptions.append(description)
+        return self
+
+    def __exit__(self, *exc_info):
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+
+
+def distance_matrix(graph, sources, workers=None, chunksize=1):
+    """
+    Обчислює щільну матрицю найкоротших відстаней від кожного джерела до всіх вершин.
+
+    Args:
+    graph (Graph | CSRGraph): Граф.
+    sources (list): Мітки вершин-джерел.
+    workers (int | None): Кількість процесів; None - кількість ядер.
+    chunksize (int): Кількість джерел, що передаються виконавцю за раз.
+
+    Returns:
+    tuple: (matrix, labels) - масив NumPy форми (len(sources), n) і мітки
+    стовпців; недосяжні вершини мають відстань inf.
+    """
+    with _SharedGraph(graph) as shared:
+        csr = shared.csr
+        rows, columns = len(sources), csr.num_nodes
+        result = shared_memory.SharedMemory(create=True, size=max(1, rows * columns * 8))
+        matrix = None
+        try:
+            matrix = np.ndarray((rows, columns), dtype=np.float64, buffer=result.buf)
+            tasks = [(row, csr.ids[source]) for row, source in enumerate(sources)]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(*shared.descriptions,
+                                               (result.name, rows, columns))) as executor:
+                for _ in executor.map(_fill_row, tasks, chunksize=chunksize):
+                    pass
+            return matrix.copy(), csr.labels
+        finally:
+            del matrix  # Звільняємо буфер перед закриттям блоку
+            result.close()
+            result.unlink()
+
+
+def iter_distance_rows(graph, sources, workers=None, chunksize=1):
+    """
+    Потоково повертає рядки відстаней від кожного джерела, не тримаючи в пам'яті
+    всю матрицю.
+
+    Args:
+    graph (Graph | CSRGraph): Граф.
+    sources (list): Мітки вершин-джерел.
+    workers (int | None): Кількість процесів; None - кількість ядер.
+    chunksize (int): Кількість джерел, що передаються виконавцю за раз.
+
+    Yields:
+    tuple: (джерело, рядок) - мітка джерела і масив NumPy відстаней у порядку
+    CSRGraph.labels.
+    """
+    with _SharedGraph(graph) as shared:
+        ids = [shared.csr.ids[source] for source in sources]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=tuple(shared.descriptions)) as executor:
+            for source, row in zip(sources, executor.map(_compute_row, ids,
+                                                         chunksize=chunksize)):
+                yield source, np.frombuffer(row, dtype=np.float64)
@@ -8,8 +8,14 @@
 
 import uuid
 import heapq
+import numpy as np
 import networkx as nx
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+from task_4_check import find_violations, first_violation
+
+LABEL_LIMIT = 127  # Найбільша кількість вузлів, для якої підписуються значення
 
 class HeapNode:
     """
@@ -22,18 +28,22 @@ class HeapNode:
         self.color = color  # Колір вузла для візуалізації
         self.id = str(uuid.uuid4())  # Унікальний ідентифікатор вузла
 
-def heap_to_tree(heap):
+def heap_to_tree(heap, colors=None):
     """
     Перетворює список-купу в бінарне дерево.
     
     Args:
     heap (list): Список, що представляє мінімальну купу.
+    colors (list): Кольори вузлів за індексами; за замовчуванням - колір HeapNode.
     
     Returns:
     HeapNode: Кореневий вузол побудованого бінарного дерева.
     """
     # Створюємо вузли для кожного елемента купи
-    nodes = [HeapNode(val) for val in heap]
+    if colors is None:
+        nodes = [HeapNode(val) for val in heap]
+    else:
+        nodes = [HeapNode(val, color) for val, color in zip(heap, colors)]
     
     # Встановлюємо зв'язки між вузлами
     for i in range(len(nodes)):
@@ -83,19 +93,33 @@ def add_edges(graph, node, pos, x=0, y=0, layer=1):
     
     return graph
 
-def draw_heap(heap):
+def draw_heap(heap, highlight_violations=False):
     """
     Візуалізує мінімальну купу.
     
     Args:
-    heap (list): Список, що представляє мінімальну купу.
+    heap (list): Список, що представляє мінімальну купу, або купа з методом
+    tree() (task_4_heaps) - тоді малюється форма її дерева.
+    highlight_violations (bool): Чи фарбувати червоним вузли, що порушують
+    властивість купи (дитина менша за батька), - обидва вузли пари.
     """
     if not heap:
         print("Купа порожня")
         return
 
+    if hasattr(heap, "tree"):
+        labels, parents = heap.tree()
+        draw_tree(labels, parents, title=f"Візуалізація купи {type(heap).__name__}")
+        return
+
     # Перетворюємо купу на дерево
-    root = heap_to_tree(heap)
+    colors = None
+    if highlight_violations:
+        colors = violation_colors(heap)
+        violation = first_violation(heap)
+        if violation is not None:
+            print(f"Порушено властивість купи: батько {violation[0]}, дитина {violation[1]}")
+    root = heap_to_tree(heap, colors)
     
     # Створюємо направлений граф
     tree = nx.DiGraph()
@@ -114,16 +138,204 @@ def draw_heap(heap):
     plt.title("Візуалізація мінімальної купи")
     plt.show()
 
-# Приклад використання
-original_list = [100, 19, 36, 17, 10, 22, 3, 25, 33, 1, 77, 2, 7, 99, 4]
+def violation_colors(heap, color="skyblue", violation_color="red"):
+    """
+    Повертає кольори вузлів купи: violation_color для обох вузлів кожної пари
+    батько - дитина, що порушує властивість купи, інакше color.
+    """
+    colors = np.full(len(heap), color, dtype=object)
+    children = find_violations(heap)
+    colors[children] = violation_color
+    colors[(children - 1) // 2] = violation_color
+    return colors.tolist()
+
+def heap_layout(n):
+    """
+    Обчислює позиції вузлів купи безпосередньо за індексами масиву.
+
+    Вузол з індексом i лежить на глибині d = floor(log2(i + 1)) і займає
+    позицію p = i + 1 - 2 ** d у своєму рівні; його координати
+    x = (2p + 1) / 2 ** d - 1, y = -d збігаються з тими, що рекурсивно
+    обчислює add_edges (зсув 1 / 2 ** layer від батька).
+
+    Args:
+    n (int): Кількість елементів купи.
+
+    Returns:
+    tuple: (x, y) - масиви NumPy координат вузлів за індексами.
+    """
+    index = np.arange(1, n + 1, dtype=np.float64)  # i + 1
+    # frexp: i + 1 = m * 2 ** e, де 0.5 <= m < 1, тож глибина - точно e - 1
+    _, exponent = np.frexp(index)
+    depth = exponent - 1
+    level_start = np.ldexp(1.0, depth)  # 2 ** d
+    x = (2 * (index - level_start) + 1) / level_start - 1
+    return x, -depth.astype(np.float64)
+
+def default_node_size(n):
+    """ Площа маркера вузла, за якої купа з n вузлів вміщується на рисунку """
+    return 2500 if n <= 15 else max(1.0, 20000 / n)
+
+def heap_edges(x, y):
+    """
+    Повертає відрізки ребер купи (дитина i - батько (i - 1) // 2) для LineCollection.
+
+    Args:
+    x, y (ndarray): Координати вузлів, як повертає heap_layout.
+
+    Returns:
+    ndarray: Масив форми (n - 1, 2, 2).
+    """
+    child = np.arange(1, len(x))
+    parent = (child - 1) // 2
+    return np.stack([np.column_stack([x[child], y[child]]),
+                     np.column_stack([x[parent], y[parent]])], axis=1)
+
+def draw_heap_array(heap, ax=None, color="skyblue", node_size=None):
+    """
+    Візуалізує мінімальну купу без проміжних HeapNode і графа NetworkX.
+
+    Позиції обчислює heap_layout, ребра (батько (i - 1) // 2 - дитина i)
+    малюються однією LineCollection, вузли - одним scatter. Значення
+    підписуються лише для невеликих куп (до LABEL_LIMIT вузлів).
+
+    Args:
+    heap (list): Список, що представляє мінімальну купу.
+    ax (Axes): Осі matplotlib; якщо не задано, створюється нова фігура і викликається plt.show().
+    color: Колір вузлів (один або масив кольорів за індексами).
+    node_size (float): Площа маркера вузла; за замовчуванням залежить від розміру купи.
+
+    Returns:
+    Axes: Осі з візуалізацією (None для порожньої купи).
+    """
+    n = len(heap)
+    if not n:
+        print("Купа порожня")
+        return None
+
+    show = ax is None
+    if show:
+        _, ax = plt.subplots(figsize=(12, 8))
+    x, y = heap_layout(n)
+
+    ax.add_collection(LineCollection(heap_edges(x, y), colors="gray", linewidths=0.5, zorder=1))
+
+    if node_size is None:
+        node_size = default_node_size(n)
+    ax.scatter(x, y, s=node_size, c=color, zorder=2)
+    if n <= LABEL_LIMIT:
+        for i, value in enumerate(heap):
+            ax.text(x[i], y[i], str(value), ha="center", va="center", zorder=3)
+
+    ax.set_xlim(-1.05, 1.05)
+    ax.set_ylim(y[-1] - 0.5, 0.5)
+    ax.set_axis_off()
+    ax.set_title("Візуалізація мінімальної купи")
+    if show:
+        plt.show()
+    return ax
+
+def tree_layout(parents):
+    """
+    Обчислює позиції вузлів довільного дерева, заданого масивом батьків.
+
+    Листя розставляється зліва направо з рівним кроком у порядку обходу
+    в глибину, кожен внутрішній вузол - посередині між першою і останньою
+    дитиною; y = -глибина. Обхід ітеративний, тож глибокі дерева (наприклад,
+    ланцюжки купи з попарним злиттям) не вичерпують стек рекурсії.
+
+    Args:
+    parents (list): Індекси батьків (-1 - корінь); батько має менший індекс за дітей.
+
+    Returns:
+    tuple: (x, y) - масиви NumPy координат вузлів, x у межах [-1, 1].
+    """
+    n = len(parents)
+    children = [[] for _ in range(n)]
+    roots = []
+    for node, parent in enumerate(parents):
+        (children[parent] if parent >= 0 else roots).append(node)
+
+    x = np.zeros(n)
+    y = np.zeros(n)
+    leaves = 0
+    stack = list(reversed(roots))
+    while stack:
+        node = stack.pop()
+        if parents[node] >= 0:
+            y[node] = y[parents[node]] - 1
+        if children[node]:
+            stack.extend(reversed(children[node]))
+        else:
+            x[node] = leaves
+            leaves += 1
+    # Діти мають більші індекси, тож у зворотному порядку вони вже розставлені
+    for node in reversed(range(n)):
+        if children[node]:
+            x[node] = (x[children[node][0]] + x[children[node][-1]]) / 2
+    if leaves > 1:
+        x = 2 * x / (leaves - 1) - 1
+    return x, y
+
+def draw_tree(labels, parents, ax=None, title="Візуалізація купи"):
+    """
+    Візуалізує дерево, задане мітками й масивом батьків (форма будь-якої купи).
+
+    Args:
+    labels (list): Мітки вузлів.
+    parents (list): Індекси батьків (-1 - корінь).
+    ax (Axes): Осі matplotlib; якщо не задано, створюється нова фігура і викликається plt.show().
+    title (str): Заголовок рисунка.
+
+    Returns:
+    Axes: Осі з візуалізацією.
+    """
+    show = ax is None
+    if show:
+        _, ax = plt.subplots(figsize=(12, 8))
+    n = len(labels)
+    x, y = tree_layout(parents)
+    child = np.array([node for node in range(n) if parents[node] >= 0], dtype=np.int64)
+    parent = np.asarray(parents, dtype=np.int64)[child]
+    segments = np.stack([np.column_stack([x[child], y[child]]),
+                         np.column_stack([x[parent], y[parent]])], axis=1)
+    ax.add_collection(LineCollection(segments.reshape(-1, 2, 2), colors="gray",
+                                     linewidths=0.5, zorder=1))
+    # Ширину рисунка визначає кількість листя, як у повного бінарного дерева з 2 * leaves - 1 вузлів
+    leaves = n - len(set(parents) - {-1})
+    ax.scatter(x, y, s=default_node_size(2 * leaves - 1), c="skyblue", zorder=2)
+    if n <= LABEL_LIMIT:
+        for i, label in enumerate(labels):
+            ax.text(x[i], y[i], str(label), ha="center", va="center", zorder=3)
+
+    ax.set_xlim(-1.1, 1.1)
+    ax.set_ylim(y.min() - 0.5, 0.5)
+    ax.set_axis_off()
+    ax.set_title(title)
+    if show:
+        plt.show()
+    return ax
+
+if __name__ == "__main__":
+    # Приклад використання
+    original_list = [100, 19, 36, 17, 10, 22, 3, 25, 33, 1, 77, 2, 7, 99, 4]
+
+    # Створення мінімальної купи за допомогою heapq: heapify за O(n)
+    # замість n викликів heappush (O(n log n))
+    heap = list(original_list)
+    heapq.heapify(heap)
+
+    print("Оригінальний список:", original_list)
+    print("Мінімальна купа:", heap)
 
-# Створення мінімальної купи за допомогою heapq
-heap = []
-for value in original_list:
-    heapq.heappush(heap, value)  # Додаємо кожен елемент до купи
+    # Візуалізація мінімальної купи
+    draw_heap(heap)
 
-print("Оригінальний список:", original_list)
-print("Мінімальна купа:", heap)
+    # Ключ змінено на місці - пара, що порушує властивість купи, стає червоною
+    corrupted = list(heap)
+    corrupted[1] = 1000
+    draw_heap(corrupted, highlight_violations=True)
 
-# Візуалізація мінімальної купи
-draw_heap(heap)
+    # Форма тих самих елементів у купі з попарним злиттям
+    from task_4_heaps import PairingHeap
+    draw_heap(PairingHeap.build(original_list))
@@ -0,0 +1,385 @@
+"""
+Покрокова анімація операцій з купою із завдання 4.
+
+RecordingHeap - мінімальна купа з тими самими push/pop, що й heapq, але
+просіювання виконується обмінами сусідніх вузлів, і кожна зміна масиву
+записується в журнал подій:
+- (SET, i, value) - у комірку i записано value (i == len - купа зростає);
+- (SWAP, i, j) - вузли i та j обмінялися значеннями;
+- (TRUNCATE, n) - купа скоротилася до n елементів.
+Результат після кожної операції збігається з heapq елемент в елемент.
+
+HeapAnimator відтворює журнал на постійних артистах matplotlib. Розкладка
+будується один раз для найбільшого розміру купи в журналі; кадр змінює
+лише вузли з останньої події: відновлює з фону без вузлів (тільки ребра)
+прямокутники маркерів цих вузлів і домальовує в них, з обрізанням по
+прямокутнику, усі вузли рівня, чиї маркери туди заходять, з поточними
+кольорами та підписами - результат збігається з повним перемальовуванням.
+Тож вартість кадру - O(змінених вузлів), а не O(n); повне перемальовування
+всіх вузлів відбувається лише при повному перемальовуванні фігури (наприклад,
+після зміни розміру вікна).
+
+Приклад:
+    heap = RecordingHeap([5, 3, 8])
+    heap.push(1)
+    heap.pop()
+    animate(heap.initial, heap.events)               # У вікні
+    export_gif(heap.initial, heap.events, "heap.gif")  # Без дисплея
+"""
+
+import heapq
+import math
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from matplotlib.transforms import Bbox
+
+from task_4 import LABEL_LIMIT, default_node_size, heap_edges, heap_layout
+
+SET, SWAP, TRUNCATE = "set", "swap", "truncate"  # Типи подій журналу
+
+NODE_COLOR = "skyblue"          # Вузол купи
+HIGHLIGHT_COLOR = "orange"      # Вузол, змінений останньою подією
+EMPTY_COLOR = "whitesmoke"      # Комірка за межами поточного розміру купи
+
+
+class RecordingHeap:
+    """ Мінімальна купа, що записує кожен обмін при просіюванні """
+    def __init__(self, items=()):
+        """
+        Args:
+        items (iterable): Початкові елементи; впорядковуються heapq.heapify
+        без запису подій (це початковий стан для відтворення).
+        """
+        self.heap = list(items)
+        heapq.heapify(self.heap)
+        self.initial = list(self.heap)  # Стан, з якого починається журнал
+        self.events = []
+
+    def __len__(self):
+        return len(self.heap)
+
+    def _swap(self, i, j):
+        """ Обмінює два вузли і записує подію """
+        heap = self.heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self.events.append((SWAP, i, j))
+
+    def _sift_up(self, start, pos):
+        """ Піднімає вузол pos, поки він менший за батька (як heapq._siftdown) """
+        heap = self.heap
+        while pos > start:
+            parent = (pos - 1) >> 1
+            if heap[pos] < heap[parent]:
+                self._swap(pos, parent)
+                pos = parent
+            else:
+                break
+
+    def _sift_down(self, pos):
+        """
+        Опускає вузол pos до листа вздовж менших дітей, а потім піднімає
+        його назад, як heapq._siftup - тому порядок збігається з heapq.
+        """
+        heap = self.heap
+        end = len(heap)
+        start = pos
+        child = 2 * pos + 1
+        while child < end:
+            right = child + 1
+            if right < end and not heap[child] < heap[right]:
+                child = right
+            self._swap(pos, child)
+            pos = child
+            child = 2 * pos + 1
+        self._sift_up(start, pos)
+
+    def push(self, item):
+        """ Додає елемент до купи (як heapq.heappush) """
+        self.heap.append(item)
+        self.events.append((SET, len(self.heap) - 1, item))
+        self._sift_up(0, len(self.heap) - 1)
+
+    def pop(self):
+        """ Вилучає найменший елемент з купи (як heapq.heappop) """
+        last = self.heap.pop()
+        self.events.append((TRUNCATE, len(self.heap)))
+        if not self.heap:
+            return last
+        item = self.heap[0]
+        self.heap[0] = last
+        self.events.append((SET, 0, last))
+        self._sift_down(0)
+        return item
+
+
+def replay(initial, events):
+    """
+    Застосовує журнал подій до копії початкового стану без візуалізації.
+
+    Returns:
+    list: Стан купи після всіх подій.
+    """
+    heap = list(initial)
+    for event in events:
+        if event[0] == SET:
+            _, i, value = event
+            if i == len(heap):
+                heap.append(value)
+            else:
+                heap[i] = value
+        elif event[0] == SWAP:
+            _, i, j = event
+            heap[i], heap[j] = heap[j], heap[i]
+        else:
+            del heap[event[1]:]
+    return heap
+
+
+def _capacity(initial, events):
+    """ Найбільший розмір купи протягом журналу """
+    size = largest = len(initial)
+    for event in events:
+        if event[0] == SET and event[1] == size:
+            size += 1
+            largest = max(largest, size)
+        elif event[0] == TRUNCATE:
+            size = event[1]
+    return largest
+
+
+class HeapAnimator:
+    """ Відтворює журнал RecordingHeap, перемальовуючи лише змінені вузли """
+    def __init__(self, initial, events, ax, node_size=None):
+        """
+        Args:
+        initial (list): Початковий стан купи.
+        events (list): Журнал подій RecordingHeap.
+        ax (Axes): Осі matplotlib, на яких малюється купа.
+        node_size (float): Площа маркера вузла; за замовчуванням - як у draw_heap_array.
+        """
+        self.ax = ax
+        self.events = events
+        self.position = 0  # Індекс наступної події
+        self.size = len(initial)
+        capacity = max(1, _capacity(initial, events))
+        self.values = list(initial) + [None] * (capacity - len(initial))
+        self.highlighted = []  # Вузли, підсвічені попереднім кадром
+        self.background = None  # Фон без вузлів (лише ребра) для відновлення клітинок
+
+        x, y = heap_layout(capacity)
+        self.xy = np.column_stack([x, y])
+        self.colors = {name: np.array(to_rgba(name)) for name in
+                       (NODE_COLOR, HIGHLIGHT_COLOR, EMPTY_COLOR)}
+        self.depth = (-y).astype(int)  # Рівень кожного вузла
+        node_size = default_node_size(capacity) if node_size is None else node_size
+        self.node_size = node_size
+
+        ax.add_collection(LineCollection(heap_edges(x, y), colors="gray",
+                                         linewidths=0.5, zorder=1))
+        face = np.tile(self.colors[EMPTY_COLOR], (capacity, 1))
+        face[:self.size] = self.colors[NODE_COLOR]
+        # Вузли - animated: повне перемальовування фігури малює лише ребра,
+        # а вузли домальовуються в _on_draw після збереження фону
+        # Дві однакові товщини контуру вимикають оптимізацію одного маркера
+        # (draw_markers прив'язує центри до пікселів), тож вузол у кадрі
+        # лягає в ті самі пікселі, що й при повному перемальовуванні
+        self.nodes = ax.scatter(x, y, s=node_size, c=face, linewidths=[1, 1],
+                                zorder=2, animated=True)
+        self.face = face  # Поточні кольори вузлів (передаються в scatter при повному перемальовуванні)
+        self.overlay = ax.scatter([], [], s=node_size, edgecolors="face", linewidths=[1, 1],
+                                  zorder=3, animated=True)
+        self.labels = []
+        if capacity <= LABEL_LIMIT:
+            self.labels = [ax.text(px, py, "" if value is None else str(value),
+                                   ha="center", va="center", zorder=4, animated=True)
+                           for px, py, value in zip(x, y, self.values)]
+
+        ax.set_xlim(-1.05, 1.05)
+        ax.set_ylim(y[-1] - 0.5, 0.5)
+        ax.set_axis_off()
+        ax.figure.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event):
+        """ Після повного перемальовування зберігає фон і малює всі вузли (O(n)) """
+        canvas = self.ax.figure.canvas
+        self.background = canvas.copy_from_bbox(self.ax.bbox)
+        face = self.face.copy()
+        face[self.highlighted] = self.colors[HIGHLIGHT_COLOR]  # Той самий кадр, що й після step
+        self.nodes.set_facecolor(face)
+        self.ax.draw_artist(self.nodes)
+        for label in self.labels:
+            self.ax.draw_artist(label)
+
+    def _apply(self, event):
+        """ Застосовує подію до стану та постійних артистів, повертає змінені вузли """
+        if event[0] == SET:
+            _, i, value = event
+            self.size = max(self.size, i + 1)
+            self.values[i] = value
+            changed = [i]
+        elif event[0] == SWAP:
+            _, i, j = event
+            self.values[i], self.values[j] = self.values[j], self.values[i]
+            changed = [i, j]
+        else:
+            changed = list(range(event[1], self.size))
+            for i in changed:
+                self.values[i] = None
+            self.size = event[1]
+        for i in changed:
+            self.face[i] = self.colors[NODE_COLOR if i < self.size else EMPTY_COLOR]
+            if self.labels:
+                self.labels[i].set_text("" if self.values[i] is None else str(self.values[i]))
+        return changed
+
+    def step(self):
+        """
+        Відтворює наступну подію і перемальовує лише змінені вузли.
+
+        Returns:
+        bool: False, якщо подій більше немає.
+        """
+        if self.position >= len(self.events):
+            return False
+        changed = self._apply(self.events[self.position])
+        self.position += 1
+        # Живі змінені вузли підсвічуються; звільнені pop клітинки стають порожніми
+        live = [i for i in changed if i < self.size]
+        if self.background is not None:
+            # Попередньо підсвічені вузли повертаються до звичайного кольору
+            self._redraw(sorted(set(self.highlighted) | set(changed)), set(live))
+            self.ax.figure.canvas.blit(self.ax.bbox)
+        self.highlighted = live
+        return True
+
+    def _redraw(self, indices, highlighted):
+        """
+        Відновлює з фону прямокутники маркерів вузлів indices і домальовує в них
+        поточний стан; вузли з множини highlighted - кольором підсвічування.
+        """
+        if not indices:
+            return
+        ax = self.ax
+        canvas = ax.figure.canvas
+        height = ax.figure.bbox.height
+        origin = self.background.get_extents()[:2]
+        # Радіус маркера в пікселях із запасом на згладжування країв
+        radius = math.sqrt(self.node_size) * ax.figure.dpi / 72 / 2 + 2
+        unit = ax.transData.transform([(1, 0)])[0, 0] - ax.transData.transform([(0, 0)])[0, 0]
+        capacity = len(self.values)
+
+        for i, (cx, cy) in zip(indices, ax.transData.transform(self.xy[indices])):
+            x1, y1 = math.floor(cx - radius), math.floor(cy - radius)
+            x2, y2 = math.ceil(cx + radius), math.ceil(cy + radius)
+            # restore_region рахує y від верхнього краю фігури і включає обидві
+            # межі, а xy - це кут збереженої області, а не прямокутника; відрізок
+            # [x1, x2) x [y1, y2) збігається з пікселями, які пропускає clip_box
+            canvas.restore_region(self.background, bbox=(x1, height - y2, x2 - 1, height - y1 - 1),
+                                  xy=origin)
+            # Сусіди на рівні стоять через 2 / 2 ** d; їхні маркери можуть заходити в прямокутник
+            depth = self.depth[i]
+            reach = int(2 * radius / (unit * 2.0 ** (1 - depth))) + 1
+            first = (1 << depth) - 1
+            group = np.arange(max(first, i - reach), min(2 * first + 1, capacity, i + reach + 1))
+            face = self.face[group].copy()
+            for k, j in enumerate(group):
+                if j in highlighted:
+                    face[k] = self.colors[HIGHLIGHT_COLOR]
+            clip = Bbox([[x1, y1], [x2, y2]])
+            self.overlay.set_offsets(self.xy[group])
+            self.overlay.set_facecolor(face)
+            self.overlay.set_clip_box(clip)
+            ax.draw_artist(self.overlay)
+            for j in group if self.labels else ():
+                label = self.labels[j]
+                label.set_clip_box(clip)
+                label.set_clip_on(True)
+                ax.draw_artist(label)
+                label.set_clip_on(False)  # Повне перемальовування малює підписи без обрізання
+
+
+def animate(initial, events, interval=50, node_size=None):
+    """
+    Відтворює журнал подій у вікні matplotlib.
+
+    Args:
+    initial (list): Початковий стан купи.
+    events (list): Журнал подій RecordingHeap.
+    interval (int): Затримка між кадрами в мілісекундах.
+    node_size (float): Площа маркера вузла.
+    """
+    fig, ax = plt.subplots(figsize=(12, 8))
+    ax.set_title("Операції з мінімальною купою")
+    animator = HeapAnimator(initial, events, ax, node_size)
+    timer = fig.canvas.new_timer(interval=interval)
+
+    def tick():
+        if not animator.step():
+            timer.stop()
+
+    timer.add_callback(tick)
+    timer.start()
+    plt.show()
+
+
+def export_gif(initial, events, path, fps=10, dpi=80, node_size=None, every=1):
+    """
+    Відтворює журнал подій без дисплея (Agg) і зберігає його у GIF через Pillow.
+
+    Кадри малюються так само інкрементно, як у вікні, і одразу копіюються
+    з буфера Agg; на кадр записується лише кожна every-та подія.
+
+    Args:
+    initial (list): Початковий стан купи.
+    events (list): Журнал подій RecordingHeap.
+    path (str): Шлях до файлу .gif.
+    fps (int): Кадрів за секунду.
+    dpi (int): Роздільність кадрів.
+    node_size (float): Площа маркера вузла.
+    every (int): Записувати кожну every-ту подію.
+
+    Returns:
+    int: Кількість записаних кадрів.
+    """
+    from PIL import Image
+
+    fig = Figure(figsize=(12, 8), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.set_title("Операції з мінімальною купою")
+    animator = HeapAnimator(initial, events, ax, node_size)
+    canvas.draw()
+    written = 1
+
+    def snapshot():
+        # Копія буфера: наступні кадри малюються в той самий буфер
+        return Image.frombuffer("RGBA", canvas.get_width_height(),
+                                bytes(canvas.buffer_rgba())).convert("RGB")
+
+    def frames():
+        nonlocal written
+        count = 0
+        while animator.step():
+            count += 1
+            if count % every == 0:
+                written += 1
+                yield snapshot()
+
+    snapshot().save(path, save_all=True, append_images=frames(),
+                    duration=int(1000 / fps), loop=0)
+    return written
+
+
+if __name__ == "__main__":
+    # Приклад: кілька вставок і вилучень з купи з task_4
+    heap = RecordingHeap([100, 19, 36, 17, 10, 22, 3, 25, 33, 1, 77, 2, 7, 99, 4])
+    for value in (0, 50, 5):
+        heap.push(value)
+    for _ in range(3):
+        heap.pop()
+    animate(heap.initial, heap.events, interval=400)
@@ -0,0 +1,250 @@
+"""
+Перевірка і профілювання куп heapq для завдання 4.
+
+Перевірка властивості купи векторизована NumPy: усі пари батько - дитина
+(i - 1) // d - i порівнюються d зрізами масиву за O(n), тож зіпсовану купу
+(наприклад, після зміни ключа елемента на місці) видно одразу разом
+з першою парою індексів, що порушує порядок.
+
+HeapProfiler - заміна функцій heapq з тими самими іменами й сигнатурами.
+Поки профілювання вимкнене, його атрибути heappush, heappop тощо - це самі
+функції heapq, тож виклик profiler.heappush(heap, x) коштує стільки ж,
+скільки heapq.heappush(heap, x). Увімкнене профілювання підставляє
+реалізації на Python, що повторюють heapq крок у крок, рахують порівняння
+й переміщення елементів і збирають гістограми тривалості операцій.
+
+Модуль не залежить від matplotlib і працює без графічного середовища.
+
+Приклад:
+    profiler = HeapProfiler(enabled=True)
+    profiler.heapify(heap)
+    profiler.heappush(heap, 5)
+    print(profiler.report())
+    first_violation(heap)  # None або (батько, дитина)
+"""
+
+import heapq
+import time
+from collections import Counter
+
+import numpy as np
+
+OPERATIONS = ("heappush", "heappop", "heapify", "heappushpop", "heapreplace")
+
+
+def _as_keys(heap):
+    """
+    Масив NumPy ключів купи: числовий, якщо всі елементи - числа, інакше
+    масив об'єктів, що порівнюються як у heapq (за правилами Python).
+    """
+    if isinstance(heap, np.ndarray) and heap.ndim == 1:
+        return heap
+    try:
+        values = np.asarray(heap)
+    except ValueError:
+        values = None  # Кортежі з вкладеними послідовностями різної довжини
+    if values is not None and values.ndim == 1 and values.dtype.kind in "biuf":
+        return values
+    # Поелементно: інакше NumPy розгорнув би кортежі в додаткові виміри
+    values = np.empty(len(heap), dtype=object)
+    for i, value in enumerate(heap):
+        values[i] = value
+    return values
+
+
+def find_violations(heap, d=2):
+    """
+    Знаходить усі порушення властивості мінімальної купи за O(n).
+
+    Args:
+    heap (list): Список (або масив NumPy), що має бути мінімальною купою.
+    d (int): Арність купи (2 для heapq).
+
+    Returns:
+    ndarray: Індекси дітей, менших за свого батька (батько - (i - 1) // d), за зростанням.
+    """
+    values = _as_keys(heap)
+    # Діти з номером k серед братів (k = 1..d) - це зріз values[k::d], а їхні
+    # батьки - префікс values[:m]: порівняння без вибірки за індексами
+    bad = np.zeros(len(values), dtype=bool)
+    for k in range(1, d + 1):
+        children = values[k::d]
+        bad[k::d] = children < values[:len(children)]
+    return np.flatnonzero(bad)
+
+
+def first_violation(heap, d=2):
+    """
+    Повертає першу (за індексом дитини) пару (батько, дитина), що порушує
+    властивість мінімальної купи, або None для коректної купи.
+    """
+    violations = find_violations(heap, d)
+    if not len(violations):
+        return None
+    child = int(violations[0])
+    return (child - 1) // d, child
+
+
+def validate_heap(heap, d=2):
+    """ Викидає ValueError з першою парою індексів, якщо heap не є мінімальною купою """
+    violation = first_violation(heap, d)
+    if violation is not None:
+        parent, child = violation
+        raise ValueError(f"Порушено властивість купи: heap[{parent}] = {heap[parent]!r} > "
+                         f"heap[{child}] = {heap[child]!r}")
+
+
+class HeapProfiler:
+    """
+    Функції heapq з підрахунком порівнянь, переміщень і гістограмами тривалості.
+
+    Атрибути comparisons і swaps - загальні лічильники; histograms - для
+    кожної операції Counter: номер кошика k -> кількість викликів
+    тривалістю [2 ** (k - 1), 2 ** k) наносекунд. Тривалість вимірюється
+    для реалізації на Python, тож її варто порівнювати між операціями
+    й розмірами купи, а не з heapq напряму.
+    """
+    def __init__(self, enabled=False, validate=False):
+        """
+        Args:
+        enabled (bool): Чи профілювати операції.
+        validate (bool): Чи перевіряти купу після кожної профільованої
+        операції (O(n), лише для налагодження); порушення - ValueError.
+        """
+        self.validate = validate
+        self.reset()
+        self.enabled = enabled
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value):
+        self._enabled = bool(value)
+        # Вимкнено - атрибути вказують безпосередньо на функції heapq
+        source = self if self._enabled else heapq
+        prefix = "_" if self._enabled else ""
+        for name in OPERATIONS:
+            setattr(self, name, getattr(source, prefix + name))
+
+    def reset(self):
+        """ Обнуляє лічильники та гістограми """
+        self.comparisons = 0
+        self.swaps = 0
+        self.calls = Counter()
+        self.histograms = {name: Counter() for name in OPERATIONS}
+
+    def _record(self, name, heap, start):
+        elapsed = time.perf_counter_ns() - start
+        self.calls[name] += 1
+        self.histograms[name][elapsed.bit_length()] += 1
+        if self.validate:
+            validate_heap(heap)
+
+    # Просіювання - ті самі алгоритми, що й у heapq (_siftdown і _siftup)
+    def _siftdown(self, heap, startpos, pos):
+        newitem = heap[pos]
+        comparisons = moves = 0
+        while pos > startpos:
+            parentpos = (pos - 1) >> 1
+            parent = heap[parentpos]
+            comparisons += 1
+            if newitem < parent:
+                heap[pos] = parent
+                pos = parentpos
+                moves += 1
+                continue
+            break
+        heap[pos] = newitem
+        self.comparisons += comparisons
+        self.swaps += moves
+
+    def _siftup(self, heap, pos):
+        endpos = len(heap)
+        startpos = pos
+        newitem = heap[pos]
+        childpos = 2 * pos + 1
+        comparisons = moves = 0
+        while childpos < endpos:
+            rightpos = childpos + 1
+            if rightpos < endpos:
+                comparisons += 1
+                if not heap[childpos] < heap[rightpos]:
+                    childpos = rightpos
+            heap[pos] = heap[childpos]
+            moves += 1
+            pos = childpos
+            childpos = 2 * pos + 1
+        heap[pos] = newitem
+        self.comparisons += comparisons
+        self.swaps += moves
+        self._siftdown(heap, startpos, pos)
+
+    def _heappush(self, heap, item):
+        start = time.perf_counter_ns()
+        heap.append(item)
+        self._siftdown(heap, 0, len(heap) - 1)
+        self._record("heappush", heap, start)
+
+    def _heappop(self, heap):
+        start = time.perf_counter_ns()
+        lastelt = heap.pop()  # IndexError для порожньої купи, як у heapq
+        if heap:
+            returnitem = heap[0]
+            heap[0] = lastelt
+            self._siftup(heap, 0)
+        else:
+            returnitem = lastelt
+        self._record("heappop", heap, start)
+        return returnitem
+
+    def _heapify(self, heap):
+        start = time.perf_counter_ns()
+        for i in reversed(range(len(heap) // 2)):
+            self._siftup(heap, i)
+        self._record("heapify", heap, start)
+
+    def _heappushpop(self, heap, item):
+        start = time.perf_counter_ns()
+        if heap:
+            self.comparisons += 1
+            if heap[0] < item:
+                item, heap[0] = heap[0], item
+                self._siftup(heap, 0)
+        self._record("heappushpop", heap, start)
+        return item
+
+    def _heapreplace(self, heap, item):
+        start = time.perf_counter_ns()
+        returnitem = heap[0]  # IndexError для порожньої купи, як у heapq
+        heap[0] = item
+        self._siftup(heap, 0)
+        self._record("heapreplace", heap, start)
+        return returnitem
+
+    def percentile(self, name, q):
+        """
+        Оцінка q-го перцентиля тривалості операції name в наносекундах
+        (верхня межа кошика гістограми); None, якщо викликів не було.
+        """
+        histogram = self.histograms[name]
+        total = sum(histogram.values())
+        if not total:
+            return None
+        seen = 0
+        for bucket in sorted(histogram):
+            seen += histogram[bucket]
+            if seen >= q / 100 * total:
+                return 1 << bucket
+        return 1 << max(histogram)
+
+    def report(self):
+        """ Повертає текстовий звіт: лічильники і перцентилі тривалості операцій """
+        lines = [f"порівнянь: {self.comparisons}, переміщень: {self.swaps}"]
+        for name in OPERATIONS:
+            if self.calls[name]:
+                lines.append(f"{name:>12}: {self.calls[name]} викликів, "
+                             f"p50 <= {self.percentile(name, 50)} нс, "
+                             f"p99 <= {self.percentile(name, 99)} нс")
+        return "\n".join(lines)
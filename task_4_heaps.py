@@ -0,0 +1,551 @@
+"""
+Змінні реалізації купи зі спільним інтерфейсом для завдання 4.
+
+Усі купи - мінімальні й підтримують однакові операції:
+- push(key, value) - додає елемент і повертає його дескриптор (HeapItem);
+- pop() / peek() - видаляє / повертає пару (ключ, значення) з найменшим ключем;
+- decrease_key(item, key) - зменшує ключ елемента за дескриптором;
+- build(keys, values) - будує купу з послідовності ключів;
+- merge(other) - забирає всі елементи іншої купи того ж типу;
+- tree() - форма купи як дерево (мітки й батьки) для task_4.draw_heap.
+
+Реалізації:
+- BinaryHeap - heapq: build через heapify за O(n), decrease_key ліниво
+  (новий запис у купі, старий пропускається при pop, як у Дейкстрі з task_3);
+- DaryHeap - d-арна купа в масиві з позиціями елементів: нижча висота
+  (log_d n) робить push і decrease_key дешевшими, pop - порівнює d дітей;
+- PairingHeap - купа з попарним злиттям: push, merge і decrease_key за O(1),
+  pop - амортизовано O(log n);
+- RadixHeap - поразрядна купа для невід'ємних цілих ключів, що не менші за
+  останній виданий (монотонна черга, як у Дейкстрі): кошики за старшим
+  бітом, у якому ключ відрізняється від останнього мінімуму.
+
+Приклад:
+    heap = PairingHeap.build([5, 3, 8])
+    item = heap.push(7, "A")
+    heap.decrease_key(item, 1)
+    heap.pop()  # (1, 'A')
+"""
+
+import heapq
+import itertools
+from abc import ABC, abstractmethod
+
+_sequence = itertools.count()  # Порядкові номери записів BinaryHeap (спільні для merge)
+
+
+class HeapItem:
+    """ Дескриптор елемента купи: ключ і значення (лише для читання ззовні) """
+    __slots__ = ("key", "value")
+
+    def __init__(self, key, value=None):
+        self.key = key
+        self.value = value
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.key!r}, {self.value!r})"
+
+
+class _Owner:
+    """
+    Мітка купи, якій належать дескриптори. merge підвішує мітку другої купи
+    під мітку цієї (як у системі неперетинних множин), тож дескриптори не
+    треба обходити, а власника знаходить _find.
+    """
+    __slots__ = ("parent",)
+
+    def __init__(self):
+        self.parent = None
+
+
+def _find(owner):
+    """ Повертає кореневу мітку - ту, що зберігає купа-власник (зі скороченням шляху) """
+    while owner.parent is not None:
+        if owner.parent.parent is not None:
+            owner.parent = owner.parent.parent
+        owner = owner.parent
+    return owner
+
+
+class Heap(ABC):
+    """ Спільний інтерфейс мінімальних куп; реалізацію без усіх операцій не можна створити """
+    def __init__(self):
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @abstractmethod
+    def push(self, key, value=None):
+        """ Додає елемент і повертає його дескриптор """
+
+    @abstractmethod
+    def peek(self):
+        """ Повертає (ключ, значення) з найменшим ключем, не видаляючи; IndexError для порожньої """
+
+    @abstractmethod
+    def pop(self):
+        """ Видаляє й повертає (ключ, значення) з найменшим ключем; IndexError для порожньої """
+
+    @abstractmethod
+    def decrease_key(self, item, key):
+        """
+        Зменшує ключ елемента за дескриптором; ValueError, якщо новий ключ
+        більший або елемента вже немає в купі (наприклад, його видалив pop).
+        """
+
+    @abstractmethod
+    def merge(self, other):
+        """ Переносить усі елементи купи other (того ж типу) у цю купу; other стає порожньою """
+
+    @abstractmethod
+    def tree(self):
+        """
+        Повертає форму купи як дерево.
+
+        Returns:
+        tuple: (мітки вузлів, індекси батьків; -1 - корінь). Батько завжди
+        має менший індекс, ніж його діти, порядок дітей - зліва направо.
+        """
+
+    @classmethod
+    def build(cls, keys, values=None, **options):
+        """
+        Будує купу з послідовності ключів (і, за потреби, значень).
+
+        Args:
+        keys (iterable): Ключі.
+        values (iterable): Значення у тому ж порядку; за замовчуванням None.
+        options: Параметри конструктора (наприклад, d для DaryHeap).
+
+        Returns:
+        Heap: Нова купа.
+        """
+        heap = cls(**options)
+        for key, value in zip(keys, itertools.repeat(None) if values is None else values):
+            heap.push(key, value)
+        return heap
+
+    def _check_merge(self, other):
+        if type(other) is not type(self):
+            raise TypeError(f"Неможливо злити {type(self).__name__} з {type(other).__name__}")
+
+    @staticmethod
+    def _check_decrease(item, key, present):
+        # Дескриптор видаленого елемента інакше змінив би купу, в якій його вже немає
+        if not present:
+            raise ValueError(f"Елемента {item!r} немає в купі")
+        if key > item.key:
+            raise ValueError(f"Новий ключ {key!r} більший за поточний {item.key!r}")
+
+
+class _BinaryItem(HeapItem):
+    __slots__ = ("entry", "owner")  # Актуальний запис у купі (None після видалення) і мітка купи
+
+
+class BinaryHeap(Heap):
+    """ Бінарна купа на heapq з лінивим decrease_key """
+    def __init__(self):
+        super().__init__()
+        self._heap = []  # Записи (ключ, порядковий номер, дескриптор)
+        self._owner = _Owner()
+
+    def push(self, key, value=None):
+        item = _BinaryItem(key, value)
+        item.owner = self._owner
+        item.entry = (key, next(_sequence), item)
+        heapq.heappush(self._heap, item.entry)
+        self._size += 1
+        return item
+
+    def _prune(self):
+        """ Знімає з вершини застарілі записи, що залишилися після decrease_key """
+        heap = self._heap
+        while heap and heap[0][2].entry is not heap[0]:
+            heapq.heappop(heap)
+        if not heap:
+            raise IndexError("Купа порожня")
+
+    def peek(self):
+        self._prune()
+        item = self._heap[0][2]
+        return item.key, item.value
+
+    def pop(self):
+        self._prune()
+        item = heapq.heappop(self._heap)[2]
+        item.entry = None
+        self._size -= 1
+        return item.key, item.value
+
+    def decrease_key(self, item, key):
+        # Живий дескриптор іншої купи інакше потрапив би в цю купу другим записом
+        self._check_decrease(item, key, item.entry is not None and _find(item.owner) is self._owner)
+        if key == item.key:
+            return
+        item.key = key
+        item.entry = (key, next(_sequence), item)
+        heapq.heappush(self._heap, item.entry)
+        # Якщо застарілих записів стало більше, ніж живих, перебудовуємо купу
+        if len(self._heap) > 2 * self._size + 16:
+            self._rebuild(self._heap)
+
+    def _rebuild(self, entries):
+        self._heap = [entry for entry in entries if entry[2].entry is entry]
+        heapq.heapify(self._heap)
+
+    def merge(self, other):
+        self._check_merge(other)
+        self._rebuild(self._heap + other._heap)
+        self._size += other._size
+        other._owner.parent = self._owner
+        other._heap, other._size, other._owner = [], 0, _Owner()
+        return self
+
+    def tree(self):
+        # Форма - сам масив heapq разом із застарілими записами, які в ньому лежать
+        labels = [entry[0] for entry in self._heap]
+        return labels, [(i - 1) // 2 for i in range(len(labels))]
+
+    @classmethod
+    def build(cls, keys, values=None):
+        heap = cls()
+        for key, value in zip(keys, itertools.repeat(None) if values is None else values):
+            item = _BinaryItem(key, value)
+            item.owner = heap._owner
+            item.entry = (key, next(_sequence), item)
+            heap._heap.append(item.entry)
+        heapq.heapify(heap._heap)  # O(n) замість n викликів heappush
+        heap._size = len(heap._heap)
+        return heap
+
+
+class _IndexedItem(HeapItem):
+    __slots__ = ("index",)  # Позиція в масиві купи (-1 після видалення)
+
+
+class DaryHeap(Heap):
+    """ d-арна мінімальна купа в масиві з позиціями елементів """
+    def __init__(self, d=4):
+        super().__init__()
+        if d < 2:
+            raise ValueError(f"Арність купи має бути не меншою за 2: {d}")
+        self.d = d
+        self._items = []
+
+    def __len__(self):
+        return len(self._items)
+
+    def _sift_up(self, pos):
+        items, d = self._items, self.d
+        item = items[pos]
+        while pos > 0:
+            parent = (pos - 1) // d
+            above = items[parent]
+            if not item.key < above.key:
+                break
+            items[pos] = above
+            above.index = pos
+            pos = parent
+        items[pos] = item
+        item.index = pos
+
+    def _sift_down(self, pos):
+        items, d = self._items, self.d
+        n = len(items)
+        item = items[pos]
+        while True:
+            first = d * pos + 1
+            if first >= n:
+                break
+            # Найменша з до d дітей
+            best = first
+            best_key = items[first].key
+            for child in range(first + 1, min(first + d, n)):
+                if items[child].key < best_key:
+                    best, best_key = child, items[child].key
+            if not best_key < item.key:
+                break
+            items[pos] = items[best]
+            items[pos].index = pos
+            pos = best
+        items[pos] = item
+        item.index = pos
+
+    def push(self, key, value=None):
+        item = _IndexedItem(key, value)
+        item.index = len(self._items)
+        self._items.append(item)
+        self._sift_up(item.index)
+        return item
+
+    def peek(self):
+        if not self._items:
+            raise IndexError("Купа порожня")
+        item = self._items[0]
+        return item.key, item.value
+
+    def pop(self):
+        if not self._items:
+            raise IndexError("Купа порожня")
+        top = self._items[0]
+        last = self._items.pop()
+        if self._items:
+            self._items[0] = last
+            self._sift_down(0)
+        top.index = -1
+        return top.key, top.value
+
+    def decrease_key(self, item, key):
+        items = self._items
+        self._check_decrease(item, key, 0 <= item.index < len(items) and items[item.index] is item)
+        item.key = key
+        self._sift_up(item.index)
+
+    def _heapify(self):
+        """ Перебудова знизу вгору (Флойд) за O(n) """
+        for i, item in enumerate(self._items):
+            item.index = i
+        for pos in reversed(range((len(self._items) - 2) // self.d + 1)):
+            self._sift_down(pos)
+
+    def merge(self, other):
+        self._check_merge(other)
+        self._items.extend(other._items)
+        other._items = []
+        self._heapify()
+        return self
+
+    def tree(self):
+        return [item.key for item in self._items], [(i - 1) // self.d for i in range(len(self._items))]
+
+    @classmethod
+    def build(cls, keys, values=None, d=4):
+        heap = cls(d)
+        heap._items = [_IndexedItem(key, value) for key, value in
+                       zip(keys, itertools.repeat(None) if values is None else values)]
+        heap._heapify()
+        return heap
+
+
+class _PairingNode(HeapItem):
+    # child - крайня ліва дитина, sibling - наступний брат,
+    # prev - батько для крайньої лівої дитини, інакше попередній брат; owner - мітка купи
+    __slots__ = ("child", "sibling", "prev", "owner")
+
+    def __init__(self, key, value=None, owner=None):
+        super().__init__(key, value)
+        self.child = self.sibling = self.prev = None
+        self.owner = owner
+
+
+def _link(a, b):
+    """ Зливає два окремі дерева купи з попарним злиттям: більший корінь стає першою дитиною """
+    if b.key < a.key:
+        a, b = b, a
+    b.prev = a
+    b.sibling = a.child
+    if a.child is not None:
+        a.child.prev = b
+    a.child = b
+    return a
+
+
+class PairingHeap(Heap):
+    """ Купа з попарним злиттям (pairing heap) """
+    def __init__(self):
+        super().__init__()
+        self._root = None
+        self._owner = _Owner()
+
+    def push(self, key, value=None):
+        node = _PairingNode(key, value, self._owner)
+        self._root = node if self._root is None else _link(self._root, node)
+        self._size += 1
+        return node
+
+    def peek(self):
+        if self._root is None:
+            raise IndexError("Купа порожня")
+        return self._root.key, self._root.value
+
+    def pop(self):
+        root = self._root
+        if root is None:
+            raise IndexError("Купа порожня")
+        # Перший прохід: зливаємо дітей попарно зліва направо
+        pairs = []
+        node = root.child
+        while node is not None:
+            second = node.sibling
+            following = second.sibling if second is not None else None
+            node.prev = node.sibling = None
+            if second is not None:
+                second.prev = second.sibling = None
+                node = _link(node, second)
+            pairs.append(node)
+            node = following
+        # Другий прохід: зливаємо результати справа наліво
+        merged = pairs.pop() if pairs else None
+        while pairs:
+            merged = _link(pairs.pop(), merged)
+        self._root = merged
+        self._size -= 1
+        root.child = None
+        return root.key, root.value
+
+    def decrease_key(self, item, key):
+        # Усі вузли купи, крім кореня, мають prev; pop від'єднує вузол повністю.
+        # Вузол іншої купи теж має prev, і його вирізання зіпсувало б обидві купи
+        self._check_decrease(item, key, (item is self._root or item.prev is not None)
+                             and _find(item.owner) is self._owner)
+        item.key = key
+        if item is self._root:
+            return
+        # Вирізаємо піддерево елемента і зливаємо його з коренем
+        if item.prev.child is item:
+            item.prev.child = item.sibling
+        else:
+            item.prev.sibling = item.sibling
+        if item.sibling is not None:
+            item.sibling.prev = item.prev
+        item.prev = item.sibling = None
+        self._root = _link(self._root, item)
+
+    def merge(self, other):
+        self._check_merge(other)
+        if other._root is not None:
+            self._root = other._root if self._root is None else _link(self._root, other._root)
+        self._size += other._size
+        other._owner.parent = self._owner  # Вузли other тепер належать цій купі, O(1)
+        other._root, other._size, other._owner = None, 0, _Owner()
+        return self
+
+    def tree(self):
+        labels, parents = [], []
+        stack = [(self._root, -1)] if self._root is not None else []
+        while stack:
+            node, parent = stack.pop()
+            index = len(labels)
+            labels.append(node.key)
+            parents.append(parent)
+            children = []
+            child = node.child
+            while child is not None:
+                children.append(child)
+                child = child.sibling
+            # У зворотному порядку, щоб діти опрацьовувалися зліва направо
+            stack.extend((child, index) for child in reversed(children))
+        return labels, parents
+
+
+class _RadixItem(HeapItem):
+    __slots__ = ("bucket", "index")  # Кошик і позиція в ньому (bucket = -1 після видалення)
+
+
+class RadixHeap(Heap):
+    """
+    Поразрядна купа для невід'ємних цілих ключів з монотонним видаленням.
+
+    Ключ k лежить у кошику з номером старшого біта, в якому k відрізняється
+    від останнього виданого мінімуму (0 - ключ дорівнює мінімуму). Кожен
+    елемент переміщується між кошиками лише вниз, тож pop амортизовано
+    коштує O(log C), де C - найбільший ключ. Ключі, менші за останній
+    виданий мінімум, не приймаються (ValueError).
+    """
+    def __init__(self):
+        super().__init__()
+        self._last = 0  # Останній виданий (або знайдений) мінімум
+        self._buckets = [[]]
+
+    def _check_key(self, key):
+        if not isinstance(key, int) or key < self._last:
+            raise ValueError(f"Ключ має бути цілим і не меншим за {self._last}: {key!r}")
+
+    def _insert(self, item):
+        bucket = (item.key ^ self._last).bit_length()
+        while len(self._buckets) <= bucket:
+            self._buckets.append([])
+        item.bucket = bucket
+        item.index = len(self._buckets[bucket])
+        self._buckets[bucket].append(item)
+
+    def _remove(self, item):
+        bucket = self._buckets[item.bucket]
+        last = bucket.pop()
+        if last is not item:
+            bucket[item.index] = last
+            last.index = item.index
+
+    def _settle(self):
+        """ Гарантує, що кошик 0 містить мінімум, перерозподіляючи перший непорожній кошик """
+        if not self._size:
+            raise IndexError("Купа порожня")
+        buckets = self._buckets
+        if buckets[0]:
+            return
+        first = next(i for i, bucket in enumerate(buckets) if bucket)
+        items, buckets[first] = buckets[first], []
+        self._last = min(item.key for item in items)
+        for item in items:
+            self._insert(item)  # Усі потрапляють у кошики з меншими номерами
+
+    def push(self, key, value=None):
+        self._check_key(key)
+        item = _RadixItem(key, value)
+        self._insert(item)
+        self._size += 1
+        return item
+
+    def peek(self):
+        self._settle()
+        item = self._buckets[0][-1]
+        return item.key, item.value
+
+    def pop(self):
+        self._settle()
+        item = self._buckets[0].pop()
+        item.bucket = -1
+        self._size -= 1
+        return item.key, item.value
+
+    def decrease_key(self, item, key):
+        buckets = self._buckets
+        self._check_decrease(item, key, 0 <= item.bucket < len(buckets)
+                             and item.index < len(buckets[item.bucket])
+                             and buckets[item.bucket][item.index] is item)
+        self._check_key(key)
+        self._remove(item)
+        item.key = key
+        self._insert(item)
+
+    def merge(self, other):
+        self._check_merge(other)
+        items = [item for bucket in other._buckets for item in bucket]
+        for item in items:
+            self._check_key(item.key)
+        for item in items:
+            self._insert(item)
+        self._size += other._size
+        other._last, other._buckets, other._size = 0, [[]], 0
+        return self
+
+    def tree(self):
+        # Корінь - останній мінімум, під ним непорожні кошики, у кошиках - ключі
+        labels, parents = [self._last], [-1]
+        for number, bucket in enumerate(self._buckets):
+            if bucket:
+                parent = len(labels)
+                labels.append(f"B{number}")
+                parents.append(0)
+                labels.extend(item.key for item in bucket)
+                parents.extend([parent] * len(bucket))
+        return labels, parents
+
+
+ENGINES = {
+    "binary": BinaryHeap,
+    "dary": DaryHeap,
+    "pairing": PairingHeap,
+    "radix": RadixHeap,
+}
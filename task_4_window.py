@@ -0,0 +1,286 @@
+"""
+Віконна візуалізація великих куп для завдання 4.
+
+Замість усього дерева малюється лише вікно: піддерево з коренем у вибраному
+індексі глибиною depth рівнів. Кожне піддерево нижче межі вікна згортається
+в один агрегований вузол з кількістю елементів і діапазоном min..max:
+- кількість обчислюється за межами індексів рівнів, O(log n);
+- мінімум - це сам корінь піддерева (властивість мінімальної купи), O(1);
+- максимум мінімальної купи лежить у листі, тобто на двох останніх рівнях
+  піддерева, і його пошук зачіпає O(n / 2 ** depth) елементів; тому він
+  вмикається явно (with_max=True) і шукається кількома векторизованими
+  проходами NumPy по суцільних діапазонах цих рівнів (для нечислових
+  значень, як-от кортежів (пріоритет, задача), - через max Python).
+  Без нього вартість кадру не залежить від розміру купи зовсім.
+
+Клік по вузлу робить його коренем вікна, клік по кореню піднімає вікно
+на рівень вище.
+
+Запуск інтерактивного режиму:
+    python task_4_window.py --size 1000000 --depth 4
+    python task_4_window.py --size 1000000 --depth 4 --max
+"""
+
+import argparse
+import heapq
+import random
+from collections import namedtuple
+
+import numpy as np
+
+from task_4 import heap_edges, heap_layout
+
+DEFAULT_DEPTH = 4  # Кількість рівнів вікна над агрегованими вузлами
+NODE_COLOR = "skyblue"
+AGGREGATE_COLOR = "lightgray"
+
+# Згорнуте піддерево: індекс кореня, кількість елементів, мінімум і максимум
+Aggregate = namedtuple("Aggregate", ["index", "count", "min", "max"])
+# Вікно купи: корінь, видимі індекси за відносним номером у вікні (або -1) і агрегати
+HeapWindow = namedtuple("HeapWindow", ["root", "depth", "nodes", "aggregates"])
+
+
+def level_range(index, level, n):
+    """
+    Повертає діапазон індексів [start, stop) рівня level піддерева з коренем index.
+
+    На відносній глибині d піддерево займає суцільний діапазон з 2 ** d
+    індексів, що починається з (index + 1) * 2 ** d - 1.
+    """
+    start = (index + 1) * (1 << level) - 1
+    return min(start, n), min(start + (1 << level), n)
+
+
+def subtree_size(index, n):
+    """ Кількість елементів у піддереві з коренем index купи розміру n, O(log n) """
+    count, level = 0, 0
+    while True:
+        start, stop = level_range(index, level, n)
+        if start >= stop:
+            return count
+        count += stop - start
+        level += 1
+
+
+def _block_max(values, block):
+    """
+    Максимуми послідовних блоків по block елементів (останній може бути неповним).
+
+    Числа без втрати точності обробляє NumPy у їхньому власному dtype;
+    кортежі, рядки чи цілі понад int64 порівнюються за правилами Python.
+    """
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        array = None  # Кортежі з вкладеними послідовностями різної довжини
+    if array is not None and array.ndim == 1 and array.dtype.kind in "biuf":
+        full = len(array) // block
+        maxima = array[:full * block].reshape(full, block).max(axis=1).tolist()
+        if full * block < len(array):
+            maxima.append(array[full * block:].max().item())
+        return maxima
+    return [max(values[i:i + block]) for i in range(0, len(values), block)]
+
+
+def _aggregate_max(heap, first, count, n):
+    """
+    Максимуми піддерев з коренями first..first + count - 1 (сусіди на одному рівні).
+
+    На відносній глибині d їхні рівні утворюють один суцільний діапазон, де
+    кожному піддереву належить блок з 2 ** d індексів, тож максимум двох
+    найглибших рівнів усіх піддерев береться одним reshape на рівень.
+    """
+    result = [None] * count
+    level = 0
+    while level_range(first, level, n)[0] < n:
+        level += 1
+    # level - перша відносна глибина, якої вже немає; листя - на двох попередніх
+    for depth in (level - 2, level - 1):
+        if depth < 0:
+            continue
+        block = 1 << depth
+        start = (first + 1) * block - 1
+        stop = min(start + count * block, n)
+        # Піддерева без вузлів на цій глибині стоять у кінці й блоків не мають
+        for k, value in enumerate(_block_max(heap[start:stop], block)):
+            if result[k] is None or result[k] < value:
+                result[k] = value
+    return result
+
+
+def heap_window(heap, root=0, depth=DEFAULT_DEPTH, with_max=False):
+    """
+    Обчислює вміст вікна купи.
+
+    Args:
+    heap (list): Мінімальна купа (список або масив NumPy).
+    root (int): Індекс кореня вікна.
+    depth (int): Кількість видимих рівнів (не менше 1).
+    with_max (bool): Чи обчислювати максимуми агрегатів (O(n / 2 ** depth)).
+
+    Returns:
+    HeapWindow: Видимі індекси за відносними номерами вузлів вікна (-1 - вузла
+    немає) і агреговані вузли під межею вікна.
+    """
+    n = len(heap)
+    if not 0 <= root < n:
+        raise IndexError(f"Індекс кореня поза купою: {root}")
+    if depth < 1:
+        raise ValueError(f"Вікно має містити хоча б один рівень: depth = {depth}")
+    nodes = np.full((1 << depth) - 1, -1, dtype=np.int64)
+    for level in range(depth):
+        start, stop = level_range(root, level, n)
+        offset = (1 << level) - 1  # Відносний номер першого вузла рівня у вікні
+        nodes[offset:offset + stop - start] = np.arange(start, stop)
+
+    first, last = level_range(root, depth, n)
+    aggregates = []
+    if first < last:
+        maxima = _aggregate_max(heap, first, last - first, n) if with_max else None
+        for k, index in enumerate(range(first, last)):
+            aggregates.append(Aggregate(index, subtree_size(index, n), heap[index],
+                                        maxima[k] if with_max else None))
+    return HeapWindow(root, depth, nodes, aggregates)
+
+
+def _format_value(value):
+    """ Компактний підпис значення: великі числа - з суфіксами k/M/G """
+    if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+        value = value.item() if isinstance(value, np.number) else value
+        for suffix, scale in (("G", 1e9), ("M", 1e6), ("k", 1e3)):
+            if abs(value) >= 10 * scale:
+                return f"{value / scale:.3g}{suffix}"
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+    return str(value)
+
+
+def draw_heap_window(heap, root=0, depth=DEFAULT_DEPTH, ax=None, with_max=False):
+    """
+    Малює вікно купи з агрегованими вузлами; вартість залежить лише від розміру вікна.
+
+    Args:
+    heap (list): Мінімальна купа.
+    root (int): Індекс кореня вікна.
+    depth (int): Кількість видимих рівнів.
+    ax (Axes): Осі matplotlib; якщо не задано, створюється нова фігура і викликається plt.show().
+    with_max (bool): Чи показувати максимуми агрегатів.
+
+    Returns:
+    tuple: (HeapWindow, масив координат вузлів вікна форми (m, 2), масив
+    абсолютних індексів для цих координат) - для вибору вузла кліком.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    show = ax is None
+    if show:
+        _, ax = plt.subplots(figsize=(12, 8))
+    window = heap_window(heap, root, depth, with_max)
+
+    # Вікно з агрегатами - повне дерево з depth + 1 рівнів у відносній нумерації
+    size = (1 << (depth + 1)) - 1
+    x, y = heap_layout(size)
+    relative = np.arange(size)
+    absolute = np.full(size, -1, dtype=np.int64)
+    absolute[:len(window.nodes)] = window.nodes
+    offset = (1 << depth) - 1
+    for k, aggregate in enumerate(window.aggregates):
+        absolute[offset + k] = aggregate.index
+    present = absolute >= 0
+
+    # Ребро малюється, якщо існує дитина (тоді існує і батько)
+    edges = heap_edges(x, y)[present[1:]]
+    ax.add_collection(LineCollection(edges, colors="gray", linewidths=0.8, zorder=1))
+    visible = present & (relative < offset)
+    # Розмір вузла - щоб найнижчий видимий рівень (2 ** (depth - 1) вузлів) не злипався
+    node_size = min(1500, 0.5 * (600 / (1 << (depth - 1))) ** 2)
+    ax.scatter(x[visible], y[visible], s=node_size, c=NODE_COLOR, zorder=2)
+
+    for j in np.flatnonzero(visible):
+        ax.text(x[j], y[j], _format_value(heap[absolute[j]]), ha="center", va="center",
+                fontsize=9 if depth <= 4 else 7, zorder=3)
+    for k, aggregate in enumerate(window.aggregates):
+        j = offset + k
+        lines = [f"n={_format_value(aggregate.count)}", _format_value(aggregate.min)]
+        if aggregate.max is not None:
+            lines.append(_format_value(aggregate.max))
+        # Агрегат - підпис у рамці: кількість, мінімум і максимум піддерева
+        ax.text(x[j], y[j], "\n".join(lines), ha="center", va="top", fontsize=6, zorder=3,
+                bbox=dict(boxstyle="round", fc=AGGREGATE_COLOR, ec="gray"))
+
+    ax.set_xlim(-1.05, 1.05)
+    ax.set_ylim(-depth - 0.6, 0.6)
+    ax.set_axis_off()
+    ax.set_title(f"Купа з {len(heap)} елементів: піддерево з коренем {root}")
+    if show:
+        plt.show()
+    return window, np.column_stack([x[present], y[present]]), absolute[present]
+
+
+def interactive_window(heap, root=0, depth=DEFAULT_DEPTH, with_max=False):
+    """
+    Відкриває вікно matplotlib з навігацією по купі.
+
+    Клік по вузлу або агрегату робить його коренем вікна, клік по кореню -
+    переходить до батька.
+
+    Args:
+    heap (list): Мінімальна купа.
+    root (int): Початковий корінь вікна.
+    depth (int): Кількість видимих рівнів.
+    with_max (bool): Чи показувати максимуми агрегатів.
+    """
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(12, 8))
+    state = {"root": root}
+
+    def redraw():
+        ax.clear()
+        _, state["xy"], state["indices"] = draw_heap_window(
+            heap, state["root"], depth, ax, with_max)
+        fig.canvas.draw_idle()
+
+    def on_click(event):
+        if event.inaxes is not ax or event.xdata is None:
+            return
+        # Найближчий вузол вікна в пікселях
+        points = ax.transData.transform(state["xy"])
+        distance = np.hypot(points[:, 0] - event.x, points[:, 1] - event.y)
+        nearest = int(np.argmin(distance))
+        if distance[nearest] > 30:
+            return
+        index = int(state["indices"][nearest])
+        if index == state["root"]:
+            index = (index - 1) // 2 if index > 0 else 0
+        if index != state["root"]:
+            state["root"] = index
+            redraw()
+
+    fig.canvas.mpl_connect("button_press_event", on_click)
+    redraw()
+    plt.show()
+
+
+def main():
+    """
+    Генерує випадкову купу й відкриває її інтерактивне вікно.
+    """
+    parser = argparse.ArgumentParser(description="Віконна візуалізація великої купи")
+    parser.add_argument("--size", type=int, default=1_000_000, help="кількість елементів купи")
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH, help="кількість видимих рівнів")
+    parser.add_argument("--max", action="store_true",
+                        help="показувати максимуми агрегатів (вартість росте з розміром купи)")
+    args = parser.parse_args()
+    if args.depth < 1:
+        parser.error("--depth має бути не меншим за 1")
+
+    rng = random.Random(0)
+    heap = [rng.randrange(10 * args.size) for _ in range(args.size)]
+    heapq.heapify(heap)
+    interactive_window(heap, depth=args.depth, with_max=args.max)
+
+
+if __name__ == "__main__":
+    main()